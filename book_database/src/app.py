@@ -1,6 +1,9 @@
 import sys
 import os
 import json
+import uuid
+import threading
+from collections import Counter, OrderedDict
 
 # This set of lines are needed to import the gRPC stubs.
 # The path of the stubs is relative to the current file, or absolute inside the container.
@@ -8,15 +11,28 @@ import json
 FILE = __file__ if '__file__' in globals() else os.getenv("PYTHONFILE", "")
 utils_path = os.path.abspath(os.path.join(FILE, '../../../utils/pb'))
 sys.path.insert(0, utils_path)
+shared_path = os.path.abspath(os.path.join(FILE, '../../../utils'))
+sys.path.insert(0, shared_path)
+from shared.channels import get_stub
+from shared.server import create_server
 from book_database import book_database_pb2 as book_database
 from book_database import book_database_pb2_grpc as book_database_grpc
 
-from concurrent import futures
 import grpc
+from book_locks import BookLocks, BOOK_LOCK_MAX_WAIT_MS
+from stock_reservations import StockReservations, STOCK_RESERVATION_TTL_MS
 
 bd_node_id = int(os.getenv('DB_NODE_ID', '0'))
 print(f"My Book Database ID is: {bd_node_id}")
 total_nodes = int(os.getenv('TOTAL_REPLICAS', '3'))
+# How many committed orders the head remembers, to recognise the decisions a recovering coordinator sends again.
+COMMITTED_ORDERS_KEPT = int(os.getenv('COMMITTED_ORDERS_KEPT', '10000'))
+
+def order_quantities(items):
+    quantities = Counter()
+    for item in items:
+        quantities[item.bookId] += item.quantity
+    return quantities
 
 class BookDatabaseService(book_database_grpc.BookDatabaseServiceServicer):
     def __init__(self):
@@ -26,70 +42,86 @@ class BookDatabaseService(book_database_grpc.BookDatabaseServiceServicer):
             book_list_json = json.load(f)
             for _, value in book_list_json.items():
                 book = book_database.Book(**value)
+                book.version = book.version or 1
                 self.books[book.id] = book
                 self.title_to_book[book.title] = book
+        # Per-book locks held by every change of a book at the head, where the writes and the reservations start.
+        self.book_locks = BookLocks()
+        # Ids of the latest COMMITTED_ORDERS_KEPT orders whose stock the head has taken, as keys.
+        # A coordinator that recovers sends its decisions again, an order redelivered by the queue runs its 2PC again,
+        # and these orders must not take or reserve their stock twice.
+        self.committed_orders = OrderedDict()
+        self.committed_orders_lock = threading.Lock()
+        # Stock reserved by the votes of the orders waiting for their decision. Only the head's are used.
+        self.reservations = StockReservations()
 
     def AddBook(self, request, context):
-        with grpc.insecure_channel("book_database_1:50056") as channel:
-            stub = book_database_grpc.BookDatabaseServiceStub(channel)
-            response = stub.Head2Tail(request)
+        stub = get_stub("book_database_1:50056", book_database_grpc.BookDatabaseServiceStub)
+        response = stub.Head2Tail(request)
         return response
     
-    def UpdateBook(self, request, context):
-        if request.commitStatus: 
-            print("Phase 2b - GLOBAL COMMIT received from coordinator")
-            with grpc.insecure_channel("book_database_1:50056") as channel:
-                stub = book_database_grpc.BookDatabaseServiceStub(channel)
-                response = stub.Head2Tail(request.book)
-            return response
-        else:
-            print("Phase 2b - GLOBAL ABORT received from cordinator")
-            print("Nothing executed in database")
-            return False
-
-    def GetBook(self, request, context):
-        if request.commitStatus: 
-            print("Phase 2b - Database Service: GLOBAL COMMIT received from coordinator")
-            if bd_node_id == 3:
-                print(f'[Node id {bd_node_id}]: Get book data {self.books[request.request_id]}')
-                return self.books[request.request_id]
-            else:
-                print(f'[Node id {bd_node_id}] Redirect to the Tail server (current node id {bd_node_id}).')
-                with grpc.insecure_channel("book_database_3:50056") as channel:
-                    stub = book_database_grpc.BookDatabaseServiceStub(channel)
-                    response = stub.GetBook(request)
-                return response
-        else:
-            print("Phase 2b - Database Service: GLOBAL ABORT received from cordinator")
-            print("Nothing executed in database")
-            return False
-        
     def GetBookFromTitle(self, request, context):
         if bd_node_id == 3:
             print(f'[Node id {bd_node_id}]: Get book data {self.title_to_book[request.title]}')
             return self.title_to_book[request.title]
         else:
             print(f'[Node id {bd_node_id}] Redirect to the Tail server (current node id {bd_node_id}).')
-            with grpc.insecure_channel("book_database_3:50056") as channel:
-                stub = book_database_grpc.BookDatabaseServiceStub(channel)
-                response = stub.GetBookFromTitle(request)
+            stub = get_stub("book_database_3:50056", book_database_grpc.BookDatabaseServiceStub)
+            response = stub.GetBookFromTitle(request)
+            return response
+
+    # Look up all the titles of an order at once. Unknown titles are reported back instead of failing the whole request.
+    def GetBooksFromTitles(self, request, context):
+        if bd_node_id == 3:
+            books = []
+            missing_titles = []
+            for title in request.titles:
+                book = self.title_to_book.get(title)
+                if book is None:
+                    missing_titles.append(title)
+                else:
+                    books.append(book)
+            print(f'[Node id {bd_node_id}]: Get {len(books)} books data, {len(missing_titles)} titles not found')
+            return book_database.GetBooksFromTitlesResponse(books=books, missingTitles=missing_titles)
+        else:
+            print(f'[Node id {bd_node_id}] Redirect to the Tail server (current node id {bd_node_id}).')
+            stub = get_stub("book_database_3:50056", book_database_grpc.BookDatabaseServiceStub)
+            response = stub.GetBooksFromTitles(request)
             return response
         
+    def next_version(self, book_id):
+        book = self.books.get(book_id)
+        return (book.version if book is not None else 0) + 1
+
     def Head2Tail(self, request, context):
+        if bd_node_id != 1:
+            return self.write_book(request)
+        # A book written at the head, e.g. by AddBook, holds its lock like the stock changes do.
+        owner = f'head2tail/{uuid.uuid4()}'
+        if not self.book_locks.acquire(owner, [request.id], wait_ms=BOOK_LOCK_MAX_WAIT_MS):
+            print(f"[Node id {bd_node_id}]: Book {request.id} is locked, not updating it")
+            return book_database.Head2TailResponse(success=False)
+        try:
+            request.version = self.next_version(request.id)
+            return self.write_book(request)
+        finally:
+            self.book_locks.release(owner, [request.id])
+
+    def write_book(self, request):
+        # Write the book on this node and the nodes after it in the chain.
         if bd_node_id < total_nodes:
             next_bd_node_id = bd_node_id + 1
             print(f'[Head To Tail]: node id {bd_node_id} to node id {next_bd_node_id}')
             next_bd_node_address = f'book_database_{next_bd_node_id}:50056'
             try:
-                with grpc.insecure_channel(next_bd_node_address) as channel:
-                    stub = book_database_grpc.BookDatabaseServiceStub(channel)
-                    response = stub.Head2Tail(request)
-                    if response.success:
-                        print(f'[Tail To Head]: node id {bd_node_id} got the result. Success.')
-                        self.books[request.id] = request # Override the book information
-                        print(f"[Node id {bd_node_id}]: Updating the book info")
-                        print(f"[Node id {bd_node_id}]: Updated the book database {self.books[request.id]}")
-                    return response
+                stub = get_stub(next_bd_node_address, book_database_grpc.BookDatabaseServiceStub)
+                response = stub.Head2Tail(request)
+                if response.success:
+                    print(f'[Tail To Head]: node id {bd_node_id} got the result. Success.')
+                    self.books[request.id] = request # Override the book information
+                    print(f"[Node id {bd_node_id}]: Updating the book info")
+                    print(f"[Node id {bd_node_id}]: Updated the book database {self.books[request.id]}")
+                return response
             except grpc.RpcError as e:
                     print(f"Could not reach Update-commitment-{next_bd_node_id}: Inactive Service")
         elif bd_node_id == total_nodes: # if it reaches the Tail
@@ -105,9 +137,202 @@ class BookDatabaseService(book_database_grpc.BookDatabaseServiceServicer):
         print("Phase 1b - Database Service: Vote request received. Sending VOTE COMMIT to order executor\n")
         return book_database.VoteCommitResponse(success=True)
 
+    def copies_available(self, book_id):
+        book = self.books.get(book_id)
+        return book.copiesAvailable if book is not None else None
+
+    def allocate_stock(self, orders):
+        """
+        Take the stock of the orders in turn. An order gets its stock if what the reservations of the other orders
+        leave covers it, which is always the case for the stock it reserved itself. An order that gets nothing
+        doesn't stop the orders after it.
+        Returns ({orderId: whether it got its stock}, {bookId: Book with the remaining stock}).
+        """
+        allocated = {}
+        changed_books = {}
+        reserved, own = self.reservations.snapshot([order.orderId for order in orders])
+        for order in orders:
+            quantities = order_quantities(order.items)
+            others = reserved - own.get(order.orderId, Counter())
+            available = all(
+                book_id in self.books and changed_books.get(book_id, self.books[book_id]).copiesAvailable - others[book_id] >= quantity
+                for book_id, quantity in quantities.items()
+            )
+            allocated[order.orderId] = available
+            if not available:
+                continue
+            reserved = others
+            for book_id, quantity in quantities.items():
+                if book_id not in changed_books:
+                    changed_books[book_id] = book_database.Book()
+                    changed_books[book_id].CopyFrom(self.books[book_id])
+                    changed_books[book_id].version += 1
+                changed_books[book_id].copiesAvailable -= quantity
+        return allocated, changed_books
+
+    def commit_stock(self, orders, context):
+        # Every book of the orders is locked, then the new stock goes down the chain in one request.
+        # Returns {orderId: whether it got its stock}.
+        owner = f'stock-batch/{uuid.uuid4()}'
+        book_ids = sorted({item.bookId for order in orders for item in order.items})
+        if not self.book_locks.acquire(owner, book_ids, wait_ms=BOOK_LOCK_MAX_WAIT_MS):
+            return {order.orderId: False for order in orders}
+        try:
+            # The orders committed before succeed without taking stock again. They share the locked books,
+            # so none is committed meanwhile. A reservation made by a repeated vote is released.
+            results = {order.orderId: True for order in orders if order.orderId in self.committed_orders}
+            self.reservations.release(results)
+            allocated, changed_books = self.allocate_stock([order for order in orders if order.orderId not in results])
+            if changed_books and not self.Head2TailBatch(book_database.BookList(books=changed_books.values()), context).success:
+                allocated = dict.fromkeys(allocated, False)
+            else:
+                # The stock is taken from the books now, the reservations are not needed anymore.
+                committed = [order_id for order_id, success in allocated.items() if success]
+                self.reservations.release(committed)
+                self.remember_commits(committed)
+            results.update(allocated)
+        finally:
+            self.book_locks.release(owner, book_ids)
+        print(f"Phase 2b - Database Service: GLOBAL COMMIT received for {len(allocated)} orders, {sum(allocated.values())} committed")
+        return results
+
+    def reserve_stock(self, orders, ttl_ms=STOCK_RESERVATION_TTL_MS):
+        # Reserve the stock of the orders ([(orderId, {bookId: quantity})]) in turn, holding the locks of their books
+        # like the stock changes do. Returns {orderId: whether its stock is reserved}.
+        owner = f'reserve/{uuid.uuid4()}'
+        book_ids = sorted({book_id for _, quantities in orders for book_id in quantities})
+        if not self.book_locks.acquire(owner, book_ids, wait_ms=BOOK_LOCK_MAX_WAIT_MS):
+            return {order_id: False for order_id, _ in orders}
+        try:
+            return {order_id: self.reservations.reserve(order_id, quantities, self.copies_available, ttl_ms)
+                    for order_id, quantities in orders}
+        finally:
+            self.book_locks.release(owner, book_ids)
+
+    def VoteStockBatch(self, request, context):
+        if bd_node_id != 1:
+            stub = get_stub("book_database_1:50056", book_database_grpc.BookDatabaseServiceStub)
+            return stub.VoteStockBatch(request)
+        # An order committed before votes commit without reserving, its stock is already taken.
+        votes = {order.orderId: True for order in request.orders if order.orderId in self.committed_orders}
+        votes.update(self.reserve_stock([(order.orderId, order_quantities(order.items))
+                                          for order in request.orders if order.orderId not in votes]))
+        print(f"Phase 1b - Database Service: Vote request received for {len(votes)} orders, {sum(votes.values())} reserved")
+        return book_database.BatchVoteResponse(votes=[
+            book_database.OrderVote(orderId=order.orderId, commit=votes[order.orderId]) for order in request.orders
+        ])
+
+    def CommitStockBatch(self, request, context):
+        # An order whose reservation expired is checked against the stock again.
+        if bd_node_id != 1:
+            stub = get_stub("book_database_1:50056", book_database_grpc.BookDatabaseServiceStub)
+            return stub.CommitStockBatch(request)
+        results = self.commit_stock(request.orders, context)
+        return book_database.BatchExecutionResponse(results=[
+            book_database.OrderResult(orderId=order.orderId, success=results[order.orderId]) for order in request.orders
+        ])
+
+    def AbortStockBatch(self, request, context):
+        if bd_node_id != 1:
+            stub = get_stub("book_database_1:50056", book_database_grpc.BookDatabaseServiceStub)
+            return stub.AbortStockBatch(request)
+        print(f"Phase 2b - Database Service: GLOBAL ABORT received for {len(request.orders)} orders")
+        return book_database.BatchExecutionResponse(results=[
+            book_database.OrderResult(orderId=order.orderId, success=self.reservations.release([order.orderId]) > 0)
+            for order in request.orders
+        ])
+
+    def Prepare(self, request, context):
+        if bd_node_id != 1:
+            stub = get_stub("book_database_1:50056", book_database_grpc.BookDatabaseServiceStub)
+            return stub.Prepare(request)
+        # An order committed before votes commit without reserving, its stock is already taken.
+        commit = request.orderId in self.committed_orders or self.reserve_stock(
+            [(request.orderId, order_quantities(request.items))], request.ttlMs or STOCK_RESERVATION_TTL_MS
+        )[request.orderId]
+        print(f"Phase 1b - Database Service: Prepare of order {request.orderId}. Sending VOTE {'COMMIT' if commit else 'ABORT'} to order executor\n")
+        return book_database.PrepareResponse(commit=commit)
+
+    def Commit(self, request, context):
+        if bd_node_id != 1:
+            stub = get_stub("book_database_1:50056", book_database_grpc.BookDatabaseServiceStub)
+            return stub.Commit(request)
+        # Like CommitStockBatch, an order whose reservation expired is checked against the stock again.
+        items = request.items
+        if not items:
+            # A coordinator that doesn't send the items commits what the order reserved.
+            quantities = self.reservations.get(request.orderId)
+            if quantities is None and request.orderId not in self.committed_orders:
+                print(f"Phase 2b - Database Service: GLOBAL COMMIT of order {request.orderId} without its items nor a reservation")
+                return book_database.DecisionResponse(success=False)
+            items = [book_database.StockItem(bookId=book_id, quantity=quantity) for book_id, quantity in (quantities or {}).items()]
+        order = book_database.OrderStock(orderId=request.orderId, items=items)
+        return book_database.DecisionResponse(success=self.commit_stock([order], context)[request.orderId])
+
+    def Abort(self, request, context):
+        if bd_node_id != 1:
+            stub = get_stub("book_database_1:50056", book_database_grpc.BookDatabaseServiceStub)
+            return stub.Abort(request)
+        print(f"Phase 2b - Database Service: GLOBAL ABORT of order {request.orderId} received from coordinator")
+        return book_database.DecisionResponse(success=self.reservations.release([request.orderId]) > 0)
+
+    def DecrementStock(self, request, context):
+        # The count is checked and written at the head under the book's lock, and the chain is updated before
+        # the lock is released, so concurrent decrements never work on the same count.
+        if bd_node_id != 1:
+            stub = get_stub("book_database_1:50056", book_database_grpc.BookDatabaseServiceStub)
+            return stub.DecrementStock(request)
+        book = self.books.get(request.bookId)
+        if book is None:
+            print(f"[Node id {bd_node_id}]: DecrementStock of unknown book {request.bookId}")
+            return book_database.DecrementStockResponse(success=False)
+        owner = f'decrement/{uuid.uuid4()}'
+        if not self.book_locks.acquire(owner, [request.bookId], wait_ms=BOOK_LOCK_MAX_WAIT_MS):
+            return book_database.DecrementStockResponse(success=False, copiesAvailable=book.copiesAvailable, version=book.version)
+        try:
+            book = self.books[request.bookId]
+            available = book.copiesAvailable - self.reservations.reserved_quantities()[request.bookId]
+            if request.quantity <= 0 or available < request.quantity or request.expectedVersion not in (0, book.version):
+                print(f"[Node id {bd_node_id}]: DecrementStock of {request.quantity} copies of book {request.bookId} rejected, "
+                      f"{available} available at version {book.version}, expected version {request.expectedVersion}")
+                return book_database.DecrementStockResponse(success=False, copiesAvailable=book.copiesAvailable, version=book.version)
+            changed_book = book_database.Book()
+            changed_book.CopyFrom(book)
+            changed_book.copiesAvailable -= request.quantity
+            changed_book.version += 1
+            if not self.Head2TailBatch(book_database.BookList(books=[changed_book]), context).success:
+                return book_database.DecrementStockResponse(success=False, copiesAvailable=book.copiesAvailable, version=book.version)
+        finally:
+            self.book_locks.release(owner, [request.bookId])
+        return book_database.DecrementStockResponse(success=True, copiesAvailable=changed_book.copiesAvailable, version=changed_book.version)
+
+    def remember_commits(self, order_ids):
+        with self.committed_orders_lock:
+            self.committed_orders.update(dict.fromkeys(order_ids, True))
+            while len(self.committed_orders) > COMMITTED_ORDERS_KEPT:
+                self.committed_orders.popitem(last=False)
+
+    def Head2TailBatch(self, request, context):
+        # Head2Tail for several books at once.
+        if bd_node_id < total_nodes:
+            next_bd_node_address = f'book_database_{bd_node_id + 1}:50056'
+            try:
+                stub = get_stub(next_bd_node_address, book_database_grpc.BookDatabaseServiceStub)
+                response = stub.Head2TailBatch(request)
+            except grpc.RpcError:
+                print(f"Could not reach Update-commitment-{bd_node_id + 1}: Inactive Service")
+                return book_database.Head2TailResponse(success=False)
+            if not response.success:
+                return response
+        for book in request.books:
+            self.books[book.id] = book
+            self.title_to_book[book.title] = book
+        print(f"[Node id {bd_node_id}]: Updated {len(request.books)} books of the book database")
+        return book_database.Head2TailResponse(success=True)
+
 
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = create_server(default_workers=10)
     service = BookDatabaseService()
     book_database_grpc.add_BookDatabaseServiceServicer_to_server(service, server)
     server.add_insecure_port('[::]:50056')
@@ -0,0 +1,54 @@
+import os
+import time
+import threading
+
+# Default lease of a book lock, so a crashed executor doesn't keep a book locked.
+BOOK_LOCK_LEASE_MS = int(os.getenv('BOOK_LOCK_LEASE_MS', '30000'))
+# Upper bound of the wait of an owner for a lock, since a waiting call holds a server thread.
+BOOK_LOCK_MAX_WAIT_MS = int(os.getenv('BOOK_LOCK_MAX_WAIT_MS', '30000'))
+
+
+class BookLocks:
+    """
+    Lease-based locks on the stock of single books. An owner locks all the books it asks for at once or
+    waits, so two owners never hold one book each of what the other needs.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.condition = threading.Condition()
+        # bookId: (owner, lease deadline)
+        self.owners = {}
+
+    def _held_by_other(self, owner, book_id, now):
+        lock = self.owners.get(book_id)
+        return lock is not None and lock[0] != owner and lock[1] > now
+
+    def acquire(self, owner, book_ids, lease_ms=BOOK_LOCK_LEASE_MS, wait_ms=0):
+        deadline = self.clock() + min(wait_ms, BOOK_LOCK_MAX_WAIT_MS) / 1000
+        with self.condition:
+            while True:
+                now = self.clock()
+                if not any(self._held_by_other(owner, book_id, now) for book_id in book_ids):
+                    break
+                if now >= deadline:
+                    return False
+                # Wake up at the latest when a lease expires or the wait ends.
+                expiry = min(self.owners[book_id][1] for book_id in book_ids if self._held_by_other(owner, book_id, now))
+                self.condition.wait(min(deadline, expiry) - now)
+            for book_id in book_ids:
+                self.owners[book_id] = (owner, now + lease_ms / 1000)
+            return True
+
+    def release(self, owner, book_ids):
+        # Returns whether the owner held every one of the books.
+        released = True
+        with self.condition:
+            for book_id in book_ids:
+                lock = self.owners.get(book_id)
+                if lock is not None and lock[0] == owner:
+                    del self.owners[book_id]
+                else:
+                    released = False
+            self.condition.notify_all()
+        return released
@@ -0,0 +1,95 @@
+import os
+import time
+import heapq
+import threading
+from collections import Counter
+
+# How long the vote of an order keeps its stock reserved when the decision doesn't arrive.
+STOCK_RESERVATION_TTL_MS = int(os.getenv('STOCK_RESERVATION_TTL_MS', '120000'))
+
+
+class StockReservations:
+    """
+    Stock set aside by the 2PC votes of the orders at the head, until their decision arrives or the reservation
+    expires. An order is voted commit only if the stock that the other reservations leave covers all of it,
+    so a committed order finds its stock. The head reserves under the book locks its stock changes hold,
+    so no stock change runs between the check of an order and its reservation.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.lock = threading.Lock()
+        # orderId: (Counter of bookId: quantity, deadline)
+        self.orders = {}
+        # bookId: quantity reserved by all the orders
+        self.reserved = Counter()
+        # (deadline, orderId). A deadline that doesn't match self.orders anymore is skipped.
+        self._deadlines = []
+
+    def _expire(self, now):
+        # Called with the lock held.
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, order_id = heapq.heappop(self._deadlines)
+            reservation = self.orders.get(order_id)
+            if reservation is not None and reservation[1] == deadline:
+                print(f"Stock reservation of order {order_id} expired.")
+                self._remove(order_id)
+
+    def _remove(self, order_id):
+        quantities, _ = self.orders.pop(order_id)
+        self.reserved -= quantities
+
+    def reserve(self, order_id, quantities, copies_available, ttl_ms=STOCK_RESERVATION_TTL_MS):
+        """
+        Reserve all the quantities ({bookId: quantity}) of an order or nothing.
+        copies_available(bookId) is the stock of a book, or None if the book doesn't exist.
+        Reserving an order again only extends its reservation.
+        """
+        with self.lock:
+            now = self.clock()
+            self._expire(now)
+            if order_id not in self.orders:
+                for book_id, quantity in quantities.items():
+                    available = copies_available(book_id)
+                    if available is None or available - self.reserved[book_id] < quantity:
+                        return False
+                self.reserved += quantities
+            else:
+                quantities = self.orders[order_id][0]
+            deadline = now + ttl_ms / 1000
+            self.orders[order_id] = (Counter(quantities), deadline)
+            heapq.heappush(self._deadlines, (deadline, order_id))
+            return True
+
+    def get(self, order_id):
+        # The reserved quantities of an order, or None if it has no reservation (anymore).
+        with self.lock:
+            self._expire(self.clock())
+            reservation = self.orders.get(order_id)
+            return Counter(reservation[0]) if reservation is not None else None
+
+    def snapshot(self, order_ids):
+        # (quantity reserved per book, {orderId: its reserved quantities}) at one instant, so a reservation that
+        # expires meanwhile is either in both or in neither.
+        with self.lock:
+            self._expire(self.clock())
+            own = {order_id: Counter(self.orders[order_id][0]) for order_id in order_ids if order_id in self.orders}
+            return Counter(self.reserved), own
+
+    def reserved_quantities(self):
+        with self.lock:
+            self._expire(self.clock())
+            return Counter(self.reserved)
+
+    def release(self, order_ids):
+        # Returns how many of the orders had a reservation.
+        released = 0
+        with self.lock:
+            for order_id in order_ids:
+                if order_id in self.orders:
+                    self._remove(order_id)
+                    released += 1
+        return released
+
+    def __len__(self):
+        return len(self.orders)
@@ -1,14 +1,31 @@
 import sys
 import os
-from datetime import datetime
 from google.protobuf.json_format import MessageToDict
 
+from opentelemetry import metrics
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+from opentelemetry.sdk.resources import Resource
+
+metrics.set_meter_provider(MeterProvider(resource=Resource.create({"service.name": "fraud_detection"})))
+meter = metrics.get_meter(__name__)
+metric_exporter = OTLPMetricExporter(endpoint="http://observability:4318/v1/metrics")
+
 # This set of lines are needed to import the gRPC stubs.
 # The path of the stubs is relative to the current file, or absolute inside the container.
 # Change these lines only if strictly needed.
 FILE = __file__ if '__file__' in globals() else os.getenv("PYTHONFILE", "")
 utils_path = os.path.abspath(os.path.join(FILE, '../../../utils/pb'))
 sys.path.insert(0, utils_path)
+shared_path = os.path.abspath(os.path.join(FILE, '../../../utils'))
+sys.path.insert(0, shared_path)
+from shared.channels import get_stub
+from shared.executor import default_executor, executor_stats
+from shared.server import create_server, serve_processes
+from shared.order_state import OrderStateTable
+from shared.vector_clock import VectorClock
+from shared.causal_order import CHECKOUT_GRAPH, FRAUD_DETECTION, NUM_SERVERS
+from shared.order_context import order_metadata, get_order_state, check_vc_before
 from fraud_detection import fraud_detection_pb2 as fraud_detection
 from fraud_detection import fraud_detection_pb2_grpc as fraud_detection_grpc
 from transaction_verification import transaction_verification_pb2 as transaction_verification
@@ -16,50 +33,45 @@ from transaction_verification import transaction_verification_pb2_grpc as transa
 from book_suggestion import book_suggestion_pb2 as book_suggestion
 from book_suggestion import book_suggestion_pb2_grpc as book_suggestion_grpc
 
-import grpc
-from concurrent import futures
+import threading
+
+def get_executor_stats(options):
+    stats = executor_stats()
+    return [
+        metrics.Observation(stats["queueDepth"], {"kind": "queue_depth"}),
+        metrics.Observation(stats["activeWorkers"], {"kind": "active_workers"}),
+        metrics.Observation(stats["utilization"], {"kind": "utilization"}),
+    ]
+
+executor_gauge = meter.create_observable_gauge("executor", callbacks=[get_executor_stats], description="Queue depth and worker utilisation of the server executor")
 
 # Set the server index for the vector clock.
-# Frontend: 0, Orchestrator: 1, TransactionVerification: 2, FraudDetection: 3, BookSuggestion: 4
-SERVER_INDEX = 3
-NUM_SERVERS = 5
-LOCAL_VC_CORRECT_AFTER_USERDATA_VERIFICATION = [0, 0, 0, 0, 0]
-VC_CORRECT_AFTER_USERDATA_VERIFICATION = [0, 1, 2, 0, 0]
-LOCAL_VC_CORRECT_AFTER_CREDITCARD_VERIFICATION = [0, 0, 0, 1, 0]
-VC_CORRECT_AFTER_CREDITCARD_VERIFICATION = [0, 1, 3, 1, 0]
+# The events of this service and the ones they depend on are declared in CHECKOUT_GRAPH.
+SERVER_INDEX = FRAUD_DETECTION
 
-# Create the global local vector clock.
-local_vector_clock = {}
+# Per-order state keyed by the order id from the orchestrator.
+# It holds the events of each order completed in this service, so concurrent checkouts don't overwrite each other.
+order_states = OrderStateTable()
 
-# Transaction flow check by order id.
-order_id_from_orchestrator = ""
+def new_order_state():
+    # The local vector clock and the lock are used by the events run one at a time (EventService),
+    # where the events of an order may reach this service concurrently.
+    return {"completedEvents": set(), "localVectorClock": VectorClock(NUM_SERVERS), "lock": threading.Lock()}
 
 def cardinfo_verification_service(data, vector_clock):
-    with grpc.insecure_channel('transaction_verification:50052') as channel:
-        stub = transaction_verification_grpc.CardinfoVerificationServiceStub(channel)
-        attr = MessageToDict(data)
-        attr["vectorClock"] = vector_clock
-        response = stub.VerifyCardinfo(transaction_verification.CardinfoVerificationRequest(**attr))
-        return response
+    stub = get_stub('transaction_verification:50052', transaction_verification_grpc.CardinfoVerificationServiceStub)
+    request = transaction_verification.CardinfoVerificationRequest.FromString(data.SerializeToString())
+    vector_clock.copy_to(request.vectorClock)
+    response = stub.VerifyCardinfo(request, metadata=order_metadata(data.orderId))
+    return response
     
 def book_suggestion_service(data, vector_clock):
-    with grpc.insecure_channel('book_suggestion:50053') as channel:
-        stub = book_suggestion_grpc.BookSuggestionServiceStub(channel)
-        attr = MessageToDict(data)
-        attr["vectorClock"] = vector_clock
-        response = stub.SuggestBook(book_suggestion.BookSuggestionRequest(**attr))
-        return response
+    stub = get_stub('book_suggestion:50053', book_suggestion_grpc.BookSuggestionServiceStub)
+    request = book_suggestion.BookSuggestionRequest.FromString(data.SerializeToString())
+    vector_clock.copy_to(request.vectorClock)
+    response = stub.SuggestBook(request, metadata=order_metadata(data.orderId))
+    return response
     
-# Increment the value in the server index, and update the timestamp.
-# If the index isn't in the vc_array, append 0 until the index.
-def increment_vector_clock(vector_clock):
-    vc_array = [0 for _ in range(NUM_SERVERS)] if not "vcArray" in vector_clock else vector_clock["vcArray"]
-    timestamp = datetime.now().timestamp()
-
-    vc_array[SERVER_INDEX] += 1
-
-    return {"vcArray": vc_array, "timestamp": timestamp}
-
 
 # Create a class to define the server functions, derived from
 # fraud_detection_pb2_grpc.HelloServiceServicer
@@ -75,36 +87,30 @@ class HelloService(fraud_detection_grpc.HelloServiceServicer):
         # Return the response object
         return response
     
-class OrderIdStorageService(fraud_detection_grpc.OrderIdStorageServiceServicer):
-    
-    def StorageOrderId(self, request, context):
-        global order_id_from_orchestrator
-        order_id_from_orchestrator = request.orderId
-        return fraud_detection.OrderIdStorageResponse(isValid=True)
-
+def is_userdata_fraudulent(user_name, contact_number):
+    # a simple dummy check if contact is between 7 and 15 inclusive, and if they are all digits
+    contact_is_number = (len(contact_number) >= 7 and len(contact_number) <= 15 )and contact_number.isdigit()
+
+    is_fraudulent = not contact_is_number
+    return is_fraudulent
+
+def is_creditcard_fraudulent(credit_card):
+    is_fraudulent = not credit_card.number.isdigit()
+
+    return is_fraudulent
+
+# The events of this service.
+# event: (check of the request, error message if the check fails)
+EVENTS = {
+    "d": (lambda request: not is_userdata_fraudulent(request.user.name, request.user.contact),
+          "Order Rejected because fraud was detected. Please provvide a valid user name or contact."),
+    "e": (lambda request: not is_creditcard_fraudulent(request.creditCard),
+          "Order Rejected because fraud was detected. Please provvide a valid payment details."),
+}
     
 class UserdataFraudDetectionService(fraud_detection_grpc.UserdataFraudDetectionServiceServicer):
 
-    def check_order_id(self, order_id):
-        is_valid = (order_id_from_orchestrator == order_id)
-        return is_valid
-
-    def check_vc_after_userdata_verification(self, vector_clock, local_vector_clock):
-        request_vc_check = bool(vector_clock['vcArray'] == VC_CORRECT_AFTER_USERDATA_VERIFICATION)
-        local_vc_check = bool(local_vector_clock['vcArray'] == LOCAL_VC_CORRECT_AFTER_USERDATA_VERIFICATION)
-        timestamp_check = bool(vector_clock['timestamp'] < datetime.now().timestamp())
-        return request_vc_check and local_vc_check and timestamp_check
-    
-    def is_userdata_fraudulent(self, user_name, contact_number):
-        # a simple dummy check if contact is between 7 and 15 inclusive, and if they are all digits
-        contact_is_number = (len(contact_number) >= 7 and len(contact_number) <= 15 )and contact_number.isdigit()
-
-        is_fraudulent = not contact_is_number
-        return is_fraudulent
-
     def DetectUserdataFraud(self, request, context):
-        global local_vector_clock
-        local_vector_clock = {"vcArray": [0 for _ in range(NUM_SERVERS)], "timestamp": datetime.now().timestamp()}
         print("Fraud dectection request received")
         print(f"[Fraud detection] Server index: {SERVER_INDEX}")
 
@@ -114,63 +120,46 @@ class UserdataFraudDetectionService(fraud_detection_grpc.UserdataFraudDetectionS
             "books": None
         }
 
-        vector_clock = MessageToDict(request.vectorClock)
+        vector_clock = VectorClock.from_proto(request.vectorClock)
         user_name = request.user.name
         contact_number = request.user.contact
         order_id = request.orderId
 
         ### Order Id Confirm ------------------------------------
-        if not self.check_order_id(order_id):
+        order_state = get_order_state(order_states, order_id, context, new_order_state)
+        if order_state is None:
             error_message = "Server Error. Please retry later."
             return fraud_detection.UserdataFraudDetectionResponse(**error_response(error_message))
         
         print('[Fraud detection] Order Id is confirmed.')
 
         ### Vector Clock Confirm ------------------------------------
-        if not self.check_vc_after_userdata_verification(vector_clock, local_vector_clock):
+        if not check_vc_before("d", vector_clock, order_state):
             error_message = "Server Error. Please retry later."
             return fraud_detection.UserdataFraudDetectionResponse(**error_response(error_message))
         
-        print('[Fraud detection] VC is correct after userdata verification.')
+        print('[Fraud detection] VC is correct before userdata fraud detection.')
 
         ### d: is userdata flaudulent? -------------------------------------
-        is_fraudulent = self.is_userdata_fraudulent(user_name, contact_number)
+        is_fraudulent = is_userdata_fraudulent(user_name, contact_number)
         if is_fraudulent:
             error_message = "Order Rejected because fraud was detected. Please provvide a valid user name or contact."
             return fraud_detection.UserdataFraudDetectionResponse(**error_response(error_message))
         
-        local_vector_clock = increment_vector_clock(local_vector_clock)
-        vector_clock = increment_vector_clock(vector_clock)
-        print(f"[Fraud detection] VCArray updated (no fraud in userdata) in Fraud detection: {vector_clock['vcArray']}")
-        # print(f"[Fraud detection] Timestamp updated in Fraud detection: {vector_clock['timestamp']}")
+        vector_clock.increment(SERVER_INDEX)
+        order_state["completedEvents"].add("d")
+        print(f"[Fraud detection] VCArray updated (no fraud in userdata) in Fraud detection: {list(vector_clock)}")
+        # print(f"[Fraud detection] Timestamp updated in Fraud detection: {vector_clock.timestamp}")
 
         print(f"[Fraud detection] Fraud check response: Not Fraudulent")
-        with futures.ThreadPoolExecutor() as executor:
-            cardinfo_future = executor.submit(cardinfo_verification_service, request, vector_clock)
-        message = cardinfo_future.result()
+        message = cardinfo_verification_service(request, vector_clock)
         response = MessageToDict(message)
         return fraud_detection.UserdataFraudDetectionResponse(**response)
     
 
 class CardinfoFraudDetectionService(fraud_detection_grpc.CardinfoFraudDetectionServiceServicer):
 
-    def check_order_id(self, order_id):
-        is_valid = (order_id_from_orchestrator == order_id)
-        return is_valid
-
-    def check_vc_after_creditcard_verification(self, vector_clock, local_vector_clock):
-        request_vc_check = bool(vector_clock['vcArray'] == VC_CORRECT_AFTER_CREDITCARD_VERIFICATION)
-        local_vc_check = bool(local_vector_clock['vcArray'] == LOCAL_VC_CORRECT_AFTER_CREDITCARD_VERIFICATION)
-        timestamp_check = bool(vector_clock['timestamp'] < datetime.now().timestamp())
-        return request_vc_check and local_vc_check and timestamp_check
-    
-    def is_creditcard_fraudulent(self, credit_card):
-        is_fraudulent = not credit_card.number.isdigit()
-
-        return is_fraudulent
-    
     def DetectCardinfoFraud(self, request, context):
-        global local_vector_clock
         print("Fraud dectection request received")
         print(f"[Fraud detection] Server index: {SERVER_INDEX}")
 
@@ -180,49 +169,85 @@ class CardinfoFraudDetectionService(fraud_detection_grpc.CardinfoFraudDetectionS
             "books": None
         }
 
-        local_vector_clock = globals()['local_vector_clock']
-        vector_clock = MessageToDict(request.vectorClock)
+        vector_clock = VectorClock.from_proto(request.vectorClock)
         credit_card = request.creditCard
         order_id = request.orderId
 
         ### Order Id Confirm ------------------------------------
-        if not self.check_order_id(order_id):
+        order_state = get_order_state(order_states, order_id, context, new_order_state)
+        if order_state is None:
             error_message = "Server Error. Please retry later."
             return fraud_detection.CardinfoFraudDetectionResponse(**error_response(error_message))
         
         print('[Fraud detection] Order Id is confirmed.')
 
         ### Vector Clock Confirm ------------------------------------
-        if not self.check_vc_after_creditcard_verification(vector_clock, local_vector_clock):
+        if not check_vc_before("e", vector_clock, order_state):
             error_message = "Server Error. Please retry later."
             return fraud_detection.CardinfoFraudDetectionResponse(**error_response(error_message))
             
         ### e: is creditcard flaudulent? --------------------------------
-        is_fraudulent = self.is_creditcard_fraudulent(credit_card)
+        is_fraudulent = is_creditcard_fraudulent(credit_card)
         if is_fraudulent:
             error_message = "Order Rejected because fraud was detected. Please provvide a valid payment details."
             return fraud_detection.CardinfoFraudDetectionResponse(**error_response(error_message))
     
-        local_vector_clock = increment_vector_clock(local_vector_clock)
-        vector_clock = increment_vector_clock(vector_clock)
-        print(f"[Fraud detection] VCArray updated (no fraud in creditcard) in Fraud detection: {vector_clock['vcArray']}")
-        # print(f"[Fraud detection] Timestamp updated (no fraud in creditcard) in Fraud detection: {vector_clock['timestamp']}")
+        vector_clock.increment(SERVER_INDEX)
+        order_state["completedEvents"].add("e")
+        # This is the last event of the order in this service.
+        order_states.pop(order_id)
+        print(f"[Fraud detection] VCArray updated (no fraud in creditcard) in Fraud detection: {list(vector_clock)}")
+        # print(f"[Fraud detection] Timestamp updated (no fraud in creditcard) in Fraud detection: {vector_clock.timestamp}")
 
         print(f"[Fraud detection] Fraud check response: Not Fraudulent")
-        with futures.ThreadPoolExecutor() as executor:
-            suggestion_future = executor.submit(book_suggestion_service, request, vector_clock)
-        message = suggestion_future.result()
+        message = book_suggestion_service(request, vector_clock)
         response = MessageToDict(message)
         return fraud_detection.CardinfoFraudDetectionResponse(**response)
 
+
+class EventService(fraud_detection_grpc.EventServiceServicer):
+
+    def RunEvent(self, request, context):
+        print(f"[Fraud detection] Event {request.event} request received")
+
+        error_response = lambda error_message: fraud_detection.EventResponse(isValid=False, errorMessage=error_message)
+
+        vector_clock = VectorClock.from_proto(request.vectorClock)
+        order_id = request.orderId
+
+        ### Order Id Confirm ------------------------------------
+        order_state = get_order_state(order_states, order_id, context, new_order_state)
+        if order_state is None or request.event not in EVENTS:
+            return error_response("Server Error. Please retry later.")
+
+        check, error_message = EVENTS[request.event]
+        # The events of an order may arrive concurrently. Each of them takes its own tick of the local clock.
+        with order_state["lock"]:
+            ### Vector Clock Confirm ------------------------------------
+            if not check_vc_before(request.event, vector_clock, order_state):
+                return error_response("Server Error. Please retry later.")
+
+            if not check(request):
+                return error_response(error_message)
+
+            local_vector_clock = order_state["localVectorClock"].merge(vector_clock).increment(SERVER_INDEX)
+            order_state["completedEvents"].add(request.event)
+            vector_clock = local_vector_clock.copy()
+            if order_state["completedEvents"] >= CHECKOUT_GRAPH.server_events(SERVER_INDEX):
+                order_states.pop(order_id)
+        print(f"[Fraud detection] VCArray updated (event {request.event}) in Fraud detection: {list(vector_clock)}")
+
+        return fraud_detection.EventResponse(isValid=True, vectorClock=vector_clock.to_proto(fraud_detection.VectorClock))
+
 def serve():
     # Create a gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor())
+    # The process-wide executor serves the RPCs, and the downstream calls run on the thread of the RPC.
+    server = create_server(default_executor)
     # Add HelloService
     fraud_detection_grpc.add_HelloServiceServicer_to_server(HelloService(), server)
-    fraud_detection_grpc.add_OrderIdStorageServiceServicer_to_server(OrderIdStorageService(), server)
     fraud_detection_grpc.add_UserdataFraudDetectionServiceServicer_to_server(UserdataFraudDetectionService(), server)
     fraud_detection_grpc.add_CardinfoFraudDetectionServiceServicer_to_server(CardinfoFraudDetectionService(), server)
+    fraud_detection_grpc.add_EventServiceServicer_to_server(EventService(), server)
     # Listen on port 50051
     port = "50051"
     server.add_insecure_port("[::]:" + port)
@@ -233,4 +258,5 @@ def serve():
     server.wait_for_termination()
 
 if __name__ == '__main__':
-    serve()
\ No newline at end of file
+    # GRPC_SERVER_PROCESSES > 1 runs one server per process on the same port, for the relay checkout only.
+    serve_processes(serve)
\ No newline at end of file
@@ -1,9 +1,8 @@
 import sys
 import os
 import uuid
-import random
-from datetime import datetime
-from google.protobuf.json_format import MessageToDict
+import collections
+from google.protobuf.json_format import MessageToDict, ParseDict
 
 # This set of lines are needed to import the gRPC stubs.
 # The path of the stubs is relative to the current file, or absolute inside the container.
@@ -12,6 +11,12 @@ FILE = __file__ if '__file__' in globals() else os.getenv("PYTHONFILE", "")
 utils_path = os.path.abspath(os.path.join(FILE, '../../../utils/pb'))
 # utils_path = os.path.abspath(os.path.join(FILE, '../../../utils/pb/transaction_verification'))
 sys.path.insert(0, utils_path)
+shared_path = os.path.abspath(os.path.join(FILE, '../../../utils'))
+sys.path.insert(0, shared_path)
+from shared.channels import get_stub, channel_stats
+from shared.order_context import order_metadata
+from shared.vector_clock import VectorClock
+from shared.causal_order import CHECKOUT_GRAPH, EventRejected, ORCHESTRATOR, TRANSACTION_VERIFICATION, FRAUD_DETECTION, BOOK_SUGGESTION, NUM_SERVERS
 from fraud_detection import fraud_detection_pb2 as fraud_detection
 from fraud_detection import fraud_detection_pb2_grpc as fraud_detection_grpc
 from transaction_verification import transaction_verification_pb2 as transaction_verification
@@ -23,21 +28,30 @@ from order_queue import order_queue_pb2_grpc as order_queue_grpc
 from book_database import book_database_pb2 as book_database
 from book_database import book_database_pb2_grpc as book_database_grpc
 
-import grpc
 from concurrent import futures
 
 # Set the server index for the vector clock.
-# Frontend: 0, Orchestrator: 1, TransactionVerification: 2, FraudDetection: 3, BookSuggestion: 4
-SERVER_INDEX = 1
-NUM_SERVERS = 5
+# The checkout event of the orchestrator starts CHECKOUT_GRAPH.
+SERVER_INDEX = ORCHESTRATOR
+
+# How the events of a checkout are run.
+# relay: the orchestrator calls transaction verification, and each service calls the next one.
+# dag: the orchestrator runs the events of CHECKOUT_GRAPH itself, each as soon as the events it depends on are done.
+CHECKOUT_MODE = os.getenv("CHECKOUT_MODE", "relay")
+# The services running single events in the dag mode.
+EVENT_SERVICES = {
+    TRANSACTION_VERIFICATION: ('transaction_verification:50052', transaction_verification_grpc.EventServiceStub, transaction_verification),
+    FRAUD_DETECTION: ('fraud_detection:50051', fraud_detection_grpc.EventServiceStub, fraud_detection),
+}
+# The critical path of the latest checkouts in the dag mode.
+critical_paths = collections.deque(maxlen=int(os.getenv("CRITICAL_PATH_HISTORY", "100")))
+dag_executor = futures.ThreadPoolExecutor(thread_name_prefix="checkout_dag")
 
 def greet(name='you'):
-    # Establish a connection with the fraud-detection gRPC service.
-    with grpc.insecure_channel('fraud_detection:50051') as channel:
-        # Create a stub object.
-        stub = fraud_detection_grpc.HelloServiceStub(channel)
-        # Call the service through the stub object.
-        response = stub.SayHello(fraud_detection.HelloRequest(name=name))
+    # Get the pooled stub of the fraud-detection gRPC service.
+    stub = get_stub('fraud_detection:50051', fraud_detection_grpc.HelloServiceStub)
+    # Call the service through the stub object.
+    response = stub.SayHello(fraud_detection.HelloRequest(name=name))
     return response.greeting
 
 # Import Flask.
@@ -64,48 +78,89 @@ def index():
 
     return response
 
-def orderid_storage_fraud_service(order_id):
-    with grpc.insecure_channel('fraud_detection:50051') as channel:
-        stub = fraud_detection_grpc.OrderIdStorageServiceStub(channel)
-        response = stub.StorageOrderId(fraud_detection.OrderIdStorageRequest(
-            orderId=order_id
-        ))
-        return response.isValid
-    
-def orderid_storage_transaction_service(order_id):
-    with grpc.insecure_channel('transaction_verification:50052') as channel:
-        stub = transaction_verification_grpc.OrderIdStorageServiceStub(channel)
-        response = stub.StorageOrderId(transaction_verification.OrderIdStorageRequest(
-            orderId=order_id
-        ))
-        return response.isValid
-    
-def orderid_storage_suggestion_service(order_id):
-    with grpc.insecure_channel('book_suggestion:50053') as channel:
-        stub = book_suggestion_grpc.OrderIdStorageServiceStub(channel)
-        response = stub.StorageOrderId(book_suggestion.OrderIdStorageRequest(
-            orderId=order_id
-        ))
-        return response.isValid
+# Report how often the pooled gRPC channels were created or reused.
+@app.route('/stats/channels', methods=['GET'])
+def channels():
+    return channel_stats()
+
+# Report the critical path of the latest checkouts in the dag mode.
+@app.route('/stats/critical_path', methods=['GET'])
+def critical_path():
+    return list(critical_paths)
 
 def item_and_userdata_verification_service(data, order_id, vector_clock):
-    with grpc.insecure_channel('transaction_verification:50052') as channel:
-        stub = transaction_verification_grpc.ItemAndUserdataVerificationServiceStub(channel)
-        response = stub.VerifyItemAndUserdata(transaction_verification.ItemAndUserdataVerificationRequest(
-            orderId=order_id,
-            user=data['user'],
-            item=data['items'][0],
-            creditCard=data['creditCard'],
-            vectorClock=vector_clock
-        ))
-        return response
+    stub = get_stub('transaction_verification:50052', transaction_verification_grpc.ItemAndUserdataVerificationServiceStub)
+    response = stub.VerifyItemAndUserdata(transaction_verification.ItemAndUserdataVerificationRequest(
+        orderId=order_id,
+        user=data['user'],
+        item=data['items'][0],
+        creditCard=data['creditCard'],
+        vectorClock=vector_clock.to_proto(transaction_verification.VectorClock)
+    ), metadata=order_metadata(order_id))
+    return response
+
+def checkout_event_request(message_class, data, order_id, vector_clock, **fields):
+    request = message_class(
+        orderId=order_id,
+        user=data['user'],
+        item=data['items'][0],
+        creditCard=data['creditCard'],
+        **fields
+    )
+    vector_clock.copy_to(request.vectorClock)
+    return request
+
+# Run a single event of the checkout.
+# Returns the vector clock after the event, and the suggested books for the last event.
+def run_checkout_event(data, order_id, event, vector_clock):
+    server_index = CHECKOUT_GRAPH.server_index(event)
+    if server_index == BOOK_SUGGESTION:
+        stub = get_stub('book_suggestion:50053', book_suggestion_grpc.BookSuggestionServiceStub)
+        request = checkout_event_request(book_suggestion.BookSuggestionRequest, data, order_id, vector_clock)
+        response = stub.SuggestBook(request, metadata=order_metadata(order_id))
+        if not response.isValid:
+            raise EventRejected(response.errorMessage)
+        return vector_clock.increment(server_index), response.books
+
+    target, stub_class, pb = EVENT_SERVICES[server_index]
+    stub = get_stub(target, stub_class)
+    request = checkout_event_request(pb.EventRequest, data, order_id, vector_clock, event=event)
+    response = stub.RunEvent(request, metadata=order_metadata(order_id))
+    if not response.isValid:
+        raise EventRejected(response.errorMessage)
+    return VectorClock.from_proto(response.vectorClock), None
+
+def record_critical_path(order_id, graph_run):
+    events, latency = graph_run.critical_path()
+    record = {
+        "orderId": order_id,
+        "isValid": graph_run.is_valid,
+        "criticalPath": events,
+        "criticalPathLatencyMs": round(latency * 1000, 3),
+    }
+    critical_paths.append(record)
+    print(f"[Orchestrator] Critical path of {order_id}: {' -> '.join(events)} ({record['criticalPathLatencyMs']} ms)")
+
+def checkout_result_from_graph_run(graph_run):
+    # The same shape as the response of the relay mode.
+    return book_suggestion.BookSuggestionResponse(
+        isValid=graph_run.is_valid,
+        errorMessage=graph_run.error_message,
+        books=graph_run.results.get("f") or []
+    )
+
+def checkout_dag_service(data, order_id, vector_clock):
+    run_event = lambda event, event_vector_clock: run_checkout_event(data, order_id, event, event_vector_clock)
+    graph_run = CHECKOUT_GRAPH.run(run_event, vector_clock, dag_executor, completed_events=["checkout"])
+    record_critical_path(order_id, graph_run)
+    return checkout_result_from_graph_run(graph_run)
 
 # Our book database is key-value structure. The key is bookId. 
-def lookup_book_from_title(title):
-    with grpc.insecure_channel("book_database_1:50056") as channel:
-        stub = book_database_grpc.BookDatabaseServiceStub(channel)
-        book = stub.GetBookFromTitle(book_database.GetBookFromTitleRequest(title=title))
-    return book
+# Look up every title of the cart with a single request to the database.
+def lookup_books_from_titles(titles):
+    stub = get_stub("book_database_1:50056", book_database_grpc.BookDatabaseServiceStub)
+    response = stub.GetBooksFromTitles(book_database.GetBooksFromTitlesRequest(titles=titles))
+    return response
 
 def transform_suggested_book_response(suggested_books):
     book_array = []
@@ -118,16 +173,6 @@ def transform_suggested_book_response(suggested_books):
 
     return book_array # key: [bookId, title, author]
 
-# Increment the value in the server index, and update the timestamp.
-# If the index isn't in the vc_array, append 0 until the index.
-def increment_vector_clock(vector_clock):
-    vc_array = [0 for _ in range(NUM_SERVERS)] if not "vcArray" in vector_clock else vector_clock["vcArray"]
-    timestamp = datetime.now().timestamp()
-
-    vc_array[SERVER_INDEX] += 1
-
-    return {"vcArray": vc_array, "timestamp": timestamp}
-
 def confirm_bookcopies_available(book_orders):
     for item in book_orders:
         available = item.book.copiesAvailable
@@ -136,25 +181,25 @@ def confirm_bookcopies_available(book_orders):
             return False
     return True
 
+def create_order(data, book_orders, order_id):
+    # Create an order object.
+    # A lower priority is dequeued first. Ties are dequeued in arrival order.
+    order = order_queue.Order(
+        orderId=order_id,
+        user=data['user'],
+        items=book_orders,
+        creditCard=data['creditCard'],
+        address = data['billingAddress'],
+        priority= data['items'][0]['quantity'] \
+            + (1 if data['billingAddress']['country'] == 'Finlad' else 0) \
+            + (len(data['creditCard']['number']) - 10)
+    )
+    return order
+
 def enqueue_order_service(data, book_orders, order_id):
-    with grpc.insecure_channel('order_queue:50054') as channel:
-        stub = order_queue_grpc.OrderQueueServiceStub(channel)
-        
-        # Create an order object.
-        # Priority number must be different. If it's same, TypeError: '<' not supported between instances of 'Order' and 'Order' occurred.
-        order = order_queue.Order(
-            orderId=order_id,
-            user=data['user'],
-            items=book_orders,
-            creditCard=data['creditCard'],
-            address = data['billingAddress'],
-            priority= data['items'][0]['quantity'] \
-                + (1 if data['billingAddress']['country'] == 'Finlad' else 0) \
-                + (len(data['creditCard']['number']) - 10) \
-                + (random.uniform(0.0, 1.0))
-        )
-        
-        enqueue_response = stub.Enqueue(order_queue.EnqueueRequest(order=order))
+    stub = get_stub('order_queue:50054', order_queue_grpc.OrderQueueServiceStub)
+    order = create_order(data, book_orders, order_id)
+    enqueue_response = stub.Enqueue(order_queue.EnqueueRequest(order=order))
     return enqueue_response
 
 @app.route('/checkout', methods=['POST'])
@@ -167,31 +212,25 @@ def checkout():
     print("Request Data:", request.json)
     data = request.json
 
-    vector_clock = {}
-    vector_clock = increment_vector_clock(vector_clock)
-    print(f"[Orchestrator] Vector Clock Array: {vector_clock['vcArray']}")
-    print(f"[Orchestrator] Timestamp: {vector_clock['timestamp']}")
+    vector_clock = VectorClock(NUM_SERVERS).increment(SERVER_INDEX)
+    print(f"[Orchestrator] Vector Clock Array: {list(vector_clock)}")
+    print(f"[Orchestrator] Timestamp: {vector_clock.timestamp}")
 
     order_id = str(uuid.uuid4())
     print(f'[Orchestrator] Order id: {order_id}')
 
-    # Send the order id before requesting.
-    with futures.ThreadPoolExecutor() as executor:
-        orderid_storage_fraud_future = executor.submit(orderid_storage_fraud_service, order_id)
-        orderid_storage_transaction_future = executor.submit(orderid_storage_transaction_service, order_id)
-        orderid_storage_suggestion_future = executor.submit(orderid_storage_suggestion_service, order_id)
-
-        futures.wait([orderid_storage_fraud_future, orderid_storage_transaction_future, orderid_storage_suggestion_future], return_when=futures.ALL_COMPLETED)
-
-    if not (orderid_storage_fraud_future.result() and orderid_storage_transaction_future.result() and orderid_storage_suggestion_future.result()):
-        order_status_response = {'orderId': '404', "status": "Server Error. Please try later."}
+    books_response = lookup_books_from_titles([item['name'] for item in data['items']])
+    if books_response.missingTitles:
+        print(f"[Orchestrator] Books not found: {list(books_response.missingTitles)}")
+        order_status_response = {'orderId': '404', "status": "Some of the checking out books are not found. Please try again."}
         return order_status_response
-    
+
+    title_to_book = {book.title: book for book in books_response.books}
     book_orders = []
     for item in data['items']:
-        book = lookup_book_from_title(item['name'])
-        book = MessageToDict(book)
-        book_orders.append(order_queue.Item(book=order_queue.Book(**book), quantity=item['quantity']))
+        # The queue doesn't keep the version of the book.
+        book = ParseDict(MessageToDict(title_to_book[item['name']]), order_queue.Book(), ignore_unknown_fields=True)
+        book_orders.append(order_queue.Item(book=book, quantity=item['quantity']))
     
     is_books_available = confirm_bookcopies_available(book_orders)
 
@@ -200,10 +239,10 @@ def checkout():
         return order_status_response
 
     # Triger the flow of events and recieve the end result.
-    with futures.ThreadPoolExecutor() as executor:
-        item_and_userdata_future = executor.submit(item_and_userdata_verification_service, data, order_id, vector_clock)
-        
-    checkout_result = item_and_userdata_future.result()
+    if CHECKOUT_MODE == "dag":
+        checkout_result = checkout_dag_service(data, order_id, vector_clock)
+    else:
+        checkout_result = item_and_userdata_verification_service(data, order_id, vector_clock)
     
     if checkout_result.isValid:
         # Enqueue the order here
@@ -0,0 +1,174 @@
+import sys
+import os
+import uuid
+import asyncio
+from google.protobuf.json_format import MessageToDict, ParseDict
+
+# This set of lines are needed to import the gRPC stubs.
+# The path of the stubs is relative to the current file, or absolute inside the container.
+# Change these lines only if strictly needed.
+FILE = __file__ if '__file__' in globals() else os.getenv("PYTHONFILE", "")
+utils_path = os.path.abspath(os.path.join(FILE, '../../../utils/pb'))
+sys.path.insert(0, utils_path)
+shared_path = os.path.abspath(os.path.join(FILE, '../../../utils'))
+sys.path.insert(0, shared_path)
+from shared.channels import AioChannelPool
+from shared.order_context import order_metadata
+from shared.vector_clock import VectorClock
+from shared.causal_order import CHECKOUT_GRAPH, EventRejected, BOOK_SUGGESTION
+from transaction_verification import transaction_verification_pb2 as transaction_verification
+from transaction_verification import transaction_verification_pb2_grpc as transaction_verification_grpc
+from book_suggestion import book_suggestion_pb2 as book_suggestion
+from book_suggestion import book_suggestion_pb2_grpc as book_suggestion_grpc
+from order_queue import order_queue_pb2 as order_queue
+from order_queue import order_queue_pb2_grpc as order_queue_grpc
+from book_database import book_database_pb2 as book_database
+from book_database import book_database_pb2_grpc as book_database_grpc
+
+# The async serving mode of the orchestrator.
+# It runs the same checkout flow as app.py, but on an ASGI server with grpc.aio clients,
+# so a checkout waiting on the backend services holds a coroutine instead of a thread.
+from app import SERVER_INDEX, NUM_SERVERS, CHECKOUT_MODE, EVENT_SERVICES, critical_paths, confirm_bookcopies_available, create_order, transform_suggested_book_response
+from app import checkout_event_request, record_critical_path, checkout_result_from_graph_run
+
+# Quart is the asyncio re-implementation of the Flask API.
+# For more information, see https://quart.palletsprojects.com/en/latest/
+from quart import Quart, request
+from quart_cors import cors
+from hypercorn.config import Config
+from hypercorn.asyncio import serve
+
+app = Quart(__name__)
+# Enable CORS for the app.
+app = cors(app, allow_origin="*")
+
+# grpc.aio channels are bound to the event loop, so the pool is created when the server starts.
+channel_pool = None
+
+@app.before_serving
+async def open_channel_pool():
+    global channel_pool
+    channel_pool = AioChannelPool()
+
+@app.after_serving
+async def close_channel_pool():
+    await channel_pool.close()
+
+@app.route('/stats/channels', methods=['GET'])
+async def channels():
+    return channel_pool.stats()
+
+@app.route('/stats/critical_path', methods=['GET'])
+async def critical_path():
+    return list(critical_paths)
+
+async def item_and_userdata_verification_service(data, order_id, vector_clock):
+    stub = channel_pool.get_stub('transaction_verification:50052', transaction_verification_grpc.ItemAndUserdataVerificationServiceStub)
+    response = await stub.VerifyItemAndUserdata(transaction_verification.ItemAndUserdataVerificationRequest(
+        orderId=order_id,
+        user=data['user'],
+        item=data['items'][0],
+        creditCard=data['creditCard'],
+        vectorClock=vector_clock.to_proto(transaction_verification.VectorClock)
+    ), metadata=order_metadata(order_id))
+    return response
+
+async def run_checkout_event(data, order_id, event, vector_clock):
+    server_index = CHECKOUT_GRAPH.server_index(event)
+    if server_index == BOOK_SUGGESTION:
+        stub = channel_pool.get_stub('book_suggestion:50053', book_suggestion_grpc.BookSuggestionServiceStub)
+        request = checkout_event_request(book_suggestion.BookSuggestionRequest, data, order_id, vector_clock)
+        response = await stub.SuggestBook(request, metadata=order_metadata(order_id))
+        if not response.isValid:
+            raise EventRejected(response.errorMessage)
+        return vector_clock.increment(server_index), response.books
+
+    target, stub_class, pb = EVENT_SERVICES[server_index]
+    stub = channel_pool.get_stub(target, stub_class)
+    request = checkout_event_request(pb.EventRequest, data, order_id, vector_clock, event=event)
+    response = await stub.RunEvent(request, metadata=order_metadata(order_id))
+    if not response.isValid:
+        raise EventRejected(response.errorMessage)
+    return VectorClock.from_proto(response.vectorClock), None
+
+async def checkout_dag_service(data, order_id, vector_clock):
+    run_event = lambda event, event_vector_clock: run_checkout_event(data, order_id, event, event_vector_clock)
+    graph_run = await CHECKOUT_GRAPH.run_async(run_event, vector_clock, completed_events=["checkout"])
+    record_critical_path(order_id, graph_run)
+    return checkout_result_from_graph_run(graph_run)
+
+async def lookup_books_from_titles(titles):
+    stub = channel_pool.get_stub("book_database_1:50056", book_database_grpc.BookDatabaseServiceStub)
+    response = await stub.GetBooksFromTitles(book_database.GetBooksFromTitlesRequest(titles=titles))
+    return response
+
+async def enqueue_order_service(data, book_orders, order_id):
+    stub = channel_pool.get_stub('order_queue:50054', order_queue_grpc.OrderQueueServiceStub)
+    order = create_order(data, book_orders, order_id)
+    enqueue_response = await stub.Enqueue(order_queue.EnqueueRequest(order=order))
+    return enqueue_response
+
+@app.route('/checkout', methods=['POST'])
+async def checkout():
+    """
+    Responds with a JSON object containing the order ID, status, and suggested books.
+    """
+    print(f"[Orchestrator] Server index: {SERVER_INDEX}")
+    data = await request.get_json()
+    print("Request Data:", data)
+
+    vector_clock = VectorClock(NUM_SERVERS).increment(SERVER_INDEX)
+    print(f"[Orchestrator] Vector Clock Array: {list(vector_clock)}")
+
+    order_id = str(uuid.uuid4())
+    print(f'[Orchestrator] Order id: {order_id}')
+
+    books_response = await lookup_books_from_titles([item['name'] for item in data['items']])
+    if books_response.missingTitles:
+        print(f"[Orchestrator] Books not found: {list(books_response.missingTitles)}")
+        order_status_response = {'orderId': '404', "status": "Some of the checking out books are not found. Please try again."}
+        return order_status_response
+
+    title_to_book = {book.title: book for book in books_response.books}
+    book_orders = []
+    for item in data['items']:
+        # The queue doesn't keep the version of the book.
+        book = ParseDict(MessageToDict(title_to_book[item['name']]), order_queue.Book(), ignore_unknown_fields=True)
+        book_orders.append(order_queue.Item(book=book, quantity=item['quantity']))
+
+    if not confirm_bookcopies_available(book_orders):
+        order_status_response = {'orderId': '404', "status": "Some of the cheking out books are sold out. Please try again."}
+        return order_status_response
+
+    # Triger the flow of events and recieve the end result.
+    if CHECKOUT_MODE == "dag":
+        checkout_result = await checkout_dag_service(data, order_id, vector_clock)
+    else:
+        checkout_result = await item_and_userdata_verification_service(data, order_id, vector_clock)
+
+    if checkout_result.isValid:
+        enqueue_response = await enqueue_order_service(data, book_orders, order_id)
+        if not enqueue_response.success:
+            return {"status": "Failed to enqueue the order."}
+
+        order_status_response = {
+            'orderId': order_id,
+            'status': 'Order Approved',
+            'suggestedBooks': transform_suggested_book_response(checkout_result.books)
+        }
+        return order_status_response
+    else:
+        print(checkout_result.errorMessage)
+        order_status_response = {'orderId': '404', "status": checkout_result.errorMessage}
+        return order_status_response
+
+
+def run():
+    config = Config()
+    config.bind = [f"0.0.0.0:{os.getenv('ORCHESTRATOR_PORT', '5000')}"]
+    asyncio.run(serve(app, config))
+
+if __name__ == '__main__':
+    # Serve the app with Hypercorn, an ASGI server.
+    # The default port is 5000, the same as the Flask app.
+    run()
@@ -41,6 +41,10 @@ active_orders = meter.create_observable_gauge("active_orders", callbacks=[get_ac
 FILE = __file__ if '__file__' in globals() else os.getenv("PYTHONFILE", "")
 utils_path = os.path.abspath(os.path.join(FILE, '../../../utils/pb'))
 sys.path.insert(0, utils_path)
+shared_path = os.path.abspath(os.path.join(FILE, '../../../utils'))
+sys.path.insert(0, shared_path)
+from shared.channels import get_stub, channel_stats
+from shared.server import create_server
 
 from order_queue import order_queue_pb2 as order_queue
 from order_queue import order_queue_pb2_grpc as order_queue_grpc
@@ -54,100 +58,173 @@ from book_database import book_database_pb2 as book_database
 from book_database import book_database_pb2_grpc as book_database_grpc
 
 import grpc
+
 from concurrent import futures
 
 import socket
+import threading
 
-replica_id = int(os.getenv('REPLICA_ID', '0'))  # Gets the ID of the current replica from the environment.
-print(f"My ID is: {replica_id}")
-total_replicas = int(os.getenv('TOTAL_REPLICAS', '6'))
+from group_commit import GroupCommit, send_decisions
+from decision_log import DecisionLog, DECISION_LOG_DIR
+from latency_profile import LatencyProfile
 
-def dequeue():
-    # Access the order queue to dequeue.
-    with tracer.start_as_current_span("dequeue_order") as span:
-        span.set_attribute("replica_id", replica_id)
-        with grpc.insecure_channel('order_queue:50054') as channel:
-                print(f"Replica {replica_id} has accessed the queue")
-                stub = order_queue_grpc.OrderQueueServiceStub(channel)
-                response = stub.Dequeue(order_queue.DequeueRequest())
+def get_channel_stats(options):
+    stats = channel_stats()
+    return [
+        metrics.Observation(stats["channelsCreated"], {"kind": "created"}),
+        metrics.Observation(stats["channelsReused"], {"kind": "reused"}),
+        metrics.Observation(stats["stubsReused"], {"kind": "stub_reused"}),
+    ]
 
-        return response
+grpc_channels = meter.create_observable_gauge("grpc_channels", callbacks=[get_channel_stats], description="Pooled gRPC channels created vs reused")
 
-def send_vote_request_to_payment_executor():
+replica_id = int(os.getenv('REPLICA_ID', '0'))  # Gets the ID of the current replica from the environment.
+print(f"My ID is: {replica_id}")
+total_replicas = int(os.getenv('TOTAL_REPLICAS', '6'))
+# The most orders taken from the queue at once. Also bounded by the free workers.
+DEQUEUE_BATCH_SIZE = int(os.getenv('DEQUEUE_BATCH_SIZE', '10'))
+DEQUEUE_BATCH_BYTES = int(os.getenv('DEQUEUE_BATCH_BYTES', str(1024 * 1024)))
+# How long the token holder waits on an empty queue for an order to arrive.
+DEQUEUE_WAIT_MS = int(os.getenv('DEQUEUE_WAIT_MS', '5000'))
+# Visibility timeout of a dequeued order. The lease is restarted when the order starts executing,
+# so it must cover one execution. If the replica dies, the order is delivered again after it.
+ORDER_LEASE_MS = int(os.getenv('ORDER_LEASE_MS', '120000'))
+# The replica takes orders from its own partitions of the queue first, and from the others when they are empty.
+ORDER_QUEUE_PARTITIONS = int(os.getenv('ORDER_QUEUE_PARTITIONS', '1'))
+STEAL_ORDERS = os.getenv('STEAL_ORDERS', 'true').lower() == 'true'
+# With fewer partitions than replicas, some replicas own none and only steal.
+owned_partitions = [partition for partition in range(ORDER_QUEUE_PARTITIONS) if partition % total_replicas == replica_id - 1]
+# How replicas share the queue.
+# lease: every replica dequeues on its own. The queue leases each order to one replica, and the stock
+# reservations of the database keep the orders of different replicas from taking the same copies.
+# token: only the holder of the token passed around the ring dequeues.
+EXECUTOR_MODE = os.getenv('EXECUTOR_MODE', 'lease')
+# Orders a replica runs at the same time, each in its own 2PC.
+EXECUTOR_WORKERS = int(os.getenv('EXECUTOR_WORKERS', '4'))
+# Group commit: the orders the workers start within GROUP_COMMIT_MS of each other share one 2PC round,
+# with one request per participant. 0 runs one round per order.
+GROUP_COMMIT_MS = float(os.getenv('GROUP_COMMIT_MS', '0'))
+# Address of this replica, where the 2PC participants ask for the decision of an order with QueryDecision.
+COORDINATOR_ADDRESS = os.getenv('COORDINATOR_ADDRESS', f'order_executor_{replica_id}:50055')
+# How long to wait before the participants are asked again, when the decisions of the last run weren't delivered.
+RECOVERY_RETRY_SECONDS = float(os.getenv('RECOVERY_RETRY_SECONDS', '5'))
+# Simulated delays of the stages of an order, see latency_profile.py. None unless LATENCY_PROFILE is set.
+latency_profile = LatencyProfile.load()
+
+class OrderWorkers:
+    """
+    Bounded pool of the orders a replica executes at once. The replica checks for a free slot before it
+    dequeues and only takes as many orders as it can start right away, so no leased order waits behind others.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.in_flight = 0
+        self.condition = threading.Condition()
+        self.pool = futures.ThreadPoolExecutor(max_workers=capacity)
+
+    def free_slots(self):
+        return self.capacity - self.in_flight
+
+    def wait_for_slot(self):
+        with self.condition:
+            self.condition.wait_for(lambda: self.in_flight < self.capacity)
+
+    def submit(self, fn, *args):
+        with self.condition:
+            self.in_flight += 1
+        future = self.pool.submit(fn, *args)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future):
+        if future.exception() is not None:
+            print(f"Replica-{replica_id}: order worker failed: {future.exception()}")
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+order_workers = OrderWorkers(EXECUTOR_WORKERS)
+# The calls of the orders in 2PC to the participants, at most three at a time per order (the decisions of a group
+# commit). Shared instead of a pool per order, so no order pays for starting and joining threads.
+participant_calls = futures.ThreadPoolExecutor(max_workers=3 * EXECUTOR_WORKERS, thread_name_prefix='participants')
+
+def get_orders_in_flight(options):
+    return [
+        metrics.Observation(order_workers.in_flight, {"replica": replica_id, "kind": "in_flight"}),
+        metrics.Observation(order_workers.capacity, {"replica": replica_id, "kind": "capacity"}),
+    ]
+
+orders_in_flight = meter.create_observable_gauge("orders_in_flight", callbacks=[get_orders_in_flight], description="Orders in 2PC on this replica vs its capacity")
+
+def send_vote_request_to_payment_executor(order_id):
     with tracer.start_as_current_span("vote_request_payment_executor") as span:
         print(f"Order Executor-{replica_id}: Phase 1a - Sending vote request to Payment Executor.")
-        with grpc.insecure_channel('payment_executor:50059') as channel:
-            stub = payment_executor_grpc.PaymentExecutorServiceStub(channel)
-            response = stub.SendVoteToCoordinator(payment_executor.VoteCommitRequest())
-            return response.success
+        stub = get_stub('payment_executor:50059', payment_executor_grpc.PaymentExecutorServiceStub)
+        response = stub.SendVoteToCoordinator(payment_executor.VoteCommitRequest(orderId=order_id, coordinator=COORDINATOR_ADDRESS))
+        return response.success
     
-def send_vote_request_to_book_database():
+def send_vote_request_to_book_database(order):
+    # The database reserves the stock of the order and votes commit only if it has it.
     with tracer.start_as_current_span("vote_request_book_database") as span:
         print(f"Order Executor-{replica_id}: Phase 1a - Sending vote request to Book Database.")
-        with grpc.insecure_channel('book_database_1:50056') as channel:
-            stub = book_database_grpc.BookDatabaseServiceStub(channel)
-            response = stub.SendVoteToCoordinator(book_database.VoteCommitRequest())
-            return response.success
+        stub = get_stub('book_database_1:50056', book_database_grpc.BookDatabaseServiceStub)
+        response = stub.Prepare(book_database.PrepareRequest(orderId=order.orderId, items=[
+            book_database.StockItem(bookId=item.book.id, quantity=item.quantity) for item in order.items
+        ]))
+        return response.commit
     
-def send_execute_request_to_payment_executor(global_commit):
+def send_execute_request_to_payment_executor(global_commit, order_id):
     with tracer.start_as_current_span("execute_request_payment_executor") as span:
         span.set_attribute("global_commit", global_commit)
-        with grpc.insecure_channel('payment_executor:50059') as channel:
-            stub = payment_executor_grpc.PaymentExecutorServiceStub(channel)
-            response = stub.ExecutePayment(payment_executor.PaymentExecutionRequest(commitStatus=global_commit))
-            return response.success
+        stub = get_stub('payment_executor:50059', payment_executor_grpc.PaymentExecutorServiceStub)
+        response = stub.ExecutePayment(payment_executor.PaymentExecutionRequest(commitStatus=global_commit, orderId=order_id))
+        return response.success
     
-def send_execute_request_to_book_database(global_commit, item):
+def send_execute_request_to_book_database(global_commit, order):
     with tracer.start_as_current_span("execute_request_book_database") as span:
         span.set_attribute("global_commit", global_commit)
-        delaytime = {"1": 0, "2": 20, "3": 20, "4": 20, "5": 20, "6": 20}
-        print(f'[Orcer Executor] Book Id is {item.book.id}. Add a delay time {delaytime[item.book.id]}')
-        time.sleep(delaytime[item.book.id])
-        print(f'[Order Executor] Send request of getting the book data. requesting book_id is {item.book.id}')
-        with grpc.insecure_channel('book_database_1:50056') as channel:
-            stub = book_database_grpc.BookDatabaseServiceStub(channel)
-            book = stub.GetBook(book_database.GetBookRequest(
-                request_id=item.book.id, # Learning Python (String)
-                commitStatus=global_commit
-            ), global_commit)
-
-        if book and book.copiesAvailable >= item.quantity:
-            book.copiesAvailable -= item.quantity
-            # Change the available counts.
-            print(f'[Order Executor] Changed the copiedAvailable from {book.copiesAvailable+item.quantity} to {book.copiesAvailable}')
-        else:
-            print(f'[Order Executor] BookId: {book.id} copiedAvailable is less than ordering quantity.')
+        stub = get_stub('book_database_1:50056', book_database_grpc.BookDatabaseServiceStub)
+        request = book_database.DecisionRequest(orderId=order.orderId, items=[
+            book_database.StockItem(bookId=item.book.id, quantity=item.quantity) for item in order.items
+        ])
+        if not global_commit:
+            stub.Abort(request)
+            print('[Order Executor] The stock reservation was released, nothing executed in the database.')
             return False
-        
-        print(f'[Order Executor] Send request of updating the book data.') 
-        with grpc.insecure_channel('book_database_1:50056') as channel:
-            stub = book_database_grpc.BookDatabaseServiceStub(channel)
-            response = stub.UpdateBook(book_database.UpdateBookRequest(
-                book=book, 
-                commitStatus=global_commit)
-            )
-            return response.success
-    
+        return stub.Commit(request).success
+
 class OrderExecutorService(order_executor_grpc.OrderExecutorServiceServicer):
-    def __init__(self):
-        self.is_busy = False
-        self.has_token = replica_id == 1  # Set the first token holder
+    def __init__(self, workers=order_workers, decision_log=None, latency=latency_profile):
+        # Admission: the replica takes orders only while it has free workers.
+        self.workers = workers
+        self.latency = latency
+        # 2PC transactions this replica coordinates. Without a directory, they don't survive a restart.
+        self.decision_log = decision_log or DecisionLog('', order_queue.Order)
+        # A batch holds at most one order per worker.
+        self.group_commit = None
+        if GROUP_COMMIT_MS > 0:
+            self.group_commit = GroupCommit(GROUP_COMMIT_MS, workers.capacity, self.decision_log, COORDINATOR_ADDRESS, latency, participant_calls)
+        self.has_token = EXECUTOR_MODE == 'token' and replica_id == 1  # Set the first token holder
+        # Wakes up dequeue_order when the token arrives.
+        self.token_condition = threading.Condition()
         if self.has_token:
             print(f"Replica {replica_id} is the leader.")
 
     def PassToken(self, request, context):
         # print(f"Replica {replica_id} received the token.")
-        self.has_token = True
+        with self.token_condition:
+            self.has_token = True
+            self.token_condition.notify()
         return order_executor.TokenResponse(success=True)
     
     def CheckHealth(self, request, context):
         # check if a replica is alive
         return order_executor.HealthCheckResponse(alive=True)
     
-    def SendVoteRequestToParticipants(self):
-        with futures.ThreadPoolExecutor() as executor:
-            payment_executor_vote = executor.submit(send_vote_request_to_payment_executor)
-            book_database_vote = executor.submit(send_vote_request_to_book_database)
+    def SendVoteRequestToParticipants(self, order):
+        payment_executor_vote = participant_calls.submit(send_vote_request_to_payment_executor, order.orderId)
+        book_database_vote = participant_calls.submit(send_vote_request_to_book_database, order)
 
         futures.wait([payment_executor_vote, book_database_vote], return_when=futures.ALL_COMPLETED)
 
@@ -170,25 +247,15 @@ class OrderExecutorService(order_executor_grpc.OrderExecutorServiceServicer):
             span.set_attribute("order_id", order.orderId)
             order_counter.add(1, {"status": "processed"})
             order_status.add(1)
-            self.is_busy = True # to indicate when they do not need the critical regiion
-
-            global_commit = self.SendVoteRequestToParticipants()
-            span.add_event(f"Global commit: {global_commit}")
-            print(f"global_commit ={type(global_commit)}= {global_commit}")
-
-            with futures.ThreadPoolExecutor() as executor:
-                payment_future = executor.submit(send_execute_request_to_payment_executor, global_commit)
-            
-                database_futures_list = []
-                for item in order.items:
-                    future = executor.submit(send_execute_request_to_book_database, global_commit, item)
-                    database_futures_list.append(future)
 
-                futures.wait([payment_future] + database_futures_list, return_when=futures.ALL_COMPLETED)
-                
-            # Check all future results for True
-            payment_success = payment_future.result()
-            database_all_success = all(future.result() for future in database_futures_list)
+            transaction = self.decision_log.transaction(order.orderId)
+            if transaction is not None and transaction.commit is not None:
+                # Delivered again after its decision was taken: only the decision is sent again.
+                payment_success, database_all_success = self.complete_transactions([transaction])[order.orderId]
+            elif self.group_commit is not None:
+                payment_success, database_all_success = self.group_commit.execute(order)
+            else:
+                payment_success, database_all_success = self.run_two_phase_commit(order, span)
 
             if payment_success and database_all_success:
                 print("[Order Executor] Payment execution is successful")
@@ -204,56 +271,184 @@ class OrderExecutorService(order_executor_grpc.OrderExecutorServiceServicer):
                     Send mail or call to the user contact: {order.user.contact} user name: {order.user.name}')   
 
             print(f"Order with id {order.orderId} with priority {order.priority} has been executed by executor Replica-{replica_id} ...")
-            time.sleep(30)  # Simulate time taken to process the order
-            self.is_busy = False
+            self.latency.inject([order], 'execute')
+            order_status.add(-1)
+
+    def run_two_phase_commit(self, order, span):
+        self.decision_log.prepare([order])
+        try:
+            self.latency.inject([order], 'vote')
+            global_commit = self.SendVoteRequestToParticipants(order)
+        except Exception:
+            # Forgotten undecided transactions are presumed aborted.
+            self.decision_log.end([order.orderId])
+            raise
+        self.decision_log.decide({order.orderId: global_commit})
+        span.add_event(f"Global commit: {global_commit}")
+        print(f"global_commit ={type(global_commit)}= {global_commit}")
+
+        payment_future = participant_calls.submit(self.after_delay, 'payment', order, send_execute_request_to_payment_executor, global_commit, order.orderId)
+        database_future = participant_calls.submit(self.after_delay, 'stock', order, send_execute_request_to_book_database, global_commit, order)
+
+        futures.wait([payment_future, database_future], return_when=futures.ALL_COMPLETED)
+            
+        # Check all future results for True
+        payment_success = payment_future.result()
+        database_all_success = database_future.result()
+        self.decision_log.end([order.orderId])
+
+        return payment_success, database_all_success
+
+    def after_delay(self, stage, order, call, *args):
+        self.latency.inject([order], stage)
+        return call(*args)
+
+    def complete_transactions(self, transactions):
+        # Phase 2 of transactions left unfinished: the undecided ones are aborted, the decisions are sent again.
+        # Returns {orderId: (payment success, stock success)}.
+        undecided = {transaction.order.orderId: False for transaction in transactions if transaction.commit is None}
+        if undecided:
+            self.decision_log.decide(undecided)
+        decisions = {transaction.order.orderId: bool(transaction.commit) for transaction in transactions}
+        results = send_decisions([transaction.order for transaction in transactions], decisions, participant_calls)
+        self.decision_log.end(decisions)
+        return results
+
+    def recover(self):
+        # Replays the decision log and finishes the transactions a previous run left in doubt,
+        # before any new order is taken.
+        transactions = self.decision_log.open()
+        if not transactions:
+            return
+        undecided = sum(transaction.commit is None for transaction in transactions)
+        print(f"Replica-{replica_id} recovering {len(transactions)} transactions, aborting {undecided} undecided ones.")
+        while True:
+            try:
+                results = self.complete_transactions(transactions)
+                break
+            except grpc.RpcError as e:
+                print(f"Replica-{replica_id} could not reach the participants to recover: {e.code()}")
+                time.sleep(RECOVERY_RETRY_SECONDS)
+        for transaction in transactions:
+            payment_success, stock_success = results[transaction.order.orderId]
+            print(f"Recovered order {transaction.order.orderId}: {'GLOBAL COMMIT' if transaction.commit else 'GLOBAL ABORT'}, "
+                  f"payment success: {payment_success}, stock success: {stock_success}")
+
+    def QueryDecision(self, request, context):
+        decided, commit = self.decision_log.decision(request.orderId)
+        return order_executor.QueryDecisionResponse(decided=decided, commit=commit)
+
+    def process_order(self, stub, order):
+        # Runs on a worker. The order is acknowledged once it is executed, committed or aborted.
+        # If the execution fails, it is handed back to the queue for another replica.
+        # If the queue can't be reached, the lease of the order expires and the queue hands it out again.
+        try:
+            if not stub.ExtendLease(order_queue.ExtendLeaseRequest(orderId=order.orderId, visibilityTimeoutMs=ORDER_LEASE_MS)).success:
+                print(f"The lease of order {order.orderId} expired before its execution, skipping it.")
+                return
+        except grpc.RpcError as e:
+            print(f"Could not extend the lease of order {order.orderId}, skipping it: {e.code()}")
+            return
+        try:
+            self.execute_order(order)
+        except Exception as e:
+            print(f"Execution of order {order.orderId} failed: {e}")
+            order_status.add(-1)
+            try:
+                stub.Nack(order_queue.NackRequest(orderId=order.orderId))
+            except grpc.RpcError as e:
+                print(f"Could not hand order {order.orderId} back to the queue: {e.code()}")
+            return
+        try:
+            stub.Ack(order_queue.AckRequest(orderId=order.orderId))
+        except grpc.RpcError as e:
+            print(f"Could not acknowledge order {order.orderId}, its lease will expire: {e.code()}")
+
+    def dequeue_batch(self, stub):
+        # Long poll: an order enqueued while the queue is empty is returned right away.
+        # Only as many orders as there are free workers, so every order starts as soon as it is dequeued.
+        return stub.DequeueBatch(order_queue.DequeueBatchRequest(
+            maxOrders=min(DEQUEUE_BATCH_SIZE, self.workers.free_slots()),
+            maxBytes=DEQUEUE_BATCH_BYTES,
+            waitMs=DEQUEUE_WAIT_MS,
+            visibilityTimeoutMs=ORDER_LEASE_MS,
+            partitions=owned_partitions,
+            steal=STEAL_ORDERS
+        ), timeout=DEQUEUE_WAIT_MS / 1000 + 5)
+
+    def consume_orders(self):
+        # Lease mode: no token, the replicas dequeue concurrently.
+        stub = get_stub('order_queue:50054', order_queue_grpc.OrderQueueServiceStub)
+        while True:
+            self.workers.wait_for_slot()
+            try:
+                response = self.dequeue_batch(stub)
+            except grpc.RpcError as e:
+                print(f"Replica-{replica_id} could not reach the order queue: {e.code()}")
+                time.sleep(1)
+                continue
+            if response.success:
+                print(f"Replica-{replica_id} dequeued {len(response.orders)} orders")
+            for order in response.orders:
+                self.workers.submit(self.process_order, stub, order)
 
     def dequeue_order(self):
         while True:
+            # Wait for the token instead of polling for it.
+            with self.token_condition:
+                self.token_condition.wait_for(lambda: self.has_token)
             if self.has_token:
-                if not self.is_busy:
-                    with grpc.insecure_channel('order_queue:50054') as channel:
-                        stub = order_queue_grpc.OrderQueueServiceStub(channel)
-                        response = stub.Dequeue(order_queue.DequeueRequest())
-                        if response.success:
-                            print(f"Replica-{replica_id} has entered the critical region and dequeued an order")
-                            self.pass_token()
-
-                            #send vote response. 
-                            self.execute_order(response.order)
-                        else:
-                            self.pass_token()
+                if self.workers.free_slots() > 0:
+                    stub = get_stub('order_queue:50054', order_queue_grpc.OrderQueueServiceStub)
+                    try:
+                        response = self.dequeue_batch(stub)
+                    except grpc.RpcError as e:
+                        # The token goes on, so the other replicas keep dequeuing.
+                        print(f"Replica-{replica_id} could not reach the order queue: {e.code()}")
+                        self.pass_token()
+                        time.sleep(1)
+                        continue
+                    if response.success:
+                        print(f"Replica-{replica_id} has entered the critical region and dequeued {len(response.orders)} orders")
+                        self.pass_token()
+
+                        #send vote response. 
+                        for order in response.orders:
+                            self.workers.submit(self.process_order, stub, order)
+                    else:
+                        self.pass_token()
                 else:
                     print(f"Replica-{replica_id} is busy.")
                     self.pass_token()
 
-            time.sleep(20)  # delay then check if you have token
-
     def pass_token(self):
+        # Give up the token before passing it, since the token can now come back before PassToken returns.
+        with self.token_condition:
+            self.has_token = False
         for i in range(0, total_replicas):
             next_replica_id = (replica_id + i) % total_replicas + 1
             next_replica_address = f'order_executor_{next_replica_id}:50055'
         
             # making the token ring fault-tolerant so token does not get stuck with a dead replica
             try:
-                with grpc.insecure_channel(next_replica_address) as channel:
-                    stub = order_executor_grpc.OrderExecutorServiceStub(channel)
-                    health_response = stub.CheckHealth(order_executor.HealthCheckRequest(), timeout=5)
-                    if health_response.alive:
-                        stub.PassToken(order_executor.Token(token=str(next_replica_id)))
-                        break # stop looking for next viable replica
-                    else:
-                        print(f"Replica-{next_replica_id} did not respond.")
+                stub = get_stub(next_replica_address, order_executor_grpc.OrderExecutorServiceStub)
+                health_response = stub.CheckHealth(order_executor.HealthCheckRequest(), timeout=5)
+                if health_response.alive:
+                    stub.PassToken(order_executor.Token(token=str(next_replica_id)))
+                    break # stop looking for next viable replica
+                else:
+                    print(f"Replica-{next_replica_id} did not respond.")
             except grpc.RpcError as e:
                     print(f"Could not reach Replica-{next_replica_id}: Inactive Service")
-        self.has_token = False
         print(f"Replica-{replica_id} passed token to Replica-{next_replica_id}.")
 
 
 def serve():
     # Create a gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor())
+    server = create_server()
     # Add OrderExecutorService
-    executor_service = OrderExecutorService()
+    log_directory = os.path.join(DECISION_LOG_DIR, f'replica-{replica_id}') if DECISION_LOG_DIR else ''
+    executor_service = OrderExecutorService(decision_log=DecisionLog(log_directory, order_queue.Order))
     order_executor_grpc.add_OrderExecutorServiceServicer_to_server(executor_service, server)
     # Listen on port 50055
     port = "50055"
@@ -261,7 +456,13 @@ def serve():
     # Start the server
     server.start()
     print("Server started. Listening on port 50055.")
-    executor_service.dequeue_order()  # Start processing orders
+    # The server answers QueryDecision while the replica recovers.
+    executor_service.recover()
+    # Start processing orders
+    if EXECUTOR_MODE == 'token':
+        executor_service.dequeue_order()
+    else:
+        executor_service.consume_orders()
     # Keep thread alive
     server.wait_for_termination()
 
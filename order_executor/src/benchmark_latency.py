@@ -0,0 +1,71 @@
+"""
+Order execution throughput of an executor replica with and without a latency-injection profile.
+
+    python order_executor/src/benchmark_latency.py --orders 8 --workers 4 --profiles none demo
+
+It executes orders against the running payment executor and book database, so it runs inside the deployment,
+e.g. with docker compose exec order_executor_1. Each profile runs the same number of orders through
+OrderExecutorService.execute_order on its own pool of workers, without the order queue. "none" is the default
+path, the other profiles are LATENCY_PROFILE values. The orders take copies of --book, so the later orders of
+a run abort once its stock is gone, which doesn't change the delays.
+"""
+import os
+import uuid
+import time
+import argparse
+import statistics
+import contextlib
+from concurrent import futures
+
+from app import OrderExecutorService, OrderWorkers, order_queue
+from latency_profile import LatencyProfile
+
+
+def make_order(book_id):
+    return order_queue.Order(
+        orderId=str(uuid.uuid4()),
+        user=order_queue.User(name="John", contact="12345678"),
+        items=[order_queue.Item(book=order_queue.Book(id=book_id, title="Benchmark"), quantity=1)],
+        creditCard=order_queue.CreditCard(number="4111111111111111", expirationDate="12/25", cvv="123"),
+        address=order_queue.BillingAddress(street="a", city="b", state="c", zip="1", country="Finland"),
+    )
+
+def timed(call, *args):
+    start = time.perf_counter()
+    call(*args)
+    return time.perf_counter() - start
+
+def run(profile, orders, workers, book_id):
+    latency = LatencyProfile() if profile == 'none' else LatencyProfile.load(profile)
+    service = OrderExecutorService(workers=OrderWorkers(workers), latency=latency)
+    requests = [make_order(book_id) for _ in range(orders)]
+
+    # The executor logs every phase. Keep the log out of the table.
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            latencies = list(executor.map(lambda order: timed(service.execute_order, order), requests))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "profile": profile,
+        "throughput": orders / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--orders", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--book", default="2", help="id of the book the orders take")
+    parser.add_argument("--profiles", nargs="+", default=["none", "demo"])
+    args = parser.parse_args()
+
+    print(f"{'profile':<12}{'orders/s':>10}{'p50 ms':>11}{'max ms':>11}")
+    for profile in args.profiles:
+        result = run(profile, args.orders, args.workers, args.book)
+        print(f"{result['profile'][:12]:<12}{result['throughput']:>10.2f}{result['p50_ms']:>11.1f}{result['max_ms']:>11.1f}")
+
+if __name__ == '__main__':
+    main()
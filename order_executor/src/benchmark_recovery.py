@@ -0,0 +1,81 @@
+"""
+Recovery time of the 2PC decision log against its size.
+
+    python order_executor/src/benchmark_recovery.py --transactions 1000 10000 100000 --in-doubt 1
+
+For each size, the log of a replica is filled with that many transactions, of which --in-doubt percent are
+left unfinished (half undecided, half decided) and the others ended, without compaction, as if the replica
+crashed before the log reached DECISION_LOG_COMPACT_RECORDS. Recovery replays the log and rewrites it with the
+unfinished transactions. The phase 2 requests sent afterwards depend on the participants, not on the log size.
+"""
+import os
+import time
+import argparse
+import tempfile
+
+from app import order_queue
+from decision_log import DecisionLog, LOG_FILE
+
+BATCH = 1000
+
+
+def make_order(index):
+    return order_queue.Order(
+        orderId=f"order-{index}",
+        user=order_queue.User(name="John", contact="12345678"),
+        items=[order_queue.Item(book=order_queue.Book(id="1", title="Learning Python", price=10.0), quantity=1)],
+        creditCard=order_queue.CreditCard(number="4111111111111111", expirationDate="12/25", cvv="123"),
+        address=order_queue.BillingAddress(street="a", city="b", state="c", zip="1", country="Finland"),
+        priority=index,
+    )
+
+def fill(directory, transactions, in_doubt_percent):
+    # Every transaction is prepared and decided. One in `every` is left unfinished, alternately before and after the decision.
+    every = int(100 / in_doubt_percent) if in_doubt_percent > 0 else 0
+    log = DecisionLog(directory, order_queue.Order, compact_records=float('inf'))
+    log.open()
+    unfinished = 0
+    for start in range(0, transactions, BATCH):
+        orders = [make_order(index) for index in range(start, min(start + BATCH, transactions))]
+        log.prepare(orders)
+        in_doubt = [order.orderId for order in orders if every and int(order.orderId.split('-')[1]) % every == 0]
+        undecided = set(in_doubt[::2])
+        log.decide({order.orderId: True for order in orders if order.orderId not in undecided})
+        log.end([order.orderId for order in orders if order.orderId not in in_doubt])
+        unfinished += len(in_doubt)
+    log.close()
+    return unfinished
+
+def run(transactions, in_doubt_percent, directory):
+    unfinished = fill(directory, transactions, in_doubt_percent)
+    size = os.path.getsize(os.path.join(directory, LOG_FILE))
+    log = DecisionLog(directory, order_queue.Order)
+    start = time.perf_counter()
+    recovered = log.open()
+    elapsed = time.perf_counter() - start
+    log.close()
+    assert len(recovered) == unfinished
+    return {
+        "transactions": transactions,
+        "records": 3 * transactions - unfinished - sum(transaction.commit is None for transaction in recovered),
+        "log_mb": size / 1024 / 1024,
+        "in_doubt": unfinished,
+        "recovery_ms": elapsed * 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--transactions", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--in-doubt", type=float, default=1.0, help="percent of the transactions left unfinished")
+    parser.add_argument("--dir", default=None, help="parent directory of the logs")
+    args = parser.parse_args()
+
+    print(f"{'transactions':>12}{'records':>10}{'log MB':>9}{'in doubt':>10}{'recovery ms':>13}{'records/ms':>12}")
+    for transactions in args.transactions:
+        with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+            result = run(transactions, args.in_doubt, directory)
+        print(f"{result['transactions']:>12}{result['records']:>10}{result['log_mb']:>9.2f}{result['in_doubt']:>10}"
+              f"{result['recovery_ms']:>13.1f}{result['records'] / result['recovery_ms']:>12.0f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+import os
+import struct
+import zlib
+import threading
+
+# Directory of the 2PC decision log of the replica. Empty keeps the decisions in memory only.
+DECISION_LOG_DIR = os.getenv('DECISION_LOG_DIR', '')
+# The log is rewritten with the unfinished transactions only, once it has COMPACT_RECORDS records.
+COMPACT_RECORDS = int(os.getenv('DECISION_LOG_COMPACT_RECORDS', '10000'))
+
+# Record: length and crc32 of the payload, then the payload.
+# Payload: one type byte, then the serialized Order (prepare) or the order id.
+HEADER = struct.Struct('<II')
+PREPARE = b'P'  # The votes are about to be requested.
+COMMIT = b'C'
+ABORT = b'A'
+END = b'F'  # Every participant has received the decision, the transaction is forgotten.
+
+LOG_FILE = 'decisions.log'
+
+
+def encode_record(record_type, data):
+    payload = record_type + data
+    return HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+def read_records(path):
+    # Yields (type, data) for every complete record. A torn record at the end, after a crash, ends the file.
+    with open(path, 'rb') as f:
+        data = f.read()
+    offset = 0
+    while offset + HEADER.size <= len(data):
+        length, crc = HEADER.unpack_from(data, offset)
+        payload = data[offset + HEADER.size:offset + HEADER.size + length]
+        if length == 0 or len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        yield payload[:1], payload[1:]
+        offset += HEADER.size + length
+
+
+class Transaction:
+    def __init__(self, order, commit=None):
+        self.order = order
+        # None until the coordinator has decided, then whether it is a global commit.
+        self.commit = commit
+
+
+class DecisionLog:
+    """
+    Durable log of the 2PC transactions a replica coordinates, one per order id.
+    The prepare record is written before the votes are requested and the decision before it is sent,
+    both fsynced, so a replica that restarts knows every transaction it may have left in doubt.
+    The end record is written once every participant has the decision. It isn't fsynced: after a crash,
+    the decision is sent again, which the participants ignore.
+
+    Presumed abort: a transaction without a record, e.g. forgotten after its end, is reported as aborted.
+    Participants only ask before they have received the decision, so a committed transaction is never forgotten
+    while one of them may still ask.
+    """
+
+    def __init__(self, directory, order_class, compact_records=COMPACT_RECORDS):
+        self.directory = directory
+        self.order_class = order_class
+        self.compact_records = compact_records
+        self.lock = threading.Lock()
+        # orderId: Transaction, for the transactions that haven't ended.
+        self.transactions = {}
+        self.records_in_log = 0
+        self._file = None
+
+    def open(self):
+        """
+        Replay the log and rewrite it with the unfinished transactions only.
+        Returns the transactions the replica left unfinished, undecided ones (commit None) first.
+        """
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, LOG_FILE)
+            if os.path.exists(path):
+                for record_type, data in read_records(path):
+                    if record_type == PREPARE:
+                        order = self.order_class.FromString(data)
+                        self.transactions[order.orderId] = Transaction(order)
+                    elif record_type in (COMMIT, ABORT):
+                        transaction = self.transactions.get(data.decode())
+                        if transaction is not None:
+                            transaction.commit = record_type == COMMIT
+                    elif record_type == END:
+                        self.transactions.pop(data.decode(), None)
+            self._compact()
+        return sorted(self.transactions.values(), key=lambda transaction: transaction.commit is not None)
+
+    def _compact(self):
+        # Called with the lock held, or before the log is shared. A crash leaves the old or the new log.
+        path = os.path.join(self.directory, LOG_FILE)
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'wb') as f:
+            for transaction in self.transactions.values():
+                f.write(self._records(transaction))
+            f.flush()
+            os.fsync(f.fileno())
+        if self._file is not None:
+            self._file.close()
+        os.replace(temporary_path, path)
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        self._file = open(path, 'ab', buffering=0)
+        self.records_in_log = sum(1 if transaction.commit is None else 2 for transaction in self.transactions.values())
+
+    def _records(self, transaction):
+        records = encode_record(PREPARE, transaction.order.SerializeToString())
+        if transaction.commit is not None:
+            records += encode_record(COMMIT if transaction.commit else ABORT, transaction.order.orderId.encode())
+        return records
+
+    def _write(self, records, count, sync):
+        # Called with the lock held. One write and at most one fsync for the records of a whole batch.
+        if self._file is None:
+            return
+        self._file.write(records)
+        self.records_in_log += count
+        if sync:
+            os.fsync(self._file.fileno())
+
+    def prepare(self, orders):
+        with self.lock:
+            for order in orders:
+                self.transactions[order.orderId] = Transaction(order)
+            self._write(b''.join(encode_record(PREPARE, order.SerializeToString()) for order in orders), len(orders), sync=True)
+
+    def decide(self, decisions):
+        # decisions: {orderId: global commit}
+        with self.lock:
+            for order_id, commit in decisions.items():
+                self.transactions[order_id].commit = commit
+            self._write(b''.join(encode_record(COMMIT if commit else ABORT, order_id.encode())
+                                 for order_id, commit in decisions.items()), len(decisions), sync=True)
+
+    def end(self, order_ids):
+        with self.lock:
+            for order_id in order_ids:
+                self.transactions.pop(order_id, None)
+            self._write(b''.join(encode_record(END, order_id.encode()) for order_id in order_ids), len(order_ids), sync=False)
+            if self._file is not None and self.records_in_log >= self.compact_records:
+                self._compact()
+
+    def transaction(self, order_id):
+        with self.lock:
+            return self.transactions.get(order_id)
+
+    def decision(self, order_id):
+        # (decided, commit) of a transaction, with presumed abort for the ones the log doesn't know.
+        with self.lock:
+            transaction = self.transactions.get(order_id)
+        if transaction is None:
+            return True, False
+        return transaction.commit is not None, bool(transaction.commit)
+
+    def close(self):
+        with self.lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,139 @@
+import threading
+from concurrent import futures
+
+from opentelemetry import trace
+
+from shared.channels import get_stub
+from book_database import book_database_pb2 as book_database
+from book_database import book_database_pb2_grpc as book_database_grpc
+from payment_executor import payment_executor_pb2 as payment_executor
+from payment_executor import payment_executor_pb2_grpc as payment_executor_grpc
+
+tracer = trace.get_tracer(__name__)
+
+
+class GroupCommit:
+    """
+    Runs the orders of concurrent workers through one prepare/commit round, so each participant receives
+    one vote request and one commit request per batch instead of per order.
+    Each order is decided on its own: an order a participant votes against is aborted, the others commit.
+
+    The first order of a batch waits for the window (or for the batch to fill up) and runs the round,
+    the workers of the other orders wait for their result.
+    """
+
+    def __init__(self, window_ms, max_orders, decision_log, coordinator, latency, executor):
+        self.decision_log = decision_log
+        self.latency = latency
+        # Runs the requests to the participants.
+        self.executor = executor
+        # Address the participants ask for a decision they didn't receive.
+        self.coordinator = coordinator
+        self.window_seconds = window_ms / 1000
+        self.max_orders = max_orders
+        self.condition = threading.Condition()
+        # (order, future) of the batch being gathered.
+        self.pending = []
+
+    def execute(self, order):
+        # Returns (payment success, stock success) of the order.
+        future = futures.Future()
+        with self.condition:
+            self.pending.append((order, future))
+            leader = len(self.pending) == 1
+            if len(self.pending) >= self.max_orders:
+                self.condition.notify_all()
+            if leader:
+                self.condition.wait_for(lambda: len(self.pending) >= self.max_orders, timeout=self.window_seconds)
+                batch, self.pending = self.pending, []
+        if leader:
+            try:
+                results = self.run_round([order for order, _ in batch])
+            except Exception as e:
+                for _, waiting in batch:
+                    waiting.set_exception(e)
+            else:
+                for batch_order, waiting in batch:
+                    waiting.set_result(results[batch_order.orderId])
+        return future.result()
+
+    def run_round(self, orders):
+        with tracer.start_as_current_span("group_commit") as span:
+            span.set_attribute("orders", len(orders))
+            stock = [order_stock(order) for order in orders]
+
+            # Phase 1: one vote request per participant for the whole batch.
+            self.decision_log.prepare(orders)
+            try:
+                self.latency.inject(orders, 'vote')
+                payment_votes = self.executor.submit(vote_payment, orders, self.coordinator)
+                stock_votes = self.executor.submit(vote_stock, stock)
+                futures.wait([payment_votes, stock_votes])
+                payment_votes, stock_votes = payment_votes.result(), stock_votes.result()
+            except Exception:
+                # Forgotten undecided transactions are presumed aborted.
+                self.decision_log.end([order.orderId for order in orders])
+                raise
+            decisions = {order.orderId: payment_votes.get(order.orderId, False) and stock_votes.get(order.orderId, False)
+                         for order in orders}
+            self.decision_log.decide(decisions)
+            span.add_event(f"Global commit of {sum(decisions.values())} of {len(orders)} orders")
+            print(f"Phase 2a - Group commit: GLOBAL COMMIT for {sum(decisions.values())} orders, GLOBAL ABORT for {len(orders) - sum(decisions.values())}")
+
+            # The decisions go out together, after the longer of the two delays.
+            self.latency.inject(orders, 'payment', 'stock')
+            results = send_decisions(orders, decisions, self.executor)
+            self.decision_log.end(decisions)
+            return results
+
+
+def order_stock(order):
+    return book_database.OrderStock(
+        orderId=order.orderId,
+        items=[book_database.StockItem(bookId=item.book.id, quantity=item.quantity) for item in order.items]
+    )
+
+def send_decisions(orders, decisions, executor):
+    # Phase 2: the payment gets every decision, the database the committed orders to take their stock and
+    # the aborted ones to release their reservation. The requests run in parallel on `executor`.
+    # Returns {orderId: (payment success, stock success)}.
+    committed = [order_stock(order) for order in orders if decisions[order.orderId]]
+    aborted = [order_stock(order) for order in orders if not decisions[order.orderId]]
+    payment_results = executor.submit(execute_payments, decisions)
+    stock_results = executor.submit(commit_stock, committed) if committed else None
+    abort_results = executor.submit(abort_stock, aborted) if aborted else None
+    futures.wait([result for result in (payment_results, stock_results, abort_results) if result is not None])
+    payment_results = payment_results.result()
+    stock_results = stock_results.result() if stock_results is not None else {}
+    if abort_results is not None:
+        abort_results.result()
+    return {order.orderId: (payment_results.get(order.orderId, False), stock_results.get(order.orderId, False))
+            for order in orders}
+
+def vote_payment(orders, coordinator):
+    stub = get_stub('payment_executor:50059', payment_executor_grpc.PaymentExecutorServiceStub)
+    response = stub.SendBatchVoteToCoordinator(payment_executor.BatchVoteRequest(
+        orderIds=[order.orderId for order in orders], coordinator=coordinator
+    ))
+    return {vote.orderId: vote.commit for vote in response.votes}
+
+def vote_stock(stock):
+    stub = get_stub('book_database_1:50056', book_database_grpc.BookDatabaseServiceStub)
+    response = stub.VoteStockBatch(book_database.StockBatchRequest(orders=stock))
+    return {vote.orderId: vote.commit for vote in response.votes}
+
+def execute_payments(decisions):
+    stub = get_stub('payment_executor:50059', payment_executor_grpc.PaymentExecutorServiceStub)
+    response = stub.ExecutePaymentBatch(payment_executor.BatchExecutionRequest(decisions=[
+        payment_executor.OrderDecision(orderId=order_id, commit=commit) for order_id, commit in decisions.items()
+    ]))
+    return {result.orderId: result.success for result in response.results}
+
+def commit_stock(stock):
+    stub = get_stub('book_database_1:50056', book_database_grpc.BookDatabaseServiceStub)
+    response = stub.CommitStockBatch(book_database.StockBatchRequest(orders=stock))
+    return {result.orderId: result.success for result in response.results}
+
+def abort_stock(stock):
+    stub = get_stub('book_database_1:50056', book_database_grpc.BookDatabaseServiceStub)
+    stub.AbortStockBatch(book_database.StockBatchRequest(orders=stock))
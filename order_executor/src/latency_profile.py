@@ -0,0 +1,61 @@
+import os
+import json
+import time
+
+# Opt-in latency injection, to simulate slow stages of an order. Empty (the default) injects nothing.
+# Either "demo", the delays the executor used to have, or a JSON object (inline or the path of a file)
+# with the delay in ms of each stage, for every order or per book id:
+#   {"stock": {"default": 20000, "1": 0}, "execute": 30000}
+LATENCY_PROFILE = os.getenv('LATENCY_PROFILE', '')
+
+# vote: before the vote requests. payment, stock: before the decision is sent to that participant.
+# execute: after the order is executed, while its worker stays busy.
+STAGES = ('vote', 'payment', 'stock', 'execute')
+
+PROFILES = {
+    'demo': {"stock": {"default": 20000, "1": 0}, "execute": 30000},
+}
+
+
+class LatencyProfile:
+    """
+    Delays injected at the stages of the execution of an order. A stage set per book waits for the slowest book
+    of the orders, as the books of an order are handled in parallel.
+    """
+
+    def __init__(self, stages=None, sleep=time.sleep):
+        self.stages = stages or {}
+        unknown = set(self.stages) - set(STAGES)
+        if unknown:
+            raise ValueError(f"Unknown latency stages {sorted(unknown)}, expected some of {STAGES}.")
+        self.sleep = sleep
+
+    @classmethod
+    def load(cls, spec=LATENCY_PROFILE):
+        spec = spec.strip()
+        if not spec:
+            return cls()
+        if spec in PROFILES:
+            return cls(PROFILES[spec])
+        if spec.startswith('{'):
+            return cls(json.loads(spec))
+        with open(spec) as f:
+            return cls(json.load(f))
+
+    def delay_ms(self, stage, orders):
+        setting = self.stages.get(stage, 0)
+        if not isinstance(setting, dict):
+            return setting
+        default = setting.get('default', 0)
+        return max((setting.get(item.book.id, default) for order in orders for item in order.items), default=default)
+
+    def inject(self, orders, *stages):
+        # Sleeps for the longest delay of the stages. Returns it in ms.
+        delay = max((self.delay_ms(stage, orders) for stage in stages), default=0)
+        if delay > 0:
+            print(f"[Latency profile] {'/'.join(stages)}: adding a delay of {delay} ms")
+            self.sleep(delay / 1000)
+        return delay
+
+    def __bool__(self):
+        return bool(self.stages)
@@ -1,7 +1,8 @@
 import sys
 import os
 from datetime import datetime
-import queue
+import threading
+import time
 
 # This set of lines are needed to import the gRPC stubs.
 # The path of the stubs is relative to the current file, or absolute inside the container.
@@ -9,42 +10,241 @@ import queue
 FILE = __file__ if '__file__' in globals() else os.getenv("PYTHONFILE", "")
 utils_path = os.path.abspath(os.path.join(FILE, '../../../utils/pb'))
 sys.path.insert(0, utils_path)
+shared_path = os.path.abspath(os.path.join(FILE, '../../../utils'))
+sys.path.insert(0, shared_path)
+from shared.server import create_server
 
 from order_queue import order_queue_pb2 as order_queue
 from order_queue import order_queue_pb2_grpc as order_queue_grpc
 
-import grpc
-from concurrent import futures
+from wal import WriteAheadLog, WAL_DIR, COMPACT_SECONDS, COMPACT_RECORDS
+from order_heap import OrderHeap
+from leases import LeaseTable, VISIBILITY_TIMEOUT_MS, MAX_DELIVERIES
 
-# Transaction flow check by order id.
-order_id_from_orchestrator = ""
+# Defaults of GetQueueStats.
+DEFAULT_TOP_K = 10
+DEFAULT_BUCKET_WIDTH = 1.0
+# Upper bound of the waitMs of a long-poll dequeue, since a waiting call holds a server thread.
+MAX_WAIT_MS = int(os.getenv('ORDER_QUEUE_MAX_WAIT_MS', '30000'))
+# How often expired leases are looked for, so their orders are queued again without waiting for a dequeue.
+LEASE_CHECK_SECONDS = float(os.getenv('ORDER_QUEUE_LEASE_CHECK_SECONDS', '1'))
+# Number of partitions of the queue, each with its own heap, lock and log. See partitioned_queue.py.
+PARTITIONS = int(os.getenv('ORDER_QUEUE_PARTITIONS', '1'))
     
 class OrderQueueService(order_queue_grpc.OrderQueueServiceServicer):
-    def __init__(self):
-        # The Order Queue
-        self.order_queue = queue.PriorityQueue()
+    def __init__(self, wal=None, clock=time.monotonic):
+        # The Order Queue, a heap keyed by (effective priority, sequence)
+        self.order_queue = OrderHeap(clock=clock)
+        # Orders queue changes and their records in the log.
+        self.lock = threading.Lock()
+        # Wakes up the long-poll dequeues waiting for an order.
+        self.not_empty = threading.Condition(self.lock)
+        # Dequeued orders waiting for an Ack, and the orders that failed MAX_DELIVERIES times.
+        self.leases = LeaseTable(clock=clock)
+        self.dead_letters = {}
+        # The optional write-ahead log. The queue is rebuilt from it on startup.
+        # Orders that were leased but not acknowledged are queued again.
+        self.wal = wal
+        if self.wal is not None:
+            orders, dead_letters = self.wal.replay()
+            for order, enqueued_at in orders:
+                # The order keeps its age, including the time the queue was down.
+                self.order_queue.push(order, enqueued_at=self.order_queue.now() - max(0.0, time.time() - enqueued_at))
+            self.dead_letters = {order.orderId: order for order in dead_letters}
+            print(f"Replayed {len(orders)} orders and {len(dead_letters)} dead letters from the write-ahead log.")
+
+    def compact(self):
+        # Replace the log with a snapshot of the queue. Leased orders are kept until they are acknowledged.
+        with self.lock:
+            now = time.time()
+            # Leased orders age again from the time they are queued again, as after their lease expires.
+            orders = ([(order, now - self.order_queue.age(order.orderId)) for order, _ in self.order_queue.entries()]
+                      + [(order, now) for order in self.leases.orders()])
+            dead_letters = list(self.dead_letters.values())
+            generation = self.wal.rotate()
+        self.wal.write_snapshot(generation, orders, dead_letters)
+        print(f"Compacted the write-ahead log into a snapshot of {len(orders)} orders.")
+
+    def compact_periodically(self, interval=COMPACT_SECONDS, min_records=COMPACT_RECORDS):
+        while True:
+            time.sleep(interval)
+            if self.wal.records_in_log >= min_records:
+                self.compact()
 
     def Enqueue(self, request, context):
-        self.order_queue.put((request.order.priority, request.order))
-        print(f"Enqueued order with id:{request.order.orderId} and priority: {request.order.priority}")
-        print(f"Queue size: {self.order_queue.qsize()}")
-        print("Elements in Queue Now:")
-        print(self.order_queue.queue)  
-        print("QUEUE LIST DONE\n")
+        with self.lock:
+            self.order_queue.push(request.order)
+            sequence = self.wal.append_enqueue(request.order, time.time()) if self.wal is not None else None
+            self.not_empty.notify()
+        # The order is acknowledged only when its record is durable. Concurrent enqueues share the fsync.
+        if sequence is not None:
+            self.wal.sync(sequence)
         return order_queue.EnqueueResponse(success=True)
 
+    def wait_for_order(self, wait_ms, context):
+        # Called with the lock held. Returns whether the queue has an order.
+        deadline = time.monotonic() + min(wait_ms, MAX_WAIT_MS) / 1000
+        while not self.order_queue:
+            remaining = deadline - time.monotonic()
+            # Stop waiting when the caller has gone away.
+            if remaining <= 0 or (context is not None and not context.is_active()):
+                return False
+            self.not_empty.wait(min(remaining, 1.0))
+        return True
+
+    def requeue(self, order):
+        # Called with the lock held, after the lease of the order ended without an Ack.
+        # Queue the order again, or dead-letter it once it was delivered MAX_DELIVERIES times.
+        # Returns the sequence number of the log record, if any.
+        if self.leases.deliveries.get(order.orderId, 0) >= MAX_DELIVERIES:
+            self.leases.forget(order.orderId)
+            self.dead_letters[order.orderId] = order
+            print(f"Order {order.orderId} moved to the dead-letter queue after {MAX_DELIVERIES} deliveries.")
+            return self.wal.append_dead_letter(order.orderId) if self.wal is not None else None
+        self.order_queue.push(order)
+        self.not_empty.notify()
+        return None
+
+    def requeue_expired_leases(self):
+        # Called with the lock held.
+        sequence = None
+        for order in self.leases.expired():
+            print(f"The lease of order {order.orderId} expired.")
+            sequence = self.requeue(order) or sequence
+        return sequence
+
+    def check_leases(self):
+        with self.lock:
+            sequence = self.requeue_expired_leases()
+        if sequence is not None:
+            self.wal.sync(sequence)
+
+    def requeue_expired_leases_periodically(self, interval=LEASE_CHECK_SECONDS):
+        while True:
+            time.sleep(interval)
+            self.check_leases()
+
     def Dequeue(self, request, context):
-        if not self.order_queue.empty():
-            _, order = self.order_queue.get()
-            print(f"Dequeued Succesfully. Queue size: {self.order_queue.qsize()}")
-            return order_queue.DequeueResponse(order=order, success=True)
-        return order_queue.DequeueResponse(success=False)
+        # The order stays in the log until it is acknowledged, so a dequeue writes no record.
+        with self.lock:
+            if not self.wait_for_order(request.waitMs, context):
+                return order_queue.DequeueResponse(success=False)
+            order = self.order_queue.pop()
+            attempt = self.leases.lease(order, request.visibilityTimeoutMs or VISIBILITY_TIMEOUT_MS)
+        print(f"Dequeued Succesfully. Queue size: {len(self.order_queue)}")
+        return order_queue.DequeueResponse(order=order, success=True, deliveryAttempt=attempt)
+
+    def DequeueBatch(self, request, context):
+        orders = []
+        size = 0
+        with self.lock:
+            self.wait_for_order(request.waitMs, context)
+            while self.order_queue and (request.maxOrders <= 0 or len(orders) < request.maxOrders):
+                order = self.order_queue.peek()
+                if orders and request.maxBytes > 0 and size + order.ByteSize() > request.maxBytes:
+                    break
+                self.order_queue.pop()
+                self.leases.lease(order, request.visibilityTimeoutMs or VISIBILITY_TIMEOUT_MS)
+                orders.append(order)
+                size += order.ByteSize()
+        if orders:
+            print(f"Dequeued a batch of {len(orders)} orders ({size} bytes). Queue size: {len(self.order_queue)}")
+        return order_queue.DequeueBatchResponse(orders=orders, success=bool(orders))
+
+    def Ack(self, request, context):
+        with self.lock:
+            order = self.leases.release(request.orderId)
+            if order is not None:
+                self.leases.forget(request.orderId)
+            sequence = self.wal.append_dequeue(request.orderId) if self.wal is not None and order is not None else None
+        if sequence is not None:
+            self.wal.sync(sequence)
+        return order_queue.AckResponse(success=order is not None)
+
+    def Nack(self, request, context):
+        with self.lock:
+            order = self.leases.release(request.orderId)
+            sequence = self.requeue(order) if order is not None else None
+            dead_lettered = request.orderId in self.dead_letters
+        if sequence is not None:
+            self.wal.sync(sequence)
+        return order_queue.NackResponse(success=order is not None, deadLettered=dead_lettered)
+
+    def ExtendLease(self, request, context):
+        with self.lock:
+            success = self.leases.extend(request.orderId, request.visibilityTimeoutMs or VISIBILITY_TIMEOUT_MS)
+        return order_queue.ExtendLeaseResponse(success=success)
+
+    def GetDeadLetters(self, request, context):
+        with self.lock:
+            orders = list(self.dead_letters.values())
+        return order_queue.DeadLettersResponse(orders=orders)
+
+    def Cancel(self, request, context):
+        # Only queued orders can be cancelled, a leased order is already being executed.
+        with self.lock:
+            order = self.order_queue.cancel(request.orderId)
+            sequence = self.wal.append_dequeue(request.orderId) if self.wal is not None and order is not None else None
+        if sequence is not None:
+            self.wal.sync(sequence)
+        return order_queue.CancelResponse(success=order is not None)
+
+    def Reprioritize(self, request, context):
+        with self.lock:
+            order = self.order_queue.reprioritize(request.orderId, request.priority)
+            # Logged again with its original enqueue time, so the order keeps its age after a restart.
+            sequence = (self.wal.append_enqueue(order, time.time() - self.order_queue.age(order.orderId))
+                        if self.wal is not None and order is not None else None)
+        if sequence is not None:
+            self.wal.sync(sequence)
+        return order_queue.ReprioritizeResponse(success=order is not None)
+
+    def GetQueueStats(self, request, context):
+        # The queue is inspected on demand, so Enqueue stays O(log n) without logging the queue.
+        top_k = request.topK or DEFAULT_TOP_K
+        bucket_width = request.bucketWidth or DEFAULT_BUCKET_WIDTH
+        with self.lock:
+            depth = len(self.order_queue)
+            oldest_age = self.order_queue.oldest_age()
+            histogram = self.order_queue.histogram(bucket_width)
+            top = self.order_queue.top(top_k)
+            leased = len(self.leases)
+            dead_lettered = len(self.dead_letters)
+        return order_queue.QueueStatsResponse(
+            depth=depth,
+            oldestAgeSeconds=oldest_age,
+            histogram=[order_queue.PriorityBucket(lowerBound=lower_bound, count=count) for lower_bound, count in histogram.items()],
+            top=[order_queue.QueuedOrder(
+                orderId=order.orderId,
+                priority=order.priority,
+                effectivePriority=effective_priority,
+                ageSeconds=age,
+                items=len(order.items)
+            ) for order, effective_priority, age in top],
+            leased=leased,
+            deadLettered=dead_lettered
+        )
 
 def serve():
     # Create a gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor())
+    server = create_server()
     # Add HelloService
-    order_queue_grpc.add_OrderQueueServiceServicer_to_server(OrderQueueService(), server)
+    replicated = bool(os.getenv('ORDER_QUEUE_RAFT_PARTNERS'))
+    if replicated:
+        # Replicated mode. pysyncobj is only needed, and imported, in this mode.
+        from replicated_queue import ReplicatedOrderQueueService, RAFT_SELF, RAFT_PARTNERS
+        service = ReplicatedOrderQueueService(RAFT_SELF, RAFT_PARTNERS)
+        print(f"Replicating the queue with Raft from {RAFT_SELF} to {', '.join(RAFT_PARTNERS)}.")
+    elif PARTITIONS > 1:
+        from partitioned_queue import PartitionedOrderQueueService
+        service = PartitionedOrderQueueService.create(PARTITIONS, WAL_DIR)
+        print(f"The queue has {PARTITIONS} partitions keyed by {service.key}.")
+    else:
+        service = OrderQueueService(WriteAheadLog(WAL_DIR, order_queue.Order) if WAL_DIR else None)
+    order_queue_grpc.add_OrderQueueServiceServicer_to_server(service, server)
+    threading.Thread(target=service.requeue_expired_leases_periodically, daemon=True).start()
+    if WAL_DIR and not replicated:
+        threading.Thread(target=service.compact_periodically, daemon=True).start()
     # Listen on port 50054
     port = "50054"
     server.add_insecure_port("[::]:" + port)
@@ -0,0 +1,108 @@
+"""
+Commit latency and throughput of the Raft-replicated order queue against the single-node queue.
+
+    python order_queue/src/benchmark_raft.py --orders 1000 --threads 16 --nodes 3
+
+Each mode runs the same Enqueue calls from concurrent threads, then dequeues and acknowledges every order.
+"single" is OrderQueueService in memory, "wal" adds the write-ahead log with group commit, "raft" is
+ReplicatedOrderQueueService with every node in this process on localhost. The raft requests go to a follower
+unless --leader is given, so they include the forwarding to the leader as in a real deployment.
+The commit latency of raft is mostly --append-entries-ms (ORDER_QUEUE_RAFT_APPEND_ENTRIES_MS).
+"""
+import os
+import time
+import argparse
+import tempfile
+import statistics
+import contextlib
+from concurrent import futures
+
+from app import OrderQueueService, order_queue
+from wal import WriteAheadLog
+from replicated_queue import ReplicatedOrderQueueService, raft_conf, RAFT_APPEND_ENTRIES_MS, RAFT_TICK_MS
+from benchmark_wal import make_order
+
+
+def timed(call, *args):
+    start = time.perf_counter()
+    call(*args)
+    return time.perf_counter() - start
+
+def dequeue_and_ack(service):
+    response = service.Dequeue(order_queue.DequeueRequest(), None)
+    service.Ack(order_queue.AckRequest(orderId=response.order.orderId), None)
+
+def start_cluster(nodes, base_port, append_entries_ms, tick_ms):
+    addresses = [f"127.0.0.1:{base_port + index}" for index in range(nodes)]
+    services = [
+        ReplicatedOrderQueueService(address, [partner for partner in addresses if partner != address],
+                                    conf=raft_conf(data_dir='', append_entries_ms=append_entries_ms, tick_ms=tick_ms),
+                                    commit_timeout=30)
+        for address in addresses
+    ]
+    deadline = time.monotonic() + 30
+    while not any(service.is_leader() for service in services):
+        if time.monotonic() > deadline:
+            raise RuntimeError("No leader was elected.")
+        time.sleep(0.1)
+    return services
+
+def run(mode, orders, threads, nodes, base_port, leader, append_entries_ms, tick_ms, directory):
+    cluster = []
+    if mode == 'raft':
+        cluster = start_cluster(nodes, base_port, append_entries_ms, tick_ms)
+        leaders = [service for service in cluster if service.is_leader()]
+        followers = [service for service in cluster if not service.is_leader()]
+        service = leaders[0] if leader or not followers else followers[0]
+    else:
+        wal = WriteAheadLog(directory, order_queue.Order, fsync_policy='group') if mode == 'wal' else None
+        service = OrderQueueService(wal)
+    requests = [order_queue.EnqueueRequest(order=make_order(index)) for index in range(orders)]
+
+    # The service logs every dequeue. Keep the log out of the table.
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        with futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            start = time.perf_counter()
+            enqueue_latencies = list(executor.map(lambda request: timed(service.Enqueue, request, None), requests))
+            enqueue_elapsed = time.perf_counter() - start
+            start = time.perf_counter()
+            dequeue_latencies = list(executor.map(lambda _: timed(dequeue_and_ack, service), range(orders)))
+            dequeue_elapsed = time.perf_counter() - start
+        for node in cluster:
+            node.destroy()
+        if mode == 'wal':
+            service.wal.close()
+
+    return {
+        "mode": mode,
+        "enqueue_throughput": orders / enqueue_elapsed,
+        "enqueue_p50_ms": statistics.median(enqueue_latencies) * 1000,
+        "enqueue_p99_ms": statistics.quantiles(enqueue_latencies, n=100)[98] * 1000,
+        "dequeue_throughput": orders / dequeue_elapsed,
+        "dequeue_p50_ms": statistics.median(dequeue_latencies) * 1000,
+        "dequeue_p99_ms": statistics.quantiles(dequeue_latencies, n=100)[98] * 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--nodes", type=int, default=3)
+    parser.add_argument("--base-port", type=int, default=24321, help="Raft port of the first node")
+    parser.add_argument("--leader", action="store_true", help="send the raft requests to the leader")
+    parser.add_argument("--append-entries-ms", type=float, default=RAFT_APPEND_ENTRIES_MS)
+    parser.add_argument("--tick-ms", type=float, default=RAFT_TICK_MS)
+    parser.add_argument("--modes", nargs="+", default=["single", "wal", "raft"])
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'enqueue/s':>11}{'p50 ms':>9}{'p99 ms':>9}{'dequeue+ack/s':>15}{'p50 ms':>9}{'p99 ms':>9}")
+    for mode in args.modes:
+        with tempfile.TemporaryDirectory() as directory:
+            result = run(mode, args.orders, args.threads, args.nodes, args.base_port, args.leader,
+                         args.append_entries_ms, args.tick_ms, directory)
+        print(f"{result['mode']:<8}{result['enqueue_throughput']:>11.0f}{result['enqueue_p50_ms']:>9.2f}"
+              f"{result['enqueue_p99_ms']:>9.2f}{result['dequeue_throughput']:>15.0f}"
+              f"{result['dequeue_p50_ms']:>9.2f}{result['dequeue_p99_ms']:>9.2f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Enqueue throughput of the order queue for each fsync policy of the write-ahead log.
+
+    python order_queue/src/benchmark_wal.py --orders 2000 --threads 16
+
+Each policy runs the same Enqueue calls on OrderQueueService from concurrent threads, with the log in a
+temporary directory (use --dir to put it on the disk the queue will use). "memory" is the queue without a log.
+It also reports how long the replay of the log takes on startup.
+"""
+import os
+import time
+import argparse
+import tempfile
+import statistics
+import contextlib
+from concurrent import futures
+
+from app import OrderQueueService, order_queue
+from wal import WriteAheadLog, FSYNC_POLICIES
+
+
+def make_order(index):
+    return order_queue.Order(
+        orderId=f"order-{index}",
+        user=order_queue.User(name="John", contact="12345678"),
+        items=[order_queue.Item(book=order_queue.Book(id="1", title="Learning Python", price=10.0), quantity=1)],
+        creditCard=order_queue.CreditCard(number="4111111111111111", expirationDate="12/25", cvv="123"),
+        address=order_queue.BillingAddress(street="a", city="b", state="c", zip="1", country="Finland"),
+        priority=index,
+    )
+
+def enqueue(service, order):
+    start = time.perf_counter()
+    service.Enqueue(order_queue.EnqueueRequest(order=order), None)
+    return time.perf_counter() - start
+
+def run(policy, orders, threads, directory, group_commit_ms):
+    wal = None
+    if policy != 'memory':
+        wal = WriteAheadLog(directory, order_queue.Order, fsync_policy=policy, group_commit_ms=group_commit_ms)
+    requests = [make_order(index) for index in range(orders)]
+
+    # The service logs every call. Keep the log out of the table.
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        service = OrderQueueService(wal)
+        start = time.perf_counter()
+        with futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            latencies = list(executor.map(lambda order: enqueue(service, order), requests))
+        elapsed = time.perf_counter() - start
+
+    result = {
+        "policy": policy,
+        "throughput": orders / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": statistics.quantiles(latencies, n=100)[98] * 1000,
+        "fsyncs": wal.fsyncs if wal else 0,
+        "replay_ms": 0.0,
+    }
+    if wal is not None:
+        wal.close()
+        start = time.perf_counter()
+        replay_wal = WriteAheadLog(directory, order_queue.Order, fsync_policy='none')
+        replayed, _ = replay_wal.replay()
+        result["replay_ms"] = (time.perf_counter() - start) * 1000
+        replay_wal.close()
+        assert len(replayed) == orders
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--group-commit-ms", type=float, default=1.0)
+    parser.add_argument("--dir", default=None, help="parent directory of the logs")
+    parser.add_argument("--policies", nargs="+", default=["memory", *FSYNC_POLICIES])
+    args = parser.parse_args()
+
+    print(f"{'policy':<10}{'orders/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'fsyncs':>9}{'replay ms':>11}")
+    for policy in args.policies:
+        with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+            result = run(policy, args.orders, args.threads, os.path.join(directory, "wal"), args.group_commit_ms)
+        print(f"{result['policy']:<10}{result['throughput']:>12.0f}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+              f"{result['fsyncs']:>9}{result['replay_ms']:>11.1f}")
+
+if __name__ == '__main__':
+    main()
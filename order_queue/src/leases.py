@@ -0,0 +1,81 @@
+import os
+import time
+import heapq
+
+# How long a dequeued order stays invisible to other executors before it is queued again,
+# unless the executor asks for another timeout in the request.
+VISIBILITY_TIMEOUT_MS = int(os.getenv('ORDER_QUEUE_VISIBILITY_TIMEOUT_MS', '300000'))
+# An order delivered this many times without an Ack goes to the dead-letter queue.
+MAX_DELIVERIES = int(os.getenv('ORDER_QUEUE_MAX_DELIVERIES', '5'))
+
+
+class LeaseTable:
+    """
+    The orders handed to executors and not acknowledged yet, with the deadline of each lease.
+    Deadlines are kept in a heap, so finding the expired leases is O(log n) per lease.
+    It also counts the deliveries of each order until it is acknowledged or dead-lettered.
+    Not thread-safe: the queue service holds its lock.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        # orderId: (deadline, order)
+        self._leases = {}
+        # (deadline, orderId), including deadlines of leases that were extended or released since.
+        self._deadlines = []
+        self.deliveries = {}
+
+    def lease(self, order, timeout_ms):
+        # Returns the number of deliveries of the order, including this one.
+        self.restore(order, self.clock() + timeout_ms / 1000)
+        self.deliveries[order.orderId] = self.deliveries.get(order.orderId, 0) + 1
+        return self.deliveries[order.orderId]
+
+    def restore(self, order, deadline):
+        # Add a lease taken earlier, e.g. from a snapshot, without counting a delivery.
+        self._leases[order.orderId] = (deadline, order)
+        heapq.heappush(self._deadlines, (deadline, order.orderId))
+
+    def extend(self, order_id, timeout_ms):
+        lease = self._leases.get(order_id)
+        if lease is None:
+            return False
+        deadline = self.clock() + timeout_ms / 1000
+        self._leases[order_id] = (deadline, lease[1])
+        heapq.heappush(self._deadlines, (deadline, order_id))
+        return True
+
+    def release(self, order_id):
+        # End the lease of an order. Returns the order, or None if it isn't leased (e.g. the lease expired).
+        lease = self._leases.pop(order_id, None)
+        return lease[1] if lease is not None else None
+
+    def forget(self, order_id):
+        # The order is done (acknowledged or dead-lettered), stop counting its deliveries.
+        self.deliveries.pop(order_id, None)
+
+    def expired(self):
+        # Release and return the orders whose lease has expired.
+        now = self.clock()
+        orders = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, order_id = heapq.heappop(self._deadlines)
+            lease = self._leases.get(order_id)
+            if lease is not None and lease[0] == deadline:
+                del self._leases[order_id]
+                orders.append(lease[1])
+        return orders
+
+    def has_expired(self):
+        # Whether expired() may return orders. May be true for a lease that was extended or released since.
+        return bool(self._deadlines) and self._deadlines[0][0] <= self.clock()
+
+    def orders(self):
+        return [order for _, order in self._leases.values()]
+
+    def leases(self):
+        # (order, deadline) of every lease.
+        return [(order, deadline) for deadline, order in self._leases.values()]
+
+    def __len__(self):
+        return len(self._leases)
@@ -0,0 +1,134 @@
+import os
+import math
+import time
+import heapq
+import itertools
+from collections import Counter
+
+# How much the priority of a waiting order improves per second, so low-priority orders are not starved.
+# A lower priority value is dequeued first. 0 disables aging.
+AGING_PER_SECOND = float(os.getenv('ORDER_QUEUE_AGING_PER_SECOND', '0.1'))
+
+
+class OrderHeap:
+    """
+    Priority queue of orders keyed by (effective priority, sequence).
+
+    The effective priority of an order is its priority minus AGING_PER_SECOND times its age.
+    Since every order ages at the same rate, the ordering only depends on `priority + aging * enqueue time`,
+    which is fixed when the order is pushed, so aging costs nothing on the heap.
+    The sequence number breaks ties in arrival order, so orders never have to be compared.
+
+    Cancelled and re-prioritised orders are marked removed and skipped when they reach the top,
+    so cancel and reprioritize are O(log n) amortized. Not thread-safe: the queue service holds its lock.
+    """
+
+    REMOVED = None
+
+    def __init__(self, aging_per_second=AGING_PER_SECOND, clock=time.monotonic):
+        self.aging_per_second = aging_per_second
+        self.clock = clock
+        self._start = clock()
+        self._heap = []
+        # orderId: heap entry [key, sequence, enqueue time, order]
+        self._entries = {}
+        self._sequence = itertools.count()
+        self._removed = 0
+
+    def now(self):
+        # The time of the heap, which push() takes as enqueue time. Seconds since the heap was created.
+        return self.clock() - self._start
+
+    def push(self, order, enqueued_at=None):
+        # Pushing an order id that is already queued replaces the queued order.
+        self.cancel(order.orderId)
+        enqueued_at = self.now() if enqueued_at is None else enqueued_at
+        key = order.priority + self.aging_per_second * enqueued_at
+        entry = [key, next(self._sequence), enqueued_at, order]
+        self._entries[order.orderId] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _drop_removed(self):
+        while self._heap and self._heap[0][3] is self.REMOVED:
+            heapq.heappop(self._heap)
+            self._removed -= 1
+
+    def peek(self):
+        self._drop_removed()
+        return self._heap[0][3] if self._heap else None
+
+    def pop(self):
+        self._drop_removed()
+        if not self._heap:
+            raise IndexError("pop from an empty order heap")
+        entry = heapq.heappop(self._heap)
+        del self._entries[entry[3].orderId]
+        return entry[3]
+
+    def cancel(self, order_id):
+        entry = self._entries.pop(order_id, None)
+        if entry is None:
+            return None
+        order = entry[3]
+        entry[3] = self.REMOVED
+        self._removed += 1
+        # Rebuild the heap when it is mostly removed entries, so it doesn't grow with cancellations.
+        if self._removed > 64 and self._removed > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if entry[3] is not self.REMOVED]
+            heapq.heapify(self._heap)
+            self._removed = 0
+        return order
+
+    def reprioritize(self, order_id, priority):
+        # The order keeps the age it has already gained.
+        entry = self._entries.get(order_id)
+        if entry is None:
+            return None
+        order = entry[3]
+        order.priority = priority
+        self.push(order, enqueued_at=entry[2])
+        return order
+
+    def age(self, order_id):
+        # Seconds since the order was enqueued, or None if it isn't queued.
+        entry = self._entries.get(order_id)
+        if entry is None:
+            return None
+        return self.now() - entry[2]
+
+    def effective_priority(self, order_id):
+        entry = self._entries.get(order_id)
+        if entry is None:
+            return None
+        return entry[0] - self.aging_per_second * self.now()
+
+    # Introspection. These are O(n) and only run on demand, never on the enqueue or dequeue path.
+    def top(self, k):
+        # The next k orders to be dequeued, as (order, effective priority, age in seconds).
+        now = self.now()
+        entries = heapq.nsmallest(k, self._entries.values())
+        return [(entry[3], entry[0] - self.aging_per_second * now, now - entry[2]) for entry in entries]
+
+    def oldest_age(self):
+        if not self._entries:
+            return 0.0
+        return self.now() - min(entry[2] for entry in self._entries.values())
+
+    def histogram(self, bucket_width):
+        # {lower bound of the bucket: number of orders} of the priorities, without aging.
+        counts = Counter(math.floor(entry[3].priority / bucket_width) for entry in self._entries.values())
+        return {bucket * bucket_width: counts[bucket] for bucket in sorted(counts)}
+
+    def orders(self):
+        # The queued orders in no particular order.
+        return [entry[3] for entry in self._entries.values()]
+
+    def entries(self):
+        # (order, enqueue time) in arrival order. Pushing them back in this order rebuilds the same heap.
+        return [(entry[3], entry[2]) for entry in sorted(self._entries.values(), key=lambda entry: entry[1])]
+
+    def __contains__(self, order_id):
+        return order_id in self._entries
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,191 @@
+import os
+import zlib
+import time
+import itertools
+import threading
+
+from app import OrderQueueService, order_queue, order_queue_grpc, MAX_WAIT_MS, LEASE_CHECK_SECONDS, DEFAULT_TOP_K
+from wal import WriteAheadLog, COMPACT_SECONDS, COMPACT_RECORDS
+
+# What an order is hashed by to pick its partition: order (orderId) or book (id of the first book of the order).
+# With book, the orders of a book stay in one partition, so its executor sees them in priority order.
+PARTITION_KEY = os.getenv('ORDER_QUEUE_PARTITION_KEY', 'order')
+PARTITION_KEYS = ('order', 'book')
+
+
+def partition_key(order, key=PARTITION_KEY):
+    if key == 'book' and order.items:
+        return order.items[0].book.id
+    return order.orderId
+
+def partition_of(key, partitions):
+    # crc32 rather than hash(), which changes between processes, so a restarted queue routes an Ack to the
+    # partition whose log holds the order.
+    return zlib.crc32(key.encode()) % partitions
+
+
+class PartitionedOrderQueueService(order_queue_grpc.OrderQueueServiceServicer):
+    """
+    The order queue split into independent OrderQueueService partitions, each with its own heap, lock and
+    write-ahead log. Enqueues into different partitions never contend, and priorities are only ordered
+    within a partition. Executors dequeue from the partitions they own and steal from the others when theirs
+    are empty.
+    """
+
+    def __init__(self, partitions, key=PARTITION_KEY):
+        if key not in PARTITION_KEYS:
+            raise ValueError(f"Unknown partition key '{key}', expected one of {PARTITION_KEYS}.")
+        self.partitions = partitions
+        self.key = key
+        # Wakes up the long-poll dequeues waiting on several partitions.
+        self.arrival = threading.Condition()
+        self.waiters = 0
+        # Rotates the first partition tried, so no owned partition is starved by the others.
+        self._rotation = itertools.count()
+
+    @classmethod
+    def create(cls, count, wal_dir='', key=PARTITION_KEY):
+        # Each partition logs to its own directory under wal_dir.
+        partitions = []
+        for partition in range(count):
+            wal = None
+            if wal_dir:
+                wal = WriteAheadLog(os.path.join(wal_dir, f'partition-{partition}'), order_queue.Order)
+            partitions.append(OrderQueueService(wal))
+        return cls(partitions, key)
+
+    def partition_of_order(self, order):
+        return self.partitions[partition_of(partition_key(order, self.key), len(self.partitions))]
+
+    def notify_arrival(self):
+        # The condition is only taken when a dequeue waits, so enqueues don't share a lock on the hot path.
+        # A dequeue increments `waiters` before it looks at the partitions, so it can't miss this order.
+        if self.waiters:
+            with self.arrival:
+                self.arrival.notify_all()
+
+    def Enqueue(self, request, context):
+        response = self.partition_of_order(request.order).Enqueue(request, context)
+        self.notify_arrival()
+        return response
+
+    def candidates(self, partitions, steal):
+        # The partitions to try in order: the requested ones, rotated, then the deepest of the others.
+        count = len(self.partitions)
+        owned = [partition for partition in partitions if 0 <= partition < count] or list(range(count))
+        start = next(self._rotation) % len(owned)
+        candidates = owned[start:] + owned[:start]
+        if steal:
+            owned = set(owned)
+            others = [partition for partition in range(count) if partition not in owned]
+            candidates += sorted(others, key=lambda partition: len(self.partitions[partition].order_queue), reverse=True)
+        return candidates
+
+    def take(self, method, request, candidates):
+        # The first partition with an order serves the whole request, so a batch comes from one partition.
+        for partition in candidates:
+            response = getattr(self.partitions[partition], method)(request, None)
+            if response.success:
+                return response
+        return None
+
+    def dequeue(self, method, request, empty_response, context):
+        command = type(request)()
+        command.CopyFrom(request)
+        command.waitMs = 0
+        candidates = self.candidates(request.partitions, request.steal)
+        response = self.take(method, command, candidates)
+        if response is not None or request.waitMs <= 0:
+            return response or empty_response
+        deadline = time.monotonic() + min(request.waitMs, MAX_WAIT_MS) / 1000
+        with self.arrival:
+            self.waiters += 1
+            try:
+                while True:
+                    response = self.take(method, command, candidates)
+                    if response is not None:
+                        return response
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or (context is not None and not context.is_active()):
+                        return empty_response
+                    # Orders queued again after a Nack or an expired lease don't notify, they are seen within a second.
+                    self.arrival.wait(min(remaining, 1.0))
+            finally:
+                self.waiters -= 1
+
+    def Dequeue(self, request, context):
+        return self.dequeue('Dequeue', request, order_queue.DequeueResponse(success=False), context)
+
+    def DequeueBatch(self, request, context):
+        return self.dequeue('DequeueBatch', request, order_queue.DequeueBatchResponse(success=False), context)
+
+    def route(self, method, request, context):
+        # With the orderId key, the id gives the partition of the order. With the book key, ask each partition.
+        if self.key == 'order':
+            partition = self.partitions[partition_of(request.orderId, len(self.partitions))]
+            return getattr(partition, method)(request, context)
+        for partition in self.partitions:
+            response = getattr(partition, method)(request, context)
+            if response.success:
+                break
+        return response
+
+    def Ack(self, request, context):
+        return self.route('Ack', request, context)
+
+    def Nack(self, request, context):
+        response = self.route('Nack', request, context)
+        self.notify_arrival()
+        return response
+
+    def ExtendLease(self, request, context):
+        return self.route('ExtendLease', request, context)
+
+    def Cancel(self, request, context):
+        return self.route('Cancel', request, context)
+
+    def Reprioritize(self, request, context):
+        return self.route('Reprioritize', request, context)
+
+    def GetQueueStats(self, request, context):
+        stats = [partition.GetQueueStats(request, context) for partition in self.partitions]
+        top_k = request.topK or DEFAULT_TOP_K
+        histogram = {}
+        for partition_stats in stats:
+            for bucket in partition_stats.histogram:
+                histogram[bucket.lowerBound] = histogram.get(bucket.lowerBound, 0) + bucket.count
+        top = sorted((queued for partition_stats in stats for queued in partition_stats.top),
+                     key=lambda queued: queued.effectivePriority)[:top_k]
+        return order_queue.QueueStatsResponse(
+            depth=sum(partition_stats.depth for partition_stats in stats),
+            oldestAgeSeconds=max(partition_stats.oldestAgeSeconds for partition_stats in stats),
+            histogram=[order_queue.PriorityBucket(lowerBound=lower_bound, count=histogram[lower_bound]) for lower_bound in sorted(histogram)],
+            top=top,
+            leased=sum(partition_stats.leased for partition_stats in stats),
+            deadLettered=sum(partition_stats.deadLettered for partition_stats in stats),
+            partitions=[order_queue.PartitionStats(
+                partition=partition,
+                depth=partition_stats.depth,
+                leased=partition_stats.leased
+            ) for partition, partition_stats in enumerate(stats)]
+        )
+
+    def GetDeadLetters(self, request, context):
+        orders = []
+        for partition in self.partitions:
+            orders.extend(partition.GetDeadLetters(request, context).orders)
+        return order_queue.DeadLettersResponse(orders=orders)
+
+    def requeue_expired_leases_periodically(self, interval=LEASE_CHECK_SECONDS):
+        while True:
+            time.sleep(interval)
+            for partition in self.partitions:
+                partition.check_leases()
+            self.notify_arrival()
+
+    def compact_periodically(self, interval=COMPACT_SECONDS, min_records=COMPACT_RECORDS):
+        while True:
+            time.sleep(interval)
+            for partition in self.partitions:
+                if partition.wal.records_in_log >= min_records:
+                    partition.compact()
@@ -0,0 +1,190 @@
+import os
+import time
+import contextlib
+
+import grpc
+from pysyncobj import SyncObj, SyncObjConf, SyncObjConsumer, SyncObjException, replicated
+
+from app import OrderQueueService, order_queue, order_queue_grpc, MAX_WAIT_MS, LEASE_CHECK_SECONDS
+from order_heap import OrderHeap
+from leases import LeaseTable
+
+# Replicated mode: this node and the other nodes of the Raft cluster, as host:port of the Raft transport.
+# The queue runs on a single node unless ORDER_QUEUE_RAFT_PARTNERS is set.
+RAFT_SELF = os.getenv('ORDER_QUEUE_RAFT_SELF', '')
+RAFT_PARTNERS = [partner for partner in os.getenv('ORDER_QUEUE_RAFT_PARTNERS', '').split(',') if partner]
+# Raft journal and snapshot of this node. Empty keeps them in memory, so a restarted node catches up from the others.
+RAFT_DATA_DIR = os.getenv('ORDER_QUEUE_RAFT_DATA_DIR', '')
+# How long a request waits for its command to be committed, e.g. while a leader is elected.
+RAFT_COMMIT_TIMEOUT = float(os.getenv('ORDER_QUEUE_RAFT_COMMIT_TIMEOUT', '5'))
+# The leader sends new entries to the followers every APPEND_ENTRIES_MS, which bounds the commit latency.
+# The pysyncobj default is 100ms. It must stay well below the election timeout (400ms).
+RAFT_APPEND_ENTRIES_MS = float(os.getenv('ORDER_QUEUE_RAFT_APPEND_ENTRIES_MS', '20'))
+RAFT_TICK_MS = float(os.getenv('ORDER_QUEUE_RAFT_TICK_MS', '5'))
+
+
+def raft_conf(data_dir=RAFT_DATA_DIR, append_entries_ms=RAFT_APPEND_ENTRIES_MS, tick_ms=RAFT_TICK_MS, **kwargs):
+    kwargs.setdefault('appendEntriesPeriod', append_entries_ms / 1000)
+    kwargs.setdefault('autoTickPeriod', tick_ms / 1000)
+    if data_dir:
+        os.makedirs(data_dir, exist_ok=True)
+        kwargs.setdefault('journalFile', os.path.join(data_dir, 'raft.journal'))
+        kwargs.setdefault('fullDumpFile', os.path.join(data_dir, 'raft.dump'))
+    return SyncObjConf(**kwargs)
+
+
+class ReplicatedQueueState(SyncObjConsumer):
+    """
+    The state machine replicated by Raft: an OrderQueueService without a log, whose RPC handlers are applied
+    to every replica in the order of the Raft log. Aging and leases read the time carried by the command,
+    not the clock of the replica, so every replica computes the same queue.
+    """
+
+    def __init__(self):
+        # Set before SyncObjConsumer.__init__, so they are not part of the Raft snapshot.
+        self.now = 0.0
+        self._applying = True
+        self.queue = OrderQueueService(clock=self.clock)
+        self._applying = False
+        super().__init__()
+
+    def clock(self):
+        # Commands use their own time. Local reads, e.g. the ages of GetQueueStats, use the time of the replica.
+        return self.now if self._applying else time.time()
+
+    @contextlib.contextmanager
+    def command_time(self, now):
+        # Commands are applied one at a time by the Raft thread. The time never goes back, even after a new leader.
+        self.now = max(self.now, now)
+        self._applying = True
+        try:
+            yield
+        finally:
+            self._applying = False
+
+    @replicated
+    def apply(self, method, request, now):
+        with self.command_time(now):
+            return getattr(self.queue, method)(request, None)
+
+    @replicated
+    def expire_leases(self, now):
+        with self.command_time(now), self.queue.lock:
+            self.queue.requeue_expired_leases()
+
+    def _serialize(self):
+        with self.queue.lock:
+            return {
+                "now": self.now,
+                "orders": [(order.SerializeToString(), enqueued_at) for order, enqueued_at in self.queue.order_queue.entries()],
+                "leases": [(order.SerializeToString(), deadline) for order, deadline in self.queue.leases.leases()],
+                "deliveries": dict(self.queue.leases.deliveries),
+                "deadLetters": [order.SerializeToString() for order in self.queue.dead_letters.values()],
+            }
+
+    def _deserialize(self, data):
+        with self.queue.lock:
+            # The heap is created at time 0 on every replica, as in __init__.
+            self.now = 0.0
+            with self.command_time(0.0):
+                self.queue.order_queue = OrderHeap(clock=self.clock)
+                self.queue.leases = LeaseTable(clock=self.clock)
+            self.now = data["now"]
+            for order, enqueued_at in data["orders"]:
+                self.queue.order_queue.push(order_queue.Order.FromString(order), enqueued_at=enqueued_at)
+            for order, deadline in data["leases"]:
+                self.queue.leases.restore(order_queue.Order.FromString(order), deadline)
+            self.queue.leases.deliveries = dict(data["deliveries"])
+            self.queue.dead_letters = {}
+            for order in map(order_queue.Order.FromString, data["deadLetters"]):
+                self.queue.dead_letters[order.orderId] = order
+            self.queue.not_empty.notify_all()
+
+
+class ReplicatedOrderQueueService(order_queue_grpc.OrderQueueServiceServicer):
+    """
+    OrderQueueService replicated across a Raft cluster with pysyncobj.
+    Every change of the queue is a Raft command, committed by a majority before the RPC returns. Any node
+    accepts it and forwards it to the leader. GetQueueStats and GetDeadLetters read the local replica,
+    which may be slightly behind the leader.
+    """
+
+    def __init__(self, self_address, partners, conf=None, commit_timeout=RAFT_COMMIT_TIMEOUT):
+        self.state = ReplicatedQueueState()
+        self.queue = self.state.queue
+        self.commit_timeout = commit_timeout
+        self.sync_obj = SyncObj(self_address, partners, conf or raft_conf(), consumers=[self.state])
+
+    def replicate(self, method, request, context):
+        try:
+            return self.state.apply(method, request, time.time(), sync=True, timeout=self.commit_timeout)
+        except SyncObjException as e:
+            if context is None:
+                raise
+            context.abort(grpc.StatusCode.UNAVAILABLE, f"The {method} command was not committed: {e.errorCode}")
+
+    def Enqueue(self, request, context):
+        return self.replicate('Enqueue', request, context)
+
+    def replicate_dequeue(self, method, request, empty_response, context):
+        # Wait for an order on the local replica, then take it through Raft.
+        # Another node may have taken it meanwhile, then wait again until the deadline.
+        deadline = time.monotonic() + min(request.waitMs, MAX_WAIT_MS) / 1000
+        command = type(request)()
+        command.CopyFrom(request)
+        command.waitMs = 0
+        while True:
+            with self.queue.lock:
+                has_order = self.queue.wait_for_order(max(deadline - time.monotonic(), 0) * 1000, context)
+            if not has_order:
+                return empty_response
+            response = self.replicate(method, command, context)
+            if response.success:
+                return response
+
+    def Dequeue(self, request, context):
+        return self.replicate_dequeue('Dequeue', request, order_queue.DequeueResponse(success=False), context)
+
+    def DequeueBatch(self, request, context):
+        return self.replicate_dequeue('DequeueBatch', request, order_queue.DequeueBatchResponse(success=False), context)
+
+    def Ack(self, request, context):
+        return self.replicate('Ack', request, context)
+
+    def Nack(self, request, context):
+        return self.replicate('Nack', request, context)
+
+    def ExtendLease(self, request, context):
+        return self.replicate('ExtendLease', request, context)
+
+    def Cancel(self, request, context):
+        return self.replicate('Cancel', request, context)
+
+    def Reprioritize(self, request, context):
+        return self.replicate('Reprioritize', request, context)
+
+    def GetQueueStats(self, request, context):
+        return self.queue.GetQueueStats(request, context)
+
+    def GetDeadLetters(self, request, context):
+        return self.queue.GetDeadLetters(request, context)
+
+    def is_leader(self):
+        # Whether this node is the Raft leader it knows of.
+        status = self.sync_obj.getStatus()
+        return status['leader'] is not None and status['leader'] == status['self']
+
+    def requeue_expired_leases_periodically(self, interval=LEASE_CHECK_SECONDS):
+        # Only the leader looks for expired leases, the other nodes apply its command.
+        while True:
+            time.sleep(interval)
+            with self.queue.lock:
+                has_expired = self.queue.leases.has_expired()
+            if has_expired and self.is_leader():
+                try:
+                    self.state.expire_leases(time.time(), sync=True, timeout=self.commit_timeout)
+                except SyncObjException as e:
+                    print(f"Could not requeue the expired leases: {e.errorCode}")
+
+    def destroy(self):
+        self.sync_obj.destroy()
@@ -0,0 +1,266 @@
+import os
+import re
+import time
+import struct
+import zlib
+import threading
+
+# Durable log of the order queue. Disabled unless ORDER_QUEUE_WAL_DIR is set.
+WAL_DIR = os.getenv('ORDER_QUEUE_WAL_DIR', '')
+# When an Enqueue/Dequeue is fsynced before it returns.
+# always: one fsync per record.
+# group: records written by concurrent requests share one fsync (group commit).
+# interval: fsync in the background every ORDER_QUEUE_WAL_FSYNC_INTERVAL_MS, requests don't wait.
+# none: the OS decides, records survive a crash of the process but not of the host.
+FSYNC_POLICIES = ('always', 'group', 'interval', 'none')
+FSYNC_POLICY = os.getenv('ORDER_QUEUE_WAL_FSYNC', 'group')
+# How long the leader of a group commit waits for more records before the fsync.
+GROUP_COMMIT_MS = float(os.getenv('ORDER_QUEUE_WAL_GROUP_COMMIT_MS', '1'))
+FSYNC_INTERVAL_MS = float(os.getenv('ORDER_QUEUE_WAL_FSYNC_INTERVAL_MS', '100'))
+# The log is compacted into a snapshot every COMPACT_SECONDS once it has COMPACT_RECORDS records.
+COMPACT_SECONDS = float(os.getenv('ORDER_QUEUE_WAL_COMPACT_SECONDS', '60'))
+COMPACT_RECORDS = int(os.getenv('ORDER_QUEUE_WAL_COMPACT_RECORDS', '1000'))
+
+# Record: length and crc32 of the payload, then the payload.
+# Payload: one type byte, then the enqueue time and the serialized Order (enqueue), or the order id (dequeue, dead letter).
+# The enqueue time (seconds since the epoch) lets a replayed order keep the age it gained, so its aging goes on.
+# A dequeue record is written when the order is acknowledged, so leased orders are replayed into the queue.
+HEADER = struct.Struct('<II')
+ENQUEUE_TIME = struct.Struct('<d')
+ENQUEUE = b'E'
+DEQUEUE = b'D'
+DEAD_LETTER = b'X'
+
+LOG_FILE = re.compile(r'^wal-(\d{8})\.log$')
+SNAPSHOT_FILE = re.compile(r'^snapshot-(\d{8})\.bin$')
+
+
+def encode_record(record_type, data):
+    payload = record_type + data
+    return HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+def encode_enqueue(order, enqueued_at):
+    return encode_record(ENQUEUE, ENQUEUE_TIME.pack(enqueued_at) + order.SerializeToString())
+
+def read_records(path):
+    """
+    Yields (type, data) for every complete record of a file.
+    A torn or corrupted record at the end, e.g. after a crash in the middle of a write, ends the file.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    offset = 0
+    while offset + HEADER.size <= len(data):
+        length, crc = HEADER.unpack_from(data, offset)
+        payload = data[offset + HEADER.size:offset + HEADER.size + length]
+        if length == 0 or len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        yield payload[:1], payload[1:]
+        offset += HEADER.size + length
+
+
+class WriteAheadLog:
+    """
+    Append-only log of the enqueued and dequeued orders, split in generations.
+    Compaction rotates to a new log file and writes a snapshot of the queue that replaces every older
+    file, so replay on startup reads one snapshot and the short log written after it.
+    """
+
+    def __init__(self, directory, order_class, fsync_policy=FSYNC_POLICY,
+                 group_commit_ms=GROUP_COMMIT_MS, fsync_interval_ms=FSYNC_INTERVAL_MS):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy '{fsync_policy}', expected one of {FSYNC_POLICIES}.")
+        self.directory = directory
+        self.order_class = order_class
+        self.fsync_policy = fsync_policy
+        self.group_commit_seconds = group_commit_ms / 1000
+        self.fsync_interval_seconds = fsync_interval_ms / 1000
+        os.makedirs(directory, exist_ok=True)
+
+        self._write_lock = threading.Lock()
+        self._sync_condition = threading.Condition()
+        self._syncing = False
+        self._file = None
+        self.generation = 0
+        # Sequence numbers of the records written to the file and made durable.
+        self._written = 0
+        self._synced = 0
+        self.records_in_log = 0
+        self.fsyncs = 0
+        self._closed = False
+
+    def _path(self, pattern, generation):
+        name = 'wal-%08d.log' if pattern is LOG_FILE else 'snapshot-%08d.bin'
+        return os.path.join(self.directory, name % generation)
+
+    def _generations(self, pattern):
+        generations = []
+        for name in os.listdir(self.directory):
+            match = pattern.match(name)
+            if match:
+                generations.append(int(match.group(1)))
+        return sorted(generations)
+
+    def replay(self):
+        """
+        Rebuild the orders of the queue from the latest snapshot and the logs written after it,
+        in the order they were enqueued, then open a new log generation for appends.
+        Returns ([(queued order, enqueue time)], dead-lettered orders).
+        """
+        orders = {}
+        dead_letters = {}
+        snapshots = self._generations(SNAPSHOT_FILE)
+        snapshot_generation = snapshots[-1] if snapshots else 0
+        files = [self._path(SNAPSHOT_FILE, snapshot_generation)] if snapshots else []
+        logs = [generation for generation in self._generations(LOG_FILE) if generation > snapshot_generation]
+        files += [self._path(LOG_FILE, generation) for generation in logs]
+        for path in files:
+            for record_type, data in read_records(path):
+                if record_type == ENQUEUE:
+                    enqueued_at, = ENQUEUE_TIME.unpack_from(data)
+                    order = self.order_class.FromString(data[ENQUEUE_TIME.size:])
+                    orders[order.orderId] = (order, enqueued_at)
+                elif record_type == DEQUEUE:
+                    orders.pop(data.decode(), None)
+                    dead_letters.pop(data.decode(), None)
+                elif record_type == DEAD_LETTER:
+                    queued = orders.pop(data.decode(), None)
+                    if queued is not None:
+                        dead_letters[queued[0].orderId] = queued[0]
+        self.generation = max([snapshot_generation] + logs)
+        self._open_next_log()
+        if self.fsync_policy == 'interval':
+            threading.Thread(target=self._fsync_loop, daemon=True).start()
+        return list(orders.values()), list(dead_letters.values())
+
+    def _open_next_log(self):
+        # Called with the write lock held, or before the log is shared.
+        self.generation += 1
+        self._file = open(self._path(LOG_FILE, self.generation), 'ab', buffering=0)
+        self.records_in_log = 0
+
+    def append_enqueue(self, order, enqueued_at):
+        # enqueued_at: when the order was first enqueued, in seconds since the epoch.
+        return self._write(encode_enqueue(order, enqueued_at))
+
+    def append_dequeue(self, order_id):
+        return self._write(encode_record(DEQUEUE, order_id.encode()))
+
+    def append_dead_letter(self, order_id):
+        return self._write(encode_record(DEAD_LETTER, order_id.encode()))
+
+    def _write(self, record):
+        # The file is unbuffered, so a record is in the OS as soon as this returns.
+        # Returns the sequence number of the record for sync().
+        with self._write_lock:
+            self._file.write(record)
+            self._written += 1
+            self.records_in_log += 1
+            return self._written
+
+    def sync(self, sequence):
+        """
+        Wait until the record `sequence` is durable, as the fsync policy requires.
+        With the group policy, the first waiting request fsyncs every record written so far,
+        and the requests that arrive meanwhile wait for it instead of fsyncing on their own.
+        """
+        if self.fsync_policy in ('interval', 'none'):
+            return
+        if self.fsync_policy == 'always':
+            self._fsync()
+            return
+        with self._sync_condition:
+            while self._synced < sequence:
+                if self._syncing:
+                    self._sync_condition.wait()
+                    continue
+                self._syncing = True
+                self._sync_condition.release()
+                try:
+                    if self.fsync_policy == 'group' and self.group_commit_seconds:
+                        time.sleep(self.group_commit_seconds)
+                    target = self._fsync()
+                finally:
+                    self._sync_condition.acquire()
+                    self._syncing = False
+                    self._sync_condition.notify_all()
+                self._synced = max(self._synced, target)
+
+    def _fsync(self):
+        # Writers don't wait for the fsync. The duplicated descriptor stays valid if the log is rotated meanwhile.
+        with self._write_lock:
+            target = self._written
+            if self._closed:
+                return target
+            fd = os.dup(self._file.fileno())
+            self.fsyncs += 1
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        return target
+
+    def _fsync_loop(self):
+        while not self._closed:
+            time.sleep(self.fsync_interval_seconds)
+            if self._synced < self._written:
+                self._synced = self._fsync()
+
+    # Compaction: the queue takes its content and calls rotate() under the same lock as its changes,
+    # so no record is written in between, then writes the snapshot with write_snapshot() without the lock.
+    def rotate(self):
+        # Close the current log generation and open the next one. Returns the closed generation.
+        with self._write_lock:
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._synced = self._written
+            generation = self.generation
+            self._open_next_log()
+        with self._sync_condition:
+            self._sync_condition.notify_all()
+        return generation
+
+    def write_snapshot(self, generation, orders, dead_letters=()):
+        # The snapshot covers every log up to `generation`, with the orders as (order, enqueue time).
+        # It is written to a temporary file first, so a crash leaves either the previous snapshot and its logs, or the new one.
+        path = self._path(SNAPSHOT_FILE, generation)
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'wb') as f:
+            for order, enqueued_at in orders:
+                f.write(encode_enqueue(order, enqueued_at))
+            for order in dead_letters:
+                f.write(encode_enqueue(order, 0.0))
+                f.write(encode_record(DEAD_LETTER, order.orderId.encode()))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, path)
+        self._fsync_directory()
+        for old_generation in self._generations(LOG_FILE):
+            if old_generation <= generation:
+                os.remove(self._path(LOG_FILE, old_generation))
+        for old_generation in self._generations(SNAPSHOT_FILE):
+            if old_generation < generation:
+                os.remove(self._path(SNAPSHOT_FILE, old_generation))
+
+    def _fsync_directory(self):
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def stats(self):
+        return {
+            "generation": self.generation,
+            "recordsInLog": self.records_in_log,
+            "written": self._written,
+            "synced": self._synced,
+            "fsyncs": self.fsyncs,
+            "fsyncPolicy": self.fsync_policy,
+        }
+
+    def close(self):
+        with self._write_lock:
+            self._closed = True
+            os.fsync(self._file.fileno())
+            self._file.close()
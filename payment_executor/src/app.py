@@ -2,6 +2,8 @@ import sys
 import os
 from datetime import datetime
 import random
+import time
+import threading
 
 # This set of lines are needed to import the gRPC stubs.
 # The path of the stubs is relative to the current file, or absolute inside the container.
@@ -9,16 +11,44 @@ import random
 FILE = __file__ if '__file__' in globals() else os.getenv("PYTHONFILE", "")
 utils_path = os.path.abspath(os.path.join(FILE, '../../../utils/pb'))
 sys.path.insert(0, utils_path)
+shared_path = os.path.abspath(os.path.join(FILE, '../../../utils'))
+sys.path.insert(0, shared_path)
+from shared.server import create_server
+from shared.channels import get_stub
 
 from payment_executor import payment_executor_pb2 as payment_executor
 from payment_executor import payment_executor_pb2_grpc as payment_executor_grpc
+from order_executor import order_executor_pb2 as order_executor
+from order_executor import order_executor_pb2_grpc as order_executor_grpc
 
 import grpc
-from concurrent import futures
 
+# An order voted commit whose decision hasn't arrived after DECISION_TIMEOUT_MS is in doubt,
+# and its coordinator is asked for the decision every DECISION_CHECK_SECONDS.
+DECISION_TIMEOUT_MS = int(os.getenv('PAYMENT_DECISION_TIMEOUT_MS', '60000'))
+DECISION_CHECK_SECONDS = float(os.getenv('PAYMENT_DECISION_CHECK_SECONDS', '5'))
 
 class PaymentExecutorService(payment_executor_grpc.PaymentExecutorServiceServicer):
+    def __init__(self):
+        self.lock = threading.Lock()
+        # orderId: (coordinator, time of the vote) of the orders voted commit, until their decision arrives.
+        self.awaiting_decision = {}
+
+    def await_decision(self, order_ids, coordinator):
+        if not coordinator:
+            return
+        now = time.monotonic()
+        with self.lock:
+            for order_id in order_ids:
+                self.awaiting_decision[order_id] = (coordinator, now)
+
+    def decision_received(self, order_ids):
+        with self.lock:
+            for order_id in order_ids:
+                self.awaiting_decision.pop(order_id, None)
+
     def ExecutePayment(self, request, context):
+        self.decision_received([request.orderId])
         if request.commitStatus: 
             print("Phase 2b - Payment Executor: GLOBAL COMMIT received from cordinator")
             print("Payment execution is being processed")
@@ -36,20 +66,62 @@ class PaymentExecutorService(payment_executor_grpc.PaymentExecutorServiceService
             print("Phase 1b - Payment Executor Service: Vote request received. Sending vote commit to executor\n")
         else:
             print("Phase 1b - Payment Executor Service: Vote request received. Sending vote abort to executor\n")
+        self.await_decision([request.orderId], request.coordinator)
         return payment_executor.VoteCommitResponse(success=True)
 
+    def SendBatchVoteToCoordinator(self, request, context):
+        # Group commit: one vote for every order of the batch, with the same dummy logic as SendVoteToCoordinator.
+        print(f"Phase 1b - Payment Executor Service: Vote request received for {len(request.orderIds)} orders. Sending vote commit to executor\n")
+        self.await_decision(request.orderIds, request.coordinator)
+        return payment_executor.BatchVoteResponse(votes=[
+            payment_executor.OrderVote(orderId=order_id, commit=True) for order_id in request.orderIds
+        ])
+
+    def ExecutePaymentBatch(self, request, context):
+        # Each order of the batch is committed or aborted on its own.
+        self.decision_received([decision.orderId for decision in request.decisions])
+        commits = sum(decision.commit for decision in request.decisions)
+        print(f"Phase 2b - Payment Executor: GLOBAL COMMIT received for {commits} orders, GLOBAL ABORT for {len(request.decisions) - commits}")
+        return payment_executor.BatchExecutionResponse(results=[
+            payment_executor.OrderResult(orderId=decision.orderId, success=decision.commit) for decision in request.decisions
+        ])
+
+    def resolve_in_doubt_periodically(self, interval=DECISION_CHECK_SECONDS):
+        # A coordinator that crashed between the phases sends the decision when it recovers.
+        # Asking it covers the coordinators that take long to come back, or forgot an aborted order.
+        while True:
+            time.sleep(interval)
+            deadline = time.monotonic() - DECISION_TIMEOUT_MS / 1000
+            with self.lock:
+                in_doubt = [(order_id, coordinator) for order_id, (coordinator, voted_at) in self.awaiting_decision.items()
+                            if voted_at <= deadline]
+            for order_id, coordinator in in_doubt:
+                try:
+                    stub = get_stub(coordinator, order_executor_grpc.OrderExecutorServiceStub)
+                    response = stub.QueryDecision(order_executor.QueryDecisionRequest(orderId=order_id), timeout=5)
+                except grpc.RpcError as e:
+                    print(f"Payment Executor: could not ask {coordinator} for the decision of order {order_id}: {e.code()}")
+                    continue
+                if not response.decided:
+                    continue
+                self.decision_received([order_id])
+                decision = "GLOBAL COMMIT" if response.commit else "GLOBAL ABORT"
+                print(f"Phase 2b - Payment Executor: {decision} of order {order_id} received from {coordinator} with QueryDecision")
+
 
 def serve():
     # Create a gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor())
+    server = create_server()
     # Add HelloService
-    payment_executor_grpc.add_PaymentExecutorServiceServicer_to_server(PaymentExecutorService(), server)
+    service = PaymentExecutorService()
+    payment_executor_grpc.add_PaymentExecutorServiceServicer_to_server(service, server)
     # Listen on port 50059
     port = "50059"
     server.add_insecure_port("[::]:" + port)
     # Start the server
     server.start()
     print("Server started. Listening on port 50059.")
+    threading.Thread(target=service.resolve_in_doubt_periodically, daemon=True).start()
     # Keep thread alive
     server.wait_for_termination()
 
@@ -11,10 +11,13 @@ from opentelemetry.sdk.metrics import MeterProvider, Counter, UpDownCounter, His
 from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
 from opentelemetry.sdk.resources import Resource
 
-trace.set_tracer_provider(TracerProvider(resource=Resource.create({"service.name": "transaction_verification"})))
 tracer = trace.get_tracer(__name__)
-span_processor = BatchSpanProcessor(OTLPSpanExporter(endpoint="http://observability:4318/v1/traces"))
-trace.get_tracer_provider().add_span_processor(span_processor)
+
+def init_tracing():
+    # Called by each server process, since the export thread of the span processor doesn't survive a fork.
+    trace.set_tracer_provider(TracerProvider(resource=Resource.create({"service.name": "transaction_verification"})))
+    span_processor = BatchSpanProcessor(OTLPSpanExporter(endpoint="http://observability:4318/v1/traces"))
+    trace.get_tracer_provider().add_span_processor(span_processor)
 
 metrics.set_meter_provider(MeterProvider(resource=Resource.create({"service.name": "transaction_verification"})))
 meter = metrics.get_meter(__name__)
@@ -38,89 +41,112 @@ active_verifications = meter.create_observable_gauge("active_verifications", cal
 FILE = __file__ if '__file__' in globals() else os.getenv("PYTHONFILE", "")
 utils_path = os.path.abspath(os.path.join(FILE, '../../../utils/pb'))
 sys.path.insert(0, utils_path)
+shared_path = os.path.abspath(os.path.join(FILE, '../../../utils'))
+sys.path.insert(0, shared_path)
+from shared.channels import get_stub, channel_stats
+from shared.executor import default_executor, executor_stats
+from shared.server import create_server, serve_processes
+from shared.order_state import OrderStateTable
+from shared.vector_clock import VectorClock
+from shared.causal_order import CHECKOUT_GRAPH, TRANSACTION_VERIFICATION, NUM_SERVERS
+from shared.order_context import order_metadata, get_order_state, check_vc_before
 from fraud_detection import fraud_detection_pb2 as fraud_detection
 from fraud_detection import fraud_detection_pb2_grpc as fraud_detection_grpc
 from transaction_verification import transaction_verification_pb2 as transaction_verification
 from transaction_verification import transaction_verification_pb2_grpc as transaction_verification_grpc
 
-from concurrent import futures
-import grpc
+import threading
+
+def get_channel_stats(options):
+    stats = channel_stats()
+    return [
+        metrics.Observation(stats["channelsCreated"], {"kind": "created"}),
+        metrics.Observation(stats["channelsReused"], {"kind": "reused"}),
+        metrics.Observation(stats["stubsReused"], {"kind": "stub_reused"}),
+    ]
+
+def get_executor_stats(options):
+    stats = executor_stats()
+    return [
+        metrics.Observation(stats["queueDepth"], {"kind": "queue_depth"}),
+        metrics.Observation(stats["activeWorkers"], {"kind": "active_workers"}),
+        metrics.Observation(stats["utilization"], {"kind": "utilization"}),
+    ]
+
+executor_gauge = meter.create_observable_gauge("executor", callbacks=[get_executor_stats], description="Queue depth and worker utilisation of the server executor")
+grpc_channels = meter.create_observable_gauge("grpc_channels", callbacks=[get_channel_stats], description="Pooled gRPC channels created vs reused")
 
 # Set the server index for the vector clock.
-# Frontend: 0, Orchestrator: 1, TransactionVerification: 2, FraudDetection: 3, BookSuggestion: 4
-SERVER_INDEX = 2
-NUM_SERVERS = 5
-LOCAL_VC_CORRECT_AFTER_ORCHESTRATOR = [0, 0, 0, 0, 0]
-VC_CORRECT_AFTER_ORCHESTRATOR = [0, 1, 0, 0, 0]
-LOCAL_VC_CORRECT_AFTER_ITEM_VERIFICATION = [0, 0, 1, 0, 0]
-VC_CORRECT_AFTER_ITEM_VERIFICATION = [0, 1, 1, 0, 0]
-LOCAL_VC_CORRECT_AFTER_USERDATA_FRAUD_DETECTION = [0, 0, 2, 0, 0]
-VC_CORRECT_AFTER_USERDATA_FRAUD_DETECTION = [0, 1, 2, 1, 0]
-
-# Create the global local vector clock.
-local_vector_clock = {}
-
-# Transaction flow check by order id.
-order_id_from_orchestrator = ""
+# The events of this service and the ones they depend on are declared in CHECKOUT_GRAPH.
+SERVER_INDEX = TRANSACTION_VERIFICATION
+
+# Per-order state keyed by the order id from the orchestrator.
+# It holds the events of each order completed in this service, so concurrent checkouts don't overwrite each other.
+order_states = OrderStateTable()
+
+def new_order_state():
+    # The local vector clock and the lock are used by the events run one at a time (EventService),
+    # where the events of an order may reach this service concurrently.
+    return {"completedEvents": set(), "localVectorClock": VectorClock(NUM_SERVERS), "lock": threading.Lock()}
+
+def get_order_state_stats(options):
+    stats = order_states.stats()
+    return [metrics.Observation(value, {"kind": kind}) for kind, value in stats.items()]
+
+order_state_table = meter.create_observable_gauge("order_state_table", callbacks=[get_order_state_stats], description="Per-order state entries, hits, misses, evictions and expirations")
 
 def userdata_fraud_detection_service(data, vector_clock):
      with tracer.start_as_current_span("userdata_fraud_detection_service") as span:
         span.set_attribute("service", "fraud_detection")
-        with grpc.insecure_channel('fraud_detection:50051') as channel:
-            stub = fraud_detection_grpc.UserdataFraudDetectionServiceStub(channel)
-            attr = MessageToDict(data)
-            attr["vectorClock"] = vector_clock
-            response = stub.DetectUserdataFraud(fraud_detection.UserdataFraudDetectionRequest(**attr))
-            return response
+        stub = get_stub('fraud_detection:50051', fraud_detection_grpc.UserdataFraudDetectionServiceStub)
+        request = fraud_detection.UserdataFraudDetectionRequest.FromString(data.SerializeToString())
+        vector_clock.copy_to(request.vectorClock)
+        response = stub.DetectUserdataFraud(request, metadata=order_metadata(data.orderId))
+        return response
 
 def cardinfo_fraud_detection_service(data, vector_clock):
     with tracer.start_as_current_span("cardinfo_fraud_detection_service") as span:
         span.set_attribute("service", "fraud_detection")
-        with grpc.insecure_channel('fraud_detection:50051') as channel:
-            stub = fraud_detection_grpc.CardinfoFraudDetectionServiceStub(channel)
-            attr = MessageToDict(data)
-            attr["vectorClock"] = vector_clock
-            response = stub.DetectCardinfoFraud(fraud_detection.CardinfoFraudDetectionRequest(**attr))
-            return response
+        stub = get_stub('fraud_detection:50051', fraud_detection_grpc.CardinfoFraudDetectionServiceStub)
+        request = fraud_detection.CardinfoFraudDetectionRequest.FromString(data.SerializeToString())
+        vector_clock.copy_to(request.vectorClock)
+        response = stub.DetectCardinfoFraud(request, metadata=order_metadata(data.orderId))
+        return response
     
-# Increment the value in the server index, and update the timestamp.
-# If the index isn't in the vc_array, append 0 until the index.
-def increment_vector_clock(vector_clock):
-    vc_array = [0 for _ in range(NUM_SERVERS)] if not "vcArray" in vector_clock else vector_clock["vcArray"]
-    timestamp = datetime.now().timestamp()
-
-    vc_array[SERVER_INDEX] += 1
+def is_item_valid(item):
+    return bool(item.name) and (item.quantity > 0)
 
-    return {"vcArray": vc_array, "timestamp": timestamp}
+def is_userdata_filled(user):
+    return bool(user.name and user.contact)
 
-class OrderIdStorageService(transaction_verification_grpc.OrderIdStorageServiceServicer):
+def is_creditcard_valid(credit_card):
+    card_number = credit_card.number
+    card_expiration_date = credit_card.expirationDate
+    card_cvv = credit_card.cvv
+    
+    is_valid_date = True
+    if "/" not in card_expiration_date:
+        is_valid_date = False
+    else:
+        mm, yy = card_expiration_date.split("/")
+        is_valid_date = (mm.isdigit() and int(mm) > 0 and int(mm) <= 12) and (yy.isdigit() and int(yy) > 23 and int(yy) < 50)
+
+    is_correct_card_format = is_valid_date and ((len(card_number) >= 10 and len(card_number) <= 19) and card_number.isdigit()) \
+        and ((len(card_cvv) == 3 or len(card_cvv) == 4) and card_cvv.isdigit())
+
+    return is_correct_card_format
+
+# The events of this service.
+# event: (check of the request, error message if the check fails)
+EVENTS = {
+    "a": (lambda request: is_item_valid(request.item), "Transaction Invalid. Couldn't verify your order information."),
+    "b": (lambda request: is_userdata_filled(request.user), "Transaction Invalid. Couldn't verify your user information."),
+    "c": (lambda request: is_creditcard_valid(request.creditCard), "Transaction Invalid. Couldn't verify your payment details."),
+}
     
-    def StorageOrderId(self, request, context):
-        global order_id_from_orchestrator
-        verification_counter.add(1, {"operation": "store_order_id"})
-        order_id_from_orchestrator = request.orderId
-        return transaction_verification.OrderIdStorageResponse(isValid=True)
-
 class ItemAndUserdataVerificationService(transaction_verification_grpc.ItemAndUserdataVerificationServiceServicer):
 
-    def check_order_id(self, order_id):
-        is_valid = (order_id_from_orchestrator == order_id)
-        return is_valid
-
-    def check_vc_after_orchestrator(self, vector_clock, local_vector_clock):
-        request_vc_check = bool(vector_clock['vcArray'] == VC_CORRECT_AFTER_ORCHESTRATOR)
-        local_vc_check = bool(local_vector_clock['vcArray'] == LOCAL_VC_CORRECT_AFTER_ORCHESTRATOR)
-        timestamp_check = bool(vector_clock['timestamp'] < datetime.now().timestamp())
-        return request_vc_check and local_vc_check and timestamp_check
-    
-    def check_vc_after_item_verification(self, vector_clock, local_vector_clock):
-        request_vc_check = bool(vector_clock['vcArray'] == VC_CORRECT_AFTER_ITEM_VERIFICATION)
-        local_vc_check = bool(local_vector_clock['vcArray'] == LOCAL_VC_CORRECT_AFTER_ITEM_VERIFICATION)
-        timestamp_check = bool(vector_clock['timestamp'] < datetime.now().timestamp())
-        return request_vc_check and local_vc_check and timestamp_check
-    
     def VerifyItemAndUserdata(self, request, context):
-        global local_vector_clock
         global active_verifications_count
         start_time = datetime.now()
         with tracer.start_as_current_span("verify_item_and_userdata") as span:
@@ -128,7 +154,6 @@ class ItemAndUserdataVerificationService(transaction_verification_grpc.ItemAndUs
             verification_counter.add(1, {"operation": "verify_item_and_userdata"})
             verification_status.add(1)
             active_verifications_count += 1 
-            local_vector_clock = {"vcArray": [0 for _ in range(NUM_SERVERS)], "timestamp": datetime.now().timestamp()}
             print("Transaction verification request received")
             print(f"[Transaction verification] Server index: {SERVER_INDEX}")
             
@@ -138,13 +163,14 @@ class ItemAndUserdataVerificationService(transaction_verification_grpc.ItemAndUs
                 "books": None
             }
             
-            vector_clock = MessageToDict(request.vectorClock)
+            vector_clock = VectorClock.from_proto(request.vectorClock)
             user = request.user
             item = request.item
             order_id = request.orderId
 
             ### Order Id Confirm ------------------------------------
-            if not self.check_order_id(order_id):
+            order_state = get_order_state(order_states, order_id, context, new_order_state)
+            if order_state is None:
                 error_message = "Server Error. Please retry later."
                 verification_status.add(-1)
                 active_verifications_count -= 1
@@ -153,54 +179,51 @@ class ItemAndUserdataVerificationService(transaction_verification_grpc.ItemAndUs
             print('[Transaction verification] Order Id is confirmed.')
                 
             ### Vector Clock Confirm ------------------------------------
-            print(local_vector_clock)
-            if not self.check_vc_after_orchestrator(vector_clock, local_vector_clock):
+            if not check_vc_before("a", vector_clock, order_state):
                 error_message = "Server Error. Please retry later."
                 verification_status.add(-1)
                 active_verifications_count -= 1
                 return transaction_verification.ItemAndUserdataVerificationResponse(**error_response(error_message))
             
-            print('[Transaction verification] VC is correct after orchestrator.')
+            print('[Transaction verification] VC is correct before item verification.')
 
             ### a: order items empty? -----------------------------------
-            item_exist = bool(item.name) and (item.quantity > 0)
+            item_exist = is_item_valid(item)
             if not item_exist:
                 error_message = "Transaction Invalid. Couldn't verify your order information."
                 verification_status.add(-1)
                 active_verifications_count -= 1 
                 return transaction_verification.ItemAndUserdataVerificationResponse(**error_response(error_message))
             
-            local_vector_clock = increment_vector_clock(local_vector_clock)
-            vector_clock = increment_vector_clock(vector_clock)
-            print(f"[Transaction verification] VCArray updated (item exists) in Transaction verification: {vector_clock['vcArray']}")
-            # print(f"[Transaction verification] Timestamp updated (item exists) in Transaction verification: {vector_clock['timestamp']}")
+            vector_clock.increment(SERVER_INDEX)
+            order_state["completedEvents"].add("a")
+            print(f"[Transaction verification] VCArray updated (item exists) in Transaction verification: {list(vector_clock)}")
+            # print(f"[Transaction verification] Timestamp updated (item exists) in Transaction verification: {vector_clock.timestamp}")
 
             ### Vector Clock Confirm ------------------------------------
-            if not self.check_vc_after_item_verification(vector_clock, local_vector_clock):
+            if not check_vc_before("b", vector_clock, order_state):
                 error_message = "Server Error. Please retry later."
                 verification_status.add(-1)
                 active_verifications_count -= 1
                 return transaction_verification.ItemAndUserdataVerificationResponse(**error_response(error_message))
 
-            print('[Transaction verification] VC is correct after item verification.')
+            print('[Transaction verification] VC is correct before userdata verification.')
 
             ### b: user data filled? -----------------------------------
-            user_data_filled = bool(user.name and user.contact)
+            user_data_filled = is_userdata_filled(user)
             if not user_data_filled:
                 error_message = "Transaction Invalid. Couldn't verify your user information."
                 verification_status.add(-1)
                 active_verifications_count -= 1
                 return transaction_verification.ItemAndUserdataVerificationResponse(**error_response(error_message))
             
-            local_vector_clock = increment_vector_clock(local_vector_clock)
-            vector_clock = increment_vector_clock(vector_clock)
-            print(f"[Transaction verification] VCArray updated (userdata exists) in Transaction verification: {vector_clock['vcArray']}")
-            # print(f"[Transaction verification] Timestamp updated (userdata exists) in Transaction verification: {vector_clock['timestamp']}")
+            vector_clock.increment(SERVER_INDEX)
+            order_state["completedEvents"].add("b")
+            print(f"[Transaction verification] VCArray updated (userdata exists) in Transaction verification: {list(vector_clock)}")
+            # print(f"[Transaction verification] Timestamp updated (userdata exists) in Transaction verification: {vector_clock.timestamp}")
                     
             print(f"[Transaction verification] Item and Userdata verification response: Valid")
-            with futures.ThreadPoolExecutor() as executor:
-                userdata_fraud_future = executor.submit(userdata_fraud_detection_service, request, vector_clock)
-            message = userdata_fraud_future.result()
+            message = userdata_fraud_detection_service(request, vector_clock)
             response = MessageToDict(message)
             end_time = datetime.now()
             verification_latency.record((end_time - start_time).total_seconds(), {"operation": "verify_item_and_userdata"})
@@ -211,35 +234,7 @@ class ItemAndUserdataVerificationService(transaction_verification_grpc.ItemAndUs
     
 class CardinfoVerificationService(transaction_verification_grpc.CardinfoVerificationServiceServicer):
 
-    def check_order_id(self, order_id):
-        is_valid = (order_id_from_orchestrator == order_id)
-        return is_valid
-
-    def check_vc_after_usredata_fraud_detection(self, vector_clock, local_vector_clock):
-        request_vc_check = bool(vector_clock['vcArray'] == VC_CORRECT_AFTER_USERDATA_FRAUD_DETECTION)
-        local_vc_check = bool(local_vector_clock['vcArray'] == LOCAL_VC_CORRECT_AFTER_USERDATA_FRAUD_DETECTION)
-        timestamp_check = bool(vector_clock['timestamp'] < datetime.now().timestamp())
-        return request_vc_check and local_vc_check and timestamp_check
-    
-    def is_creditcard_valid(self, credit_card):
-        card_number = credit_card.number
-        card_expiration_date = credit_card.expirationDate
-        card_cvv = credit_card.cvv
-        
-        is_valid_date = True
-        if "/" not in card_expiration_date:
-            is_valid_date = False
-        else:
-            mm, yy = card_expiration_date.split("/")
-            is_valid_date = (mm.isdigit() and int(mm) > 0 and int(mm) <= 12) and (yy.isdigit() and int(yy) > 23 and int(yy) < 50)
-
-        is_correct_card_format = is_valid_date and ((len(card_number) >= 10 and len(card_number) <= 19) and card_number.isdigit()) \
-            and ((len(card_cvv) == 3 or len(card_cvv) == 4) and card_cvv.isdigit())
-
-        return is_correct_card_format
-    
     def VerifyCardinfo(self, request, context):
-        global local_vector_clock
         start_time = datetime.now()
         with tracer.start_as_current_span("verify_cardinfo") as span:
             span.set_attribute("order_id", request.orderId)
@@ -254,59 +249,105 @@ class CardinfoVerificationService(transaction_verification_grpc.CardinfoVerifica
                 "books": None
             }
 
-            vector_clock = MessageToDict(request.vectorClock)
+            vector_clock = VectorClock.from_proto(request.vectorClock)
             credit_card = request.creditCard
             order_id = request.orderId
 
             ### Order Id Confirm ------------------------------------
-            if not self.check_order_id(order_id):
+            order_state = get_order_state(order_states, order_id, context, new_order_state)
+            if order_state is None:
                 error_message = "Server Error. Please retry later."
                 verification_status.add(-1)
                 return transaction_verification.CardinfoVerificationResponse(**error_response(error_message))
 
             print('[Transaction verification] Order Id is confirmed.')
 
-            ### Order Id Confirm ------------------------------------
-            if not self.check_vc_after_usredata_fraud_detection(vector_clock, local_vector_clock):
+            ### Vector Clock Confirm ------------------------------------
+            if not check_vc_before("c", vector_clock, order_state):
                 error_message = "Server Error. Please retry later."
                 verification_status.add(-1)
                 return transaction_verification.CardinfoVerificationResponse(**error_response(error_message))
 
-            print('[Transaction verification] VC is correct after userdata fraud detection.')
+            print('[Transaction verification] VC is correct before card verification.')
 
             ### c: card info is correct format? -------------------------------
-            is_creditcard_valid = self.is_creditcard_valid(credit_card)
-            if not is_creditcard_valid:
+            if not is_creditcard_valid(credit_card):
                 error_message = "Transaction Invalid. Couldn't verify your payment details."
                 verification_status.add(-1)
                 return transaction_verification.CardinfoVerificationResponse(**error_response(error_message))
             
-            local_vector_clock = increment_vector_clock(local_vector_clock)
-            vector_clock = increment_vector_clock(vector_clock)
-            print(f"[Transaction verification] VCArray updated (valid creditcard) in Transaction verification: {vector_clock['vcArray']}")
-            # print(f"[Transaction verification] Timestamp updated (valid creditcard) in Transaction verification: {vector_clock['timestamp']}")
+            vector_clock.increment(SERVER_INDEX)
+            order_state["completedEvents"].add("c")
+            # This is the last event of the order in this service.
+            order_states.pop(order_id)
+            print(f"[Transaction verification] VCArray updated (valid creditcard) in Transaction verification: {list(vector_clock)}")
+            # print(f"[Transaction verification] Timestamp updated (valid creditcard) in Transaction verification: {vector_clock.timestamp}")
 
             
             print(f"[Transaction verification] cardinfo verification response: Valid")
-            with futures.ThreadPoolExecutor() as executor:
-                cardinfo_fraud_future = executor.submit(cardinfo_fraud_detection_service, request, vector_clock)
-            message = cardinfo_fraud_future.result()
+            message = cardinfo_fraud_detection_service(request, vector_clock)
             response = MessageToDict(message)
             end_time = datetime.now()
             verification_latency.record((end_time - start_time).total_seconds(), {"operation": "verify_cardinfo"})
             verification_status.add(-1)
             return transaction_verification.CardinfoVerificationResponse(**response)
 
+
+
+class EventService(transaction_verification_grpc.EventServiceServicer):
+
+    def RunEvent(self, request, context):
+        start_time = datetime.now()
+        with tracer.start_as_current_span("run_event") as span:
+            span.set_attribute("order_id", request.orderId)
+            span.set_attribute("event", request.event)
+            verification_counter.add(1, {"operation": f"event_{request.event}"})
+            print(f"[Transaction verification] Event {request.event} request received")
+
+            error_response = lambda error_message: transaction_verification.EventResponse(isValid=False, errorMessage=error_message)
+
+            vector_clock = VectorClock.from_proto(request.vectorClock)
+            order_id = request.orderId
+
+            ### Order Id Confirm ------------------------------------
+            order_state = get_order_state(order_states, order_id, context, new_order_state)
+            if order_state is None or request.event not in EVENTS:
+                return error_response("Server Error. Please retry later.")
+
+            check, error_message = EVENTS[request.event]
+            # The events of an order may arrive concurrently. Each of them takes its own tick of the local clock.
+            with order_state["lock"]:
+                ### Vector Clock Confirm ------------------------------------
+                if not check_vc_before(request.event, vector_clock, order_state):
+                    return error_response("Server Error. Please retry later.")
+
+                if not check(request):
+                    return error_response(error_message)
+
+                local_vector_clock = order_state["localVectorClock"].merge(vector_clock).increment(SERVER_INDEX)
+                order_state["completedEvents"].add(request.event)
+                vector_clock = local_vector_clock.copy()
+                if order_state["completedEvents"] >= CHECKOUT_GRAPH.server_events(SERVER_INDEX):
+                    order_states.pop(order_id)
+            print(f"[Transaction verification] VCArray updated (event {request.event}) in Transaction verification: {list(vector_clock)}")
+
+            end_time = datetime.now()
+            verification_latency.record((end_time - start_time).total_seconds(), {"operation": f"event_{request.event}"})
+            return transaction_verification.EventResponse(isValid=True, vectorClock=vector_clock.to_proto(transaction_verification.VectorClock))
+
     
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor())
-    transaction_verification_grpc.add_OrderIdStorageServiceServicer_to_server(OrderIdStorageService(), server)
+    init_tracing()
+    # The process-wide executor serves the RPCs, and the downstream calls run on the thread of the RPC.
+    server = create_server(default_executor)
     transaction_verification_grpc.add_ItemAndUserdataVerificationServiceServicer_to_server(ItemAndUserdataVerificationService(), server)
     transaction_verification_grpc.add_CardinfoVerificationServiceServicer_to_server(CardinfoVerificationService(), server)
+    transaction_verification_grpc.add_EventServiceServicer_to_server(EventService(), server)
     server.add_insecure_port('[::]:50052')
     server.start()
     print("Transaction Verification Service started on port 50052")
     server.wait_for_termination()
 
 if __name__ == '__main__':
-    serve()
+    # GRPC_SERVER_PROCESSES > 1 runs one server per process on the same port, for the relay checkout only.
+    serve_processes(serve)
@@ -14,31 +14,57 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n*utils/pb/book_database/book_database.proto\x12\rbook_database\":\n\x0eGetBookRequest\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12\x14\n\x0c\x63ommitStatus\x18\x02 \x01(\x08\"L\n\x11UpdateBookRequest\x12!\n\x04\x62ook\x18\x01 \x01(\x0b\x32\x13.book_database.Book\x12\x14\n\x0c\x63ommitStatus\x18\x02 \x01(\x08\"\x07\n\x05\x45mpty\"\x9d\x01\n\x04\x42ook\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0e\n\x06\x63opies\x18\x05 \x01(\x05\x12\x17\n\x0f\x63opiesAvailable\x18\x06 \x01(\x05\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x0b\n\x03img\x18\x08 \x01(\t\x12\r\n\x05price\x18\t \x01(\x02\".\n\x08\x42ookList\x12\"\n\x05\x62ooks\x18\x01 \x03(\x0b\x32\x13.book_database.Book\"$\n\x11Head2TailResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\x13\n\x11VoteCommitRequest\"%\n\x12VoteCommitResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"(\n\x17GetBookFromTitleRequest\x12\r\n\x05title\x18\x01 \x01(\t2\xdb\x03\n\x13\x42ookDatabaseService\x12@\n\x07\x41\x64\x64\x42ook\x12\x13.book_database.Book\x1a .book_database.Head2TailResponse\x12=\n\x07GetBook\x12\x1d.book_database.GetBookRequest\x1a\x13.book_database.Book\x12O\n\x10GetBookFromTitle\x12&.book_database.GetBookFromTitleRequest\x1a\x13.book_database.Book\x12P\n\nUpdateBook\x12 .book_database.UpdateBookRequest\x1a .book_database.Head2TailResponse\x12\x42\n\tHead2Tail\x12\x13.book_database.Book\x1a .book_database.Head2TailResponse\x12\\\n\x15SendVoteToCoordinator\x12 .book_database.VoteCommitRequest\x1a!.book_database.VoteCommitResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n*utils/pb/book_database/book_database.proto\x12\rbook_database\"\x07\n\x05\x45mpty\"\xae\x01\n\x04\x42ook\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0e\n\x06\x63opies\x18\x05 \x01(\x05\x12\x17\n\x0f\x63opiesAvailable\x18\x06 \x01(\x05\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x0b\n\x03img\x18\x08 \x01(\t\x12\r\n\x05price\x18\t \x01(\x02\x12\x0f\n\x07version\x18\n \x01(\x03\".\n\x08\x42ookList\x12\"\n\x05\x62ooks\x18\x01 \x03(\x0b\x32\x13.book_database.Book\"$\n\x11Head2TailResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\x13\n\x11VoteCommitRequest\"%\n\x12VoteCommitResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"(\n\x17GetBookFromTitleRequest\x12\r\n\x05title\x18\x01 \x01(\t\"+\n\x19GetBooksFromTitlesRequest\x12\x0e\n\x06titles\x18\x01 \x03(\t\"W\n\x1aGetBooksFromTitlesResponse\x12\"\n\x05\x62ooks\x18\x01 \x03(\x0b\x32\x13.book_database.Book\x12\x15\n\rmissingTitles\x18\x02 \x03(\t\"-\n\tStockItem\x12\x0e\n\x06\x62ookId\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\"F\n\nOrderStock\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\'\n\x05items\x18\x02 \x03(\x0b\x32\x18.book_database.StockItem\">\n\x11StockBatchRequest\x12)\n\x06orders\x18\x01 \x03(\x0b\x32\x19.book_database.OrderStock\",\n\tOrderVote\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x0e\n\x06\x63ommit\x18\x02 \x01(\x08\"<\n\x11\x42\x61tchVoteResponse\x12\'\n\x05votes\x18\x01 \x03(\x0b\x32\x18.book_database.OrderVote\"/\n\x0bOrderResult\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\"E\n\x16\x42\x61tchExecutionResponse\x12+\n\x07results\x18\x01 \x03(\x0b\x32\x1a.book_database.OrderResult\"Y\n\x0ePrepareRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\'\n\x05items\x18\x02 \x03(\x0b\x32\x18.book_database.StockItem\x12\r\n\x05ttlMs\x18\x03 \x01(\x05\"!\n\x0fPrepareResponse\x12\x0e\n\x06\x63ommit\x18\x01 \x01(\x08\"K\n\x0f\x44\x65\x63isionRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\'\n\x05items\x18\x02 \x03(\x0b\x32\x18.book_database.StockItem\"#\n\x10\x44\x65\x63isionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"R\n\x15\x44\x65\x63rementStockRequest\x12\x0e\n\x06\x62ookId\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\x12\x17\n\x0f\x65xpectedVersion\x18\x03 \x01(\x03\"S\n\x16\x44\x65\x63rementStockResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x17\n\x0f\x63opiesAvailable\x18\x02 \x01(\x05\x12\x0f\n\x07version\x18\x03 \x01(\x03\x32\xcf\x08\n\x13\x42ookDatabaseService\x12@\n\x07\x41\x64\x64\x42ook\x12\x13.book_database.Book\x1a .book_database.Head2TailResponse\x12O\n\x10GetBookFromTitle\x12&.book_database.GetBookFromTitleRequest\x1a\x13.book_database.Book\x12i\n\x12GetBooksFromTitles\x12(.book_database.GetBooksFromTitlesRequest\x1a).book_database.GetBooksFromTitlesResponse\x12\x42\n\tHead2Tail\x12\x13.book_database.Book\x1a .book_database.Head2TailResponse\x12\\\n\x15SendVoteToCoordinator\x12 .book_database.VoteCommitRequest\x1a!.book_database.VoteCommitResponse\x12T\n\x0eVoteStockBatch\x12 .book_database.StockBatchRequest\x1a .book_database.BatchVoteResponse\x12[\n\x10\x43ommitStockBatch\x12 .book_database.StockBatchRequest\x1a%.book_database.BatchExecutionResponse\x12K\n\x0eHead2TailBatch\x12\x17.book_database.BookList\x1a .book_database.Head2TailResponse\x12Z\n\x0f\x41\x62ortStockBatch\x12 .book_database.StockBatchRequest\x1a%.book_database.BatchExecutionResponse\x12H\n\x07Prepare\x12\x1d.book_database.PrepareRequest\x1a\x1e.book_database.PrepareResponse\x12I\n\x06\x43ommit\x12\x1e.book_database.DecisionRequest\x1a\x1f.book_database.DecisionResponse\x12H\n\x05\x41\x62ort\x12\x1e.book_database.DecisionRequest\x1a\x1f.book_database.DecisionResponse\x12]\n\x0e\x44\x65\x63rementStock\x12$.book_database.DecrementStockRequest\x1a%.book_database.DecrementStockResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'utils.pb.book_database.book_database_pb2', _globals)
 if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
-  _globals['_GETBOOKREQUEST']._serialized_start=61
-  _globals['_GETBOOKREQUEST']._serialized_end=119
-  _globals['_UPDATEBOOKREQUEST']._serialized_start=121
-  _globals['_UPDATEBOOKREQUEST']._serialized_end=197
-  _globals['_EMPTY']._serialized_start=199
-  _globals['_EMPTY']._serialized_end=206
-  _globals['_BOOK']._serialized_start=209
-  _globals['_BOOK']._serialized_end=366
-  _globals['_BOOKLIST']._serialized_start=368
-  _globals['_BOOKLIST']._serialized_end=414
-  _globals['_HEAD2TAILRESPONSE']._serialized_start=416
-  _globals['_HEAD2TAILRESPONSE']._serialized_end=452
-  _globals['_VOTECOMMITREQUEST']._serialized_start=454
-  _globals['_VOTECOMMITREQUEST']._serialized_end=473
-  _globals['_VOTECOMMITRESPONSE']._serialized_start=475
-  _globals['_VOTECOMMITRESPONSE']._serialized_end=512
-  _globals['_GETBOOKFROMTITLEREQUEST']._serialized_start=514
-  _globals['_GETBOOKFROMTITLEREQUEST']._serialized_end=554
-  _globals['_BOOKDATABASESERVICE']._serialized_start=557
-  _globals['_BOOKDATABASESERVICE']._serialized_end=1032
+  _globals['_EMPTY']._serialized_start=61
+  _globals['_EMPTY']._serialized_end=68
+  _globals['_BOOK']._serialized_start=71
+  _globals['_BOOK']._serialized_end=245
+  _globals['_BOOKLIST']._serialized_start=247
+  _globals['_BOOKLIST']._serialized_end=293
+  _globals['_HEAD2TAILRESPONSE']._serialized_start=295
+  _globals['_HEAD2TAILRESPONSE']._serialized_end=331
+  _globals['_VOTECOMMITREQUEST']._serialized_start=333
+  _globals['_VOTECOMMITREQUEST']._serialized_end=352
+  _globals['_VOTECOMMITRESPONSE']._serialized_start=354
+  _globals['_VOTECOMMITRESPONSE']._serialized_end=391
+  _globals['_GETBOOKFROMTITLEREQUEST']._serialized_start=393
+  _globals['_GETBOOKFROMTITLEREQUEST']._serialized_end=433
+  _globals['_GETBOOKSFROMTITLESREQUEST']._serialized_start=435
+  _globals['_GETBOOKSFROMTITLESREQUEST']._serialized_end=478
+  _globals['_GETBOOKSFROMTITLESRESPONSE']._serialized_start=480
+  _globals['_GETBOOKSFROMTITLESRESPONSE']._serialized_end=567
+  _globals['_STOCKITEM']._serialized_start=569
+  _globals['_STOCKITEM']._serialized_end=614
+  _globals['_ORDERSTOCK']._serialized_start=616
+  _globals['_ORDERSTOCK']._serialized_end=686
+  _globals['_STOCKBATCHREQUEST']._serialized_start=688
+  _globals['_STOCKBATCHREQUEST']._serialized_end=750
+  _globals['_ORDERVOTE']._serialized_start=752
+  _globals['_ORDERVOTE']._serialized_end=796
+  _globals['_BATCHVOTERESPONSE']._serialized_start=798
+  _globals['_BATCHVOTERESPONSE']._serialized_end=858
+  _globals['_ORDERRESULT']._serialized_start=860
+  _globals['_ORDERRESULT']._serialized_end=907
+  _globals['_BATCHEXECUTIONRESPONSE']._serialized_start=909
+  _globals['_BATCHEXECUTIONRESPONSE']._serialized_end=978
+  _globals['_PREPAREREQUEST']._serialized_start=980
+  _globals['_PREPAREREQUEST']._serialized_end=1069
+  _globals['_PREPARERESPONSE']._serialized_start=1071
+  _globals['_PREPARERESPONSE']._serialized_end=1104
+  _globals['_DECISIONREQUEST']._serialized_start=1106
+  _globals['_DECISIONREQUEST']._serialized_end=1181
+  _globals['_DECISIONRESPONSE']._serialized_start=1183
+  _globals['_DECISIONRESPONSE']._serialized_end=1218
+  _globals['_DECREMENTSTOCKREQUEST']._serialized_start=1220
+  _globals['_DECREMENTSTOCKREQUEST']._serialized_end=1302
+  _globals['_DECREMENTSTOCKRESPONSE']._serialized_start=1304
+  _globals['_DECREMENTSTOCKRESPONSE']._serialized_end=1387
+  _globals['_BOOKDATABASESERVICE']._serialized_start=1390
+  _globals['_BOOKDATABASESERVICE']._serialized_end=2493
 # @@protoc_insertion_point(module_scope)
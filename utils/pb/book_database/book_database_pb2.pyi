@@ -5,28 +5,12 @@ from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Map
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
-class GetBookRequest(_message.Message):
-    __slots__ = ("request_id", "commitStatus")
-    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
-    COMMITSTATUS_FIELD_NUMBER: _ClassVar[int]
-    request_id: str
-    commitStatus: bool
-    def __init__(self, request_id: _Optional[str] = ..., commitStatus: bool = ...) -> None: ...
-
-class UpdateBookRequest(_message.Message):
-    __slots__ = ("book", "commitStatus")
-    BOOK_FIELD_NUMBER: _ClassVar[int]
-    COMMITSTATUS_FIELD_NUMBER: _ClassVar[int]
-    book: Book
-    commitStatus: bool
-    def __init__(self, book: _Optional[_Union[Book, _Mapping]] = ..., commitStatus: bool = ...) -> None: ...
-
 class Empty(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
 
 class Book(_message.Message):
-    __slots__ = ("id", "title", "author", "description", "copies", "copiesAvailable", "category", "img", "price")
+    __slots__ = ("id", "title", "author", "description", "copies", "copiesAvailable", "category", "img", "price", "version")
     ID_FIELD_NUMBER: _ClassVar[int]
     TITLE_FIELD_NUMBER: _ClassVar[int]
     AUTHOR_FIELD_NUMBER: _ClassVar[int]
@@ -36,6 +20,7 @@ class Book(_message.Message):
     CATEGORY_FIELD_NUMBER: _ClassVar[int]
     IMG_FIELD_NUMBER: _ClassVar[int]
     PRICE_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
     id: str
     title: str
     author: str
@@ -45,7 +30,8 @@ class Book(_message.Message):
     category: str
     img: str
     price: float
-    def __init__(self, id: _Optional[str] = ..., title: _Optional[str] = ..., author: _Optional[str] = ..., description: _Optional[str] = ..., copies: _Optional[int] = ..., copiesAvailable: _Optional[int] = ..., category: _Optional[str] = ..., img: _Optional[str] = ..., price: _Optional[float] = ...) -> None: ...
+    version: int
+    def __init__(self, id: _Optional[str] = ..., title: _Optional[str] = ..., author: _Optional[str] = ..., description: _Optional[str] = ..., copies: _Optional[int] = ..., copiesAvailable: _Optional[int] = ..., category: _Optional[str] = ..., img: _Optional[str] = ..., price: _Optional[float] = ..., version: _Optional[int] = ...) -> None: ...
 
 class BookList(_message.Message):
     __slots__ = ("books",)
@@ -74,3 +60,117 @@ class GetBookFromTitleRequest(_message.Message):
     TITLE_FIELD_NUMBER: _ClassVar[int]
     title: str
     def __init__(self, title: _Optional[str] = ...) -> None: ...
+
+class GetBooksFromTitlesRequest(_message.Message):
+    __slots__ = ("titles",)
+    TITLES_FIELD_NUMBER: _ClassVar[int]
+    titles: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, titles: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GetBooksFromTitlesResponse(_message.Message):
+    __slots__ = ("books", "missingTitles")
+    BOOKS_FIELD_NUMBER: _ClassVar[int]
+    MISSINGTITLES_FIELD_NUMBER: _ClassVar[int]
+    books: _containers.RepeatedCompositeFieldContainer[Book]
+    missingTitles: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, books: _Optional[_Iterable[_Union[Book, _Mapping]]] = ..., missingTitles: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class StockItem(_message.Message):
+    __slots__ = ("bookId", "quantity")
+    BOOKID_FIELD_NUMBER: _ClassVar[int]
+    QUANTITY_FIELD_NUMBER: _ClassVar[int]
+    bookId: str
+    quantity: int
+    def __init__(self, bookId: _Optional[str] = ..., quantity: _Optional[int] = ...) -> None: ...
+
+class OrderStock(_message.Message):
+    __slots__ = ("orderId", "items")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    ITEMS_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    items: _containers.RepeatedCompositeFieldContainer[StockItem]
+    def __init__(self, orderId: _Optional[str] = ..., items: _Optional[_Iterable[_Union[StockItem, _Mapping]]] = ...) -> None: ...
+
+class StockBatchRequest(_message.Message):
+    __slots__ = ("orders",)
+    ORDERS_FIELD_NUMBER: _ClassVar[int]
+    orders: _containers.RepeatedCompositeFieldContainer[OrderStock]
+    def __init__(self, orders: _Optional[_Iterable[_Union[OrderStock, _Mapping]]] = ...) -> None: ...
+
+class OrderVote(_message.Message):
+    __slots__ = ("orderId", "commit")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    COMMIT_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    commit: bool
+    def __init__(self, orderId: _Optional[str] = ..., commit: bool = ...) -> None: ...
+
+class BatchVoteResponse(_message.Message):
+    __slots__ = ("votes",)
+    VOTES_FIELD_NUMBER: _ClassVar[int]
+    votes: _containers.RepeatedCompositeFieldContainer[OrderVote]
+    def __init__(self, votes: _Optional[_Iterable[_Union[OrderVote, _Mapping]]] = ...) -> None: ...
+
+class OrderResult(_message.Message):
+    __slots__ = ("orderId", "success")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    success: bool
+    def __init__(self, orderId: _Optional[str] = ..., success: bool = ...) -> None: ...
+
+class BatchExecutionResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[OrderResult]
+    def __init__(self, results: _Optional[_Iterable[_Union[OrderResult, _Mapping]]] = ...) -> None: ...
+
+class PrepareRequest(_message.Message):
+    __slots__ = ("orderId", "items", "ttlMs")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    ITEMS_FIELD_NUMBER: _ClassVar[int]
+    TTLMS_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    items: _containers.RepeatedCompositeFieldContainer[StockItem]
+    ttlMs: int
+    def __init__(self, orderId: _Optional[str] = ..., items: _Optional[_Iterable[_Union[StockItem, _Mapping]]] = ..., ttlMs: _Optional[int] = ...) -> None: ...
+
+class PrepareResponse(_message.Message):
+    __slots__ = ("commit",)
+    COMMIT_FIELD_NUMBER: _ClassVar[int]
+    commit: bool
+    def __init__(self, commit: bool = ...) -> None: ...
+
+class DecisionRequest(_message.Message):
+    __slots__ = ("orderId", "items")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    ITEMS_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    items: _containers.RepeatedCompositeFieldContainer[StockItem]
+    def __init__(self, orderId: _Optional[str] = ..., items: _Optional[_Iterable[_Union[StockItem, _Mapping]]] = ...) -> None: ...
+
+class DecisionResponse(_message.Message):
+    __slots__ = ("success",)
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    def __init__(self, success: bool = ...) -> None: ...
+
+class DecrementStockRequest(_message.Message):
+    __slots__ = ("bookId", "quantity", "expectedVersion")
+    BOOKID_FIELD_NUMBER: _ClassVar[int]
+    QUANTITY_FIELD_NUMBER: _ClassVar[int]
+    EXPECTEDVERSION_FIELD_NUMBER: _ClassVar[int]
+    bookId: str
+    quantity: int
+    expectedVersion: int
+    def __init__(self, bookId: _Optional[str] = ..., quantity: _Optional[int] = ..., expectedVersion: _Optional[int] = ...) -> None: ...
+
+class DecrementStockResponse(_message.Message):
+    __slots__ = ("success", "copiesAvailable", "version")
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    COPIESAVAILABLE_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    copiesAvailable: int
+    version: int
+    def __init__(self, success: bool = ..., copiesAvailable: _Optional[int] = ..., version: _Optional[int] = ...) -> None: ...
@@ -19,20 +19,15 @@ class BookDatabaseServiceStub(object):
                 request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.Book.SerializeToString,
                 response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.Head2TailResponse.FromString,
                 )
-        self.GetBook = channel.unary_unary(
-                '/book_database.BookDatabaseService/GetBook',
-                request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBookRequest.SerializeToString,
-                response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.Book.FromString,
-                )
         self.GetBookFromTitle = channel.unary_unary(
                 '/book_database.BookDatabaseService/GetBookFromTitle',
                 request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBookFromTitleRequest.SerializeToString,
                 response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.Book.FromString,
                 )
-        self.UpdateBook = channel.unary_unary(
-                '/book_database.BookDatabaseService/UpdateBook',
-                request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.UpdateBookRequest.SerializeToString,
-                response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.Head2TailResponse.FromString,
+        self.GetBooksFromTitles = channel.unary_unary(
+                '/book_database.BookDatabaseService/GetBooksFromTitles',
+                request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBooksFromTitlesRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBooksFromTitlesResponse.FromString,
                 )
         self.Head2Tail = channel.unary_unary(
                 '/book_database.BookDatabaseService/Head2Tail',
@@ -44,6 +39,46 @@ class BookDatabaseServiceStub(object):
                 request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.VoteCommitRequest.SerializeToString,
                 response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.VoteCommitResponse.FromString,
                 )
+        self.VoteStockBatch = channel.unary_unary(
+                '/book_database.BookDatabaseService/VoteStockBatch',
+                request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.StockBatchRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.BatchVoteResponse.FromString,
+                )
+        self.CommitStockBatch = channel.unary_unary(
+                '/book_database.BookDatabaseService/CommitStockBatch',
+                request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.StockBatchRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.BatchExecutionResponse.FromString,
+                )
+        self.Head2TailBatch = channel.unary_unary(
+                '/book_database.BookDatabaseService/Head2TailBatch',
+                request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.BookList.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.Head2TailResponse.FromString,
+                )
+        self.AbortStockBatch = channel.unary_unary(
+                '/book_database.BookDatabaseService/AbortStockBatch',
+                request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.StockBatchRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.BatchExecutionResponse.FromString,
+                )
+        self.Prepare = channel.unary_unary(
+                '/book_database.BookDatabaseService/Prepare',
+                request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.PrepareRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.PrepareResponse.FromString,
+                )
+        self.Commit = channel.unary_unary(
+                '/book_database.BookDatabaseService/Commit',
+                request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.DecisionRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.DecisionResponse.FromString,
+                )
+        self.Abort = channel.unary_unary(
+                '/book_database.BookDatabaseService/Abort',
+                request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.DecisionRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.DecisionResponse.FromString,
+                )
+        self.DecrementStock = channel.unary_unary(
+                '/book_database.BookDatabaseService/DecrementStock',
+                request_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.DecrementStockRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.DecrementStockResponse.FromString,
+                )
 
 
 class BookDatabaseServiceServicer(object):
@@ -55,31 +90,73 @@ class BookDatabaseServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
-    def GetBook(self, request, context):
+    def GetBookFromTitle(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
-    def GetBookFromTitle(self, request, context):
+    def GetBooksFromTitles(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
-    def UpdateBook(self, request, context):
+    def Head2Tail(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
-    def Head2Tail(self, request, context):
+    def SendVoteToCoordinator(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
-    def SendVoteToCoordinator(self, request, context):
+    def VoteStockBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CommitStockBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Head2TailBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AbortStockBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Prepare(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Commit(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Abort(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DecrementStock(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -93,20 +170,15 @@ def add_BookDatabaseServiceServicer_to_server(servicer, server):
                     request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.Book.FromString,
                     response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.Head2TailResponse.SerializeToString,
             ),
-            'GetBook': grpc.unary_unary_rpc_method_handler(
-                    servicer.GetBook,
-                    request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBookRequest.FromString,
-                    response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.Book.SerializeToString,
-            ),
             'GetBookFromTitle': grpc.unary_unary_rpc_method_handler(
                     servicer.GetBookFromTitle,
                     request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBookFromTitleRequest.FromString,
                     response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.Book.SerializeToString,
             ),
-            'UpdateBook': grpc.unary_unary_rpc_method_handler(
-                    servicer.UpdateBook,
-                    request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.UpdateBookRequest.FromString,
-                    response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.Head2TailResponse.SerializeToString,
+            'GetBooksFromTitles': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetBooksFromTitles,
+                    request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBooksFromTitlesRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBooksFromTitlesResponse.SerializeToString,
             ),
             'Head2Tail': grpc.unary_unary_rpc_method_handler(
                     servicer.Head2Tail,
@@ -118,6 +190,46 @@ def add_BookDatabaseServiceServicer_to_server(servicer, server):
                     request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.VoteCommitRequest.FromString,
                     response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.VoteCommitResponse.SerializeToString,
             ),
+            'VoteStockBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.VoteStockBatch,
+                    request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.StockBatchRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.BatchVoteResponse.SerializeToString,
+            ),
+            'CommitStockBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.CommitStockBatch,
+                    request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.StockBatchRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.BatchExecutionResponse.SerializeToString,
+            ),
+            'Head2TailBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.Head2TailBatch,
+                    request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.BookList.FromString,
+                    response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.Head2TailResponse.SerializeToString,
+            ),
+            'AbortStockBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.AbortStockBatch,
+                    request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.StockBatchRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.BatchExecutionResponse.SerializeToString,
+            ),
+            'Prepare': grpc.unary_unary_rpc_method_handler(
+                    servicer.Prepare,
+                    request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.PrepareRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.PrepareResponse.SerializeToString,
+            ),
+            'Commit': grpc.unary_unary_rpc_method_handler(
+                    servicer.Commit,
+                    request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.DecisionRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.DecisionResponse.SerializeToString,
+            ),
+            'Abort': grpc.unary_unary_rpc_method_handler(
+                    servicer.Abort,
+                    request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.DecisionRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.DecisionResponse.SerializeToString,
+            ),
+            'DecrementStock': grpc.unary_unary_rpc_method_handler(
+                    servicer.DecrementStock,
+                    request_deserializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.DecrementStockRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_book__database_dot_book__database__pb2.DecrementStockResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'book_database.BookDatabaseService', rpc_method_handlers)
@@ -146,7 +258,7 @@ class BookDatabaseService(object):
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
     @staticmethod
-    def GetBook(request,
+    def GetBookFromTitle(request,
             target,
             options=(),
             channel_credentials=None,
@@ -156,14 +268,14 @@ class BookDatabaseService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/GetBook',
-            utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBookRequest.SerializeToString,
+        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/GetBookFromTitle',
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBookFromTitleRequest.SerializeToString,
             utils_dot_pb_dot_book__database_dot_book__database__pb2.Book.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
     @staticmethod
-    def GetBookFromTitle(request,
+    def GetBooksFromTitles(request,
             target,
             options=(),
             channel_credentials=None,
@@ -173,14 +285,14 @@ class BookDatabaseService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/GetBookFromTitle',
-            utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBookFromTitleRequest.SerializeToString,
-            utils_dot_pb_dot_book__database_dot_book__database__pb2.Book.FromString,
+        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/GetBooksFromTitles',
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBooksFromTitlesRequest.SerializeToString,
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.GetBooksFromTitlesResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
     @staticmethod
-    def UpdateBook(request,
+    def Head2Tail(request,
             target,
             options=(),
             channel_credentials=None,
@@ -190,14 +302,14 @@ class BookDatabaseService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/UpdateBook',
-            utils_dot_pb_dot_book__database_dot_book__database__pb2.UpdateBookRequest.SerializeToString,
+        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/Head2Tail',
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.Book.SerializeToString,
             utils_dot_pb_dot_book__database_dot_book__database__pb2.Head2TailResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
     @staticmethod
-    def Head2Tail(request,
+    def SendVoteToCoordinator(request,
             target,
             options=(),
             channel_credentials=None,
@@ -207,14 +319,65 @@ class BookDatabaseService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/Head2Tail',
-            utils_dot_pb_dot_book__database_dot_book__database__pb2.Book.SerializeToString,
+        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/SendVoteToCoordinator',
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.VoteCommitRequest.SerializeToString,
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.VoteCommitResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def VoteStockBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/VoteStockBatch',
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.StockBatchRequest.SerializeToString,
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.BatchVoteResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def CommitStockBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/CommitStockBatch',
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.StockBatchRequest.SerializeToString,
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.BatchExecutionResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Head2TailBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/Head2TailBatch',
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.BookList.SerializeToString,
             utils_dot_pb_dot_book__database_dot_book__database__pb2.Head2TailResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
     @staticmethod
-    def SendVoteToCoordinator(request,
+    def AbortStockBatch(request,
             target,
             options=(),
             channel_credentials=None,
@@ -224,8 +387,76 @@ class BookDatabaseService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/SendVoteToCoordinator',
-            utils_dot_pb_dot_book__database_dot_book__database__pb2.VoteCommitRequest.SerializeToString,
-            utils_dot_pb_dot_book__database_dot_book__database__pb2.VoteCommitResponse.FromString,
+        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/AbortStockBatch',
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.StockBatchRequest.SerializeToString,
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.BatchExecutionResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Prepare(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/Prepare',
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.PrepareRequest.SerializeToString,
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.PrepareResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Commit(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/Commit',
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.DecisionRequest.SerializeToString,
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.DecisionResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Abort(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/Abort',
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.DecisionRequest.SerializeToString,
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.DecisionResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def DecrementStock(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/book_database.BookDatabaseService/DecrementStock',
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.DecrementStockRequest.SerializeToString,
+            utils_dot_pb_dot_book__database_dot_book__database__pb2.DecrementStockResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
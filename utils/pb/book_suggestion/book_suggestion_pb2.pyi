@@ -5,12 +5,6 @@ from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Map
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
-class OrderIdStorageRequest(_message.Message):
-    __slots__ = ("orderId",)
-    ORDERID_FIELD_NUMBER: _ClassVar[int]
-    orderId: str
-    def __init__(self, orderId: _Optional[str] = ...) -> None: ...
-
 class BookSuggestionRequest(_message.Message):
     __slots__ = ("orderId", "user", "item", "creditCard", "vectorClock")
     ORDERID_FIELD_NUMBER: _ClassVar[int]
@@ -81,12 +75,6 @@ class Book(_message.Message):
     price: float
     def __init__(self, id: _Optional[str] = ..., title: _Optional[str] = ..., author: _Optional[str] = ..., description: _Optional[str] = ..., copies: _Optional[int] = ..., copiesAvailable: _Optional[int] = ..., category: _Optional[str] = ..., img: _Optional[str] = ..., price: _Optional[float] = ...) -> None: ...
 
-class OrderIdStorageResponse(_message.Message):
-    __slots__ = ("isValid",)
-    ISVALID_FIELD_NUMBER: _ClassVar[int]
-    isValid: bool
-    def __init__(self, isValid: bool = ...) -> None: ...
-
 class BookSuggestionResponse(_message.Message):
     __slots__ = ("isValid", "errorMessage", "books")
     ISVALID_FIELD_NUMBER: _ClassVar[int]
@@ -5,67 +5,6 @@ import grpc
 from utils.pb.book_suggestion import book_suggestion_pb2 as utils_dot_pb_dot_book__suggestion_dot_book__suggestion__pb2
 
 
-class OrderIdStorageServiceStub(object):
-    """Missing associated documentation comment in .proto file."""
-
-    def __init__(self, channel):
-        """Constructor.
-
-        Args:
-            channel: A grpc.Channel.
-        """
-        self.StorageOrderId = channel.unary_unary(
-                '/book_suggestion.OrderIdStorageService/StorageOrderId',
-                request_serializer=utils_dot_pb_dot_book__suggestion_dot_book__suggestion__pb2.OrderIdStorageRequest.SerializeToString,
-                response_deserializer=utils_dot_pb_dot_book__suggestion_dot_book__suggestion__pb2.OrderIdStorageResponse.FromString,
-                )
-
-
-class OrderIdStorageServiceServicer(object):
-    """Missing associated documentation comment in .proto file."""
-
-    def StorageOrderId(self, request, context):
-        """Missing associated documentation comment in .proto file."""
-        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-        context.set_details('Method not implemented!')
-        raise NotImplementedError('Method not implemented!')
-
-
-def add_OrderIdStorageServiceServicer_to_server(servicer, server):
-    rpc_method_handlers = {
-            'StorageOrderId': grpc.unary_unary_rpc_method_handler(
-                    servicer.StorageOrderId,
-                    request_deserializer=utils_dot_pb_dot_book__suggestion_dot_book__suggestion__pb2.OrderIdStorageRequest.FromString,
-                    response_serializer=utils_dot_pb_dot_book__suggestion_dot_book__suggestion__pb2.OrderIdStorageResponse.SerializeToString,
-            ),
-    }
-    generic_handler = grpc.method_handlers_generic_handler(
-            'book_suggestion.OrderIdStorageService', rpc_method_handlers)
-    server.add_generic_rpc_handlers((generic_handler,))
-
-
- # This class is part of an EXPERIMENTAL API.
-class OrderIdStorageService(object):
-    """Missing associated documentation comment in .proto file."""
-
-    @staticmethod
-    def StorageOrderId(request,
-            target,
-            options=(),
-            channel_credentials=None,
-            call_credentials=None,
-            insecure=False,
-            compression=None,
-            wait_for_ready=None,
-            timeout=None,
-            metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/book_suggestion.OrderIdStorageService/StorageOrderId',
-            utils_dot_pb_dot_book__suggestion_dot_book__suggestion__pb2.OrderIdStorageRequest.SerializeToString,
-            utils_dot_pb_dot_book__suggestion_dot_book__suggestion__pb2.OrderIdStorageResponse.FromString,
-            options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
-
-
 class BookSuggestionServiceStub(object):
     """Missing associated documentation comment in .proto file."""
 
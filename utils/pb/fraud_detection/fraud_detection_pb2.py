@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.utils/pb/fraud_detection/fraud_detection.proto\x12\x05hello\"\x1c\n\x0cHelloRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"!\n\rHelloResponse\x12\x10\n\x08greeting\x18\x01 \x01(\t\"(\n\x15OrderIdStorageRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\"\xb6\x01\n\x1dUserdataFraudDetectionRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x19\n\x04user\x18\x02 \x01(\x0b\x32\x0b.hello.User\x12\x19\n\x04item\x18\x03 \x01(\x0b\x32\x0b.hello.Item\x12%\n\ncreditCard\x18\x04 \x01(\x0b\x32\x11.hello.CreditCard\x12\'\n\x0bvectorClock\x18\x05 \x01(\x0b\x32\x12.hello.VectorClock\"\xb6\x01\n\x1d\x43\x61rdinfoFraudDetectionRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x19\n\x04user\x18\x02 \x01(\x0b\x32\x0b.hello.User\x12\x19\n\x04item\x18\x03 \x01(\x0b\x32\x0b.hello.Item\x12%\n\ncreditCard\x18\x04 \x01(\x0b\x32\x11.hello.CreditCard\x12\'\n\x0bvectorClock\x18\x05 \x01(\x0b\x32\x12.hello.VectorClock\"%\n\x04User\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontact\x18\x02 \x01(\t\"&\n\x04Item\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\"A\n\nCreditCard\x12\x0e\n\x06number\x18\x01 \x01(\t\x12\x16\n\x0e\x65xpirationDate\x18\x02 \x01(\t\x12\x0b\n\x03\x63vv\x18\x03 \x01(\t\"1\n\x0bVectorClock\x12\x0f\n\x07vcArray\x18\x01 \x03(\x05\x12\x11\n\ttimestamp\x18\x02 \x01(\x01\"\x9d\x01\n\x04\x42ook\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0e\n\x06\x63opies\x18\x05 \x01(\x05\x12\x17\n\x0f\x63opiesAvailable\x18\x06 \x01(\x05\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x0b\n\x03img\x18\x08 \x01(\t\x12\r\n\x05price\x18\t \x01(\x02\")\n\x16OrderIdStorageResponse\x12\x0f\n\x07isValid\x18\x01 \x01(\x08\"c\n\x1eUserdataFraudDetectionResponse\x12\x0f\n\x07isValid\x18\x01 \x01(\x08\x12\x14\n\x0c\x65rrorMessage\x18\x02 \x01(\t\x12\x1a\n\x05\x62ooks\x18\x03 \x03(\x0b\x32\x0b.hello.Book\"c\n\x1e\x43\x61rdinfoFraudDetectionResponse\x12\x0f\n\x07isValid\x18\x01 \x01(\x08\x12\x14\n\x0c\x65rrorMessage\x18\x02 \x01(\t\x12\x1a\n\x05\x62ooks\x18\x03 \x03(\x0b\x32\x0b.hello.Book2E\n\x0cHelloService\x12\x35\n\x08SayHello\x12\x13.hello.HelloRequest\x1a\x14.hello.HelloResponse2f\n\x15OrderIdStorageService\x12M\n\x0eStorageOrderId\x12\x1c.hello.OrderIdStorageRequest\x1a\x1d.hello.OrderIdStorageResponse2\x83\x01\n\x1dUserdataFraudDetectionService\x12\x62\n\x13\x44\x65tectUserdataFraud\x12$.hello.UserdataFraudDetectionRequest\x1a%.hello.UserdataFraudDetectionResponse2\x83\x01\n\x1d\x43\x61rdinfoFraudDetectionService\x12\x62\n\x13\x44\x65tectCardinfoFraud\x12$.hello.CardinfoFraudDetectionRequest\x1a%.hello.CardinfoFraudDetectionResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n.utils/pb/fraud_detection/fraud_detection.proto\x12\x05hello\"\x1c\n\x0cHelloRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"!\n\rHelloResponse\x12\x10\n\x08greeting\x18\x01 \x01(\t\"\xb6\x01\n\x1dUserdataFraudDetectionRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x19\n\x04user\x18\x02 \x01(\x0b\x32\x0b.hello.User\x12\x19\n\x04item\x18\x03 \x01(\x0b\x32\x0b.hello.Item\x12%\n\ncreditCard\x18\x04 \x01(\x0b\x32\x11.hello.CreditCard\x12\'\n\x0bvectorClock\x18\x05 \x01(\x0b\x32\x12.hello.VectorClock\"\xb6\x01\n\x1d\x43\x61rdinfoFraudDetectionRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x19\n\x04user\x18\x02 \x01(\x0b\x32\x0b.hello.User\x12\x19\n\x04item\x18\x03 \x01(\x0b\x32\x0b.hello.Item\x12%\n\ncreditCard\x18\x04 \x01(\x0b\x32\x11.hello.CreditCard\x12\'\n\x0bvectorClock\x18\x05 \x01(\x0b\x32\x12.hello.VectorClock\"\xb4\x01\n\x0c\x45ventRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\r\n\x05\x65vent\x18\x02 \x01(\t\x12\x19\n\x04user\x18\x03 \x01(\x0b\x32\x0b.hello.User\x12\x19\n\x04item\x18\x04 \x01(\x0b\x32\x0b.hello.Item\x12%\n\ncreditCard\x18\x05 \x01(\x0b\x32\x11.hello.CreditCard\x12\'\n\x0bvectorClock\x18\x06 \x01(\x0b\x32\x12.hello.VectorClock\"%\n\x04User\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontact\x18\x02 \x01(\t\"&\n\x04Item\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\"A\n\nCreditCard\x12\x0e\n\x06number\x18\x01 \x01(\t\x12\x16\n\x0e\x65xpirationDate\x18\x02 \x01(\t\x12\x0b\n\x03\x63vv\x18\x03 \x01(\t\"1\n\x0bVectorClock\x12\x0f\n\x07vcArray\x18\x01 \x03(\x05\x12\x11\n\ttimestamp\x18\x02 \x01(\x01\"\x9d\x01\n\x04\x42ook\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0e\n\x06\x63opies\x18\x05 \x01(\x05\x12\x17\n\x0f\x63opiesAvailable\x18\x06 \x01(\x05\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x0b\n\x03img\x18\x08 \x01(\t\x12\r\n\x05price\x18\t \x01(\x02\"c\n\x1eUserdataFraudDetectionResponse\x12\x0f\n\x07isValid\x18\x01 \x01(\x08\x12\x14\n\x0c\x65rrorMessage\x18\x02 \x01(\t\x12\x1a\n\x05\x62ooks\x18\x03 \x03(\x0b\x32\x0b.hello.Book\"c\n\x1e\x43\x61rdinfoFraudDetectionResponse\x12\x0f\n\x07isValid\x18\x01 \x01(\x08\x12\x14\n\x0c\x65rrorMessage\x18\x02 \x01(\t\x12\x1a\n\x05\x62ooks\x18\x03 \x03(\x0b\x32\x0b.hello.Book\"_\n\rEventResponse\x12\x0f\n\x07isValid\x18\x01 \x01(\x08\x12\x14\n\x0c\x65rrorMessage\x18\x02 \x01(\t\x12\'\n\x0bvectorClock\x18\x03 \x01(\x0b\x32\x12.hello.VectorClock2E\n\x0cHelloService\x12\x35\n\x08SayHello\x12\x13.hello.HelloRequest\x1a\x14.hello.HelloResponse2\x83\x01\n\x1dUserdataFraudDetectionService\x12\x62\n\x13\x44\x65tectUserdataFraud\x12$.hello.UserdataFraudDetectionRequest\x1a%.hello.UserdataFraudDetectionResponse2\x83\x01\n\x1d\x43\x61rdinfoFraudDetectionService\x12\x62\n\x13\x44\x65tectCardinfoFraud\x12$.hello.CardinfoFraudDetectionRequest\x1a%.hello.CardinfoFraudDetectionResponse2E\n\x0c\x45ventService\x12\x35\n\x08RunEvent\x12\x13.hello.EventRequest\x1a\x14.hello.EventResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -25,34 +25,34 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_HELLOREQUEST']._serialized_end=85
   _globals['_HELLORESPONSE']._serialized_start=87
   _globals['_HELLORESPONSE']._serialized_end=120
-  _globals['_ORDERIDSTORAGEREQUEST']._serialized_start=122
-  _globals['_ORDERIDSTORAGEREQUEST']._serialized_end=162
-  _globals['_USERDATAFRAUDDETECTIONREQUEST']._serialized_start=165
-  _globals['_USERDATAFRAUDDETECTIONREQUEST']._serialized_end=347
-  _globals['_CARDINFOFRAUDDETECTIONREQUEST']._serialized_start=350
-  _globals['_CARDINFOFRAUDDETECTIONREQUEST']._serialized_end=532
-  _globals['_USER']._serialized_start=534
-  _globals['_USER']._serialized_end=571
-  _globals['_ITEM']._serialized_start=573
-  _globals['_ITEM']._serialized_end=611
-  _globals['_CREDITCARD']._serialized_start=613
-  _globals['_CREDITCARD']._serialized_end=678
-  _globals['_VECTORCLOCK']._serialized_start=680
-  _globals['_VECTORCLOCK']._serialized_end=729
-  _globals['_BOOK']._serialized_start=732
-  _globals['_BOOK']._serialized_end=889
-  _globals['_ORDERIDSTORAGERESPONSE']._serialized_start=891
-  _globals['_ORDERIDSTORAGERESPONSE']._serialized_end=932
-  _globals['_USERDATAFRAUDDETECTIONRESPONSE']._serialized_start=934
-  _globals['_USERDATAFRAUDDETECTIONRESPONSE']._serialized_end=1033
-  _globals['_CARDINFOFRAUDDETECTIONRESPONSE']._serialized_start=1035
-  _globals['_CARDINFOFRAUDDETECTIONRESPONSE']._serialized_end=1134
-  _globals['_HELLOSERVICE']._serialized_start=1136
-  _globals['_HELLOSERVICE']._serialized_end=1205
-  _globals['_ORDERIDSTORAGESERVICE']._serialized_start=1207
-  _globals['_ORDERIDSTORAGESERVICE']._serialized_end=1309
-  _globals['_USERDATAFRAUDDETECTIONSERVICE']._serialized_start=1312
-  _globals['_USERDATAFRAUDDETECTIONSERVICE']._serialized_end=1443
-  _globals['_CARDINFOFRAUDDETECTIONSERVICE']._serialized_start=1446
-  _globals['_CARDINFOFRAUDDETECTIONSERVICE']._serialized_end=1577
+  _globals['_USERDATAFRAUDDETECTIONREQUEST']._serialized_start=123
+  _globals['_USERDATAFRAUDDETECTIONREQUEST']._serialized_end=305
+  _globals['_CARDINFOFRAUDDETECTIONREQUEST']._serialized_start=308
+  _globals['_CARDINFOFRAUDDETECTIONREQUEST']._serialized_end=490
+  _globals['_EVENTREQUEST']._serialized_start=493
+  _globals['_EVENTREQUEST']._serialized_end=673
+  _globals['_USER']._serialized_start=675
+  _globals['_USER']._serialized_end=712
+  _globals['_ITEM']._serialized_start=714
+  _globals['_ITEM']._serialized_end=752
+  _globals['_CREDITCARD']._serialized_start=754
+  _globals['_CREDITCARD']._serialized_end=819
+  _globals['_VECTORCLOCK']._serialized_start=821
+  _globals['_VECTORCLOCK']._serialized_end=870
+  _globals['_BOOK']._serialized_start=873
+  _globals['_BOOK']._serialized_end=1030
+  _globals['_USERDATAFRAUDDETECTIONRESPONSE']._serialized_start=1032
+  _globals['_USERDATAFRAUDDETECTIONRESPONSE']._serialized_end=1131
+  _globals['_CARDINFOFRAUDDETECTIONRESPONSE']._serialized_start=1133
+  _globals['_CARDINFOFRAUDDETECTIONRESPONSE']._serialized_end=1232
+  _globals['_EVENTRESPONSE']._serialized_start=1234
+  _globals['_EVENTRESPONSE']._serialized_end=1329
+  _globals['_HELLOSERVICE']._serialized_start=1331
+  _globals['_HELLOSERVICE']._serialized_end=1400
+  _globals['_USERDATAFRAUDDETECTIONSERVICE']._serialized_start=1403
+  _globals['_USERDATAFRAUDDETECTIONSERVICE']._serialized_end=1534
+  _globals['_CARDINFOFRAUDDETECTIONSERVICE']._serialized_start=1537
+  _globals['_CARDINFOFRAUDDETECTIONSERVICE']._serialized_end=1668
+  _globals['_EVENTSERVICE']._serialized_start=1670
+  _globals['_EVENTSERVICE']._serialized_end=1739
 # @@protoc_insertion_point(module_scope)
@@ -17,12 +17,6 @@ class HelloResponse(_message.Message):
     greeting: str
     def __init__(self, greeting: _Optional[str] = ...) -> None: ...
 
-class OrderIdStorageRequest(_message.Message):
-    __slots__ = ("orderId",)
-    ORDERID_FIELD_NUMBER: _ClassVar[int]
-    orderId: str
-    def __init__(self, orderId: _Optional[str] = ...) -> None: ...
-
 class UserdataFraudDetectionRequest(_message.Message):
     __slots__ = ("orderId", "user", "item", "creditCard", "vectorClock")
     ORDERID_FIELD_NUMBER: _ClassVar[int]
@@ -51,6 +45,22 @@ class CardinfoFraudDetectionRequest(_message.Message):
     vectorClock: VectorClock
     def __init__(self, orderId: _Optional[str] = ..., user: _Optional[_Union[User, _Mapping]] = ..., item: _Optional[_Union[Item, _Mapping]] = ..., creditCard: _Optional[_Union[CreditCard, _Mapping]] = ..., vectorClock: _Optional[_Union[VectorClock, _Mapping]] = ...) -> None: ...
 
+class EventRequest(_message.Message):
+    __slots__ = ("orderId", "event", "user", "item", "creditCard", "vectorClock")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    EVENT_FIELD_NUMBER: _ClassVar[int]
+    USER_FIELD_NUMBER: _ClassVar[int]
+    ITEM_FIELD_NUMBER: _ClassVar[int]
+    CREDITCARD_FIELD_NUMBER: _ClassVar[int]
+    VECTORCLOCK_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    event: str
+    user: User
+    item: Item
+    creditCard: CreditCard
+    vectorClock: VectorClock
+    def __init__(self, orderId: _Optional[str] = ..., event: _Optional[str] = ..., user: _Optional[_Union[User, _Mapping]] = ..., item: _Optional[_Union[Item, _Mapping]] = ..., creditCard: _Optional[_Union[CreditCard, _Mapping]] = ..., vectorClock: _Optional[_Union[VectorClock, _Mapping]] = ...) -> None: ...
+
 class User(_message.Message):
     __slots__ = ("name", "contact")
     NAME_FIELD_NUMBER: _ClassVar[int]
@@ -107,12 +117,6 @@ class Book(_message.Message):
     price: float
     def __init__(self, id: _Optional[str] = ..., title: _Optional[str] = ..., author: _Optional[str] = ..., description: _Optional[str] = ..., copies: _Optional[int] = ..., copiesAvailable: _Optional[int] = ..., category: _Optional[str] = ..., img: _Optional[str] = ..., price: _Optional[float] = ...) -> None: ...
 
-class OrderIdStorageResponse(_message.Message):
-    __slots__ = ("isValid",)
-    ISVALID_FIELD_NUMBER: _ClassVar[int]
-    isValid: bool
-    def __init__(self, isValid: bool = ...) -> None: ...
-
 class UserdataFraudDetectionResponse(_message.Message):
     __slots__ = ("isValid", "errorMessage", "books")
     ISVALID_FIELD_NUMBER: _ClassVar[int]
@@ -132,3 +136,13 @@ class CardinfoFraudDetectionResponse(_message.Message):
     errorMessage: str
     books: _containers.RepeatedCompositeFieldContainer[Book]
     def __init__(self, isValid: bool = ..., errorMessage: _Optional[str] = ..., books: _Optional[_Iterable[_Union[Book, _Mapping]]] = ...) -> None: ...
+
+class EventResponse(_message.Message):
+    __slots__ = ("isValid", "errorMessage", "vectorClock")
+    ISVALID_FIELD_NUMBER: _ClassVar[int]
+    ERRORMESSAGE_FIELD_NUMBER: _ClassVar[int]
+    VECTORCLOCK_FIELD_NUMBER: _ClassVar[int]
+    isValid: bool
+    errorMessage: str
+    vectorClock: VectorClock
+    def __init__(self, isValid: bool = ..., errorMessage: _Optional[str] = ..., vectorClock: _Optional[_Union[VectorClock, _Mapping]] = ...) -> None: ...
@@ -66,7 +66,7 @@ class HelloService(object):
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
 
-class OrderIdStorageServiceStub(object):
+class UserdataFraudDetectionServiceStub(object):
     """Missing associated documentation comment in .proto file."""
 
     def __init__(self, channel):
@@ -75,42 +75,42 @@ class OrderIdStorageServiceStub(object):
         Args:
             channel: A grpc.Channel.
         """
-        self.StorageOrderId = channel.unary_unary(
-                '/hello.OrderIdStorageService/StorageOrderId',
-                request_serializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.OrderIdStorageRequest.SerializeToString,
-                response_deserializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.OrderIdStorageResponse.FromString,
+        self.DetectUserdataFraud = channel.unary_unary(
+                '/hello.UserdataFraudDetectionService/DetectUserdataFraud',
+                request_serializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.UserdataFraudDetectionRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.UserdataFraudDetectionResponse.FromString,
                 )
 
 
-class OrderIdStorageServiceServicer(object):
+class UserdataFraudDetectionServiceServicer(object):
     """Missing associated documentation comment in .proto file."""
 
-    def StorageOrderId(self, request, context):
+    def DetectUserdataFraud(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
 
-def add_OrderIdStorageServiceServicer_to_server(servicer, server):
+def add_UserdataFraudDetectionServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
-            'StorageOrderId': grpc.unary_unary_rpc_method_handler(
-                    servicer.StorageOrderId,
-                    request_deserializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.OrderIdStorageRequest.FromString,
-                    response_serializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.OrderIdStorageResponse.SerializeToString,
+            'DetectUserdataFraud': grpc.unary_unary_rpc_method_handler(
+                    servicer.DetectUserdataFraud,
+                    request_deserializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.UserdataFraudDetectionRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.UserdataFraudDetectionResponse.SerializeToString,
             ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
-            'hello.OrderIdStorageService', rpc_method_handlers)
+            'hello.UserdataFraudDetectionService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
 
 
  # This class is part of an EXPERIMENTAL API.
-class OrderIdStorageService(object):
+class UserdataFraudDetectionService(object):
     """Missing associated documentation comment in .proto file."""
 
     @staticmethod
-    def StorageOrderId(request,
+    def DetectUserdataFraud(request,
             target,
             options=(),
             channel_credentials=None,
@@ -120,14 +120,14 @@ class OrderIdStorageService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/hello.OrderIdStorageService/StorageOrderId',
-            utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.OrderIdStorageRequest.SerializeToString,
-            utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.OrderIdStorageResponse.FromString,
+        return grpc.experimental.unary_unary(request, target, '/hello.UserdataFraudDetectionService/DetectUserdataFraud',
+            utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.UserdataFraudDetectionRequest.SerializeToString,
+            utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.UserdataFraudDetectionResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
 
-class UserdataFraudDetectionServiceStub(object):
+class CardinfoFraudDetectionServiceStub(object):
     """Missing associated documentation comment in .proto file."""
 
     def __init__(self, channel):
@@ -136,42 +136,42 @@ class UserdataFraudDetectionServiceStub(object):
         Args:
             channel: A grpc.Channel.
         """
-        self.DetectUserdataFraud = channel.unary_unary(
-                '/hello.UserdataFraudDetectionService/DetectUserdataFraud',
-                request_serializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.UserdataFraudDetectionRequest.SerializeToString,
-                response_deserializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.UserdataFraudDetectionResponse.FromString,
+        self.DetectCardinfoFraud = channel.unary_unary(
+                '/hello.CardinfoFraudDetectionService/DetectCardinfoFraud',
+                request_serializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.CardinfoFraudDetectionRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.CardinfoFraudDetectionResponse.FromString,
                 )
 
 
-class UserdataFraudDetectionServiceServicer(object):
+class CardinfoFraudDetectionServiceServicer(object):
     """Missing associated documentation comment in .proto file."""
 
-    def DetectUserdataFraud(self, request, context):
+    def DetectCardinfoFraud(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
 
-def add_UserdataFraudDetectionServiceServicer_to_server(servicer, server):
+def add_CardinfoFraudDetectionServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
-            'DetectUserdataFraud': grpc.unary_unary_rpc_method_handler(
-                    servicer.DetectUserdataFraud,
-                    request_deserializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.UserdataFraudDetectionRequest.FromString,
-                    response_serializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.UserdataFraudDetectionResponse.SerializeToString,
+            'DetectCardinfoFraud': grpc.unary_unary_rpc_method_handler(
+                    servicer.DetectCardinfoFraud,
+                    request_deserializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.CardinfoFraudDetectionRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.CardinfoFraudDetectionResponse.SerializeToString,
             ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
-            'hello.UserdataFraudDetectionService', rpc_method_handlers)
+            'hello.CardinfoFraudDetectionService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
 
 
  # This class is part of an EXPERIMENTAL API.
-class UserdataFraudDetectionService(object):
+class CardinfoFraudDetectionService(object):
     """Missing associated documentation comment in .proto file."""
 
     @staticmethod
-    def DetectUserdataFraud(request,
+    def DetectCardinfoFraud(request,
             target,
             options=(),
             channel_credentials=None,
@@ -181,15 +181,17 @@ class UserdataFraudDetectionService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/hello.UserdataFraudDetectionService/DetectUserdataFraud',
-            utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.UserdataFraudDetectionRequest.SerializeToString,
-            utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.UserdataFraudDetectionResponse.FromString,
+        return grpc.experimental.unary_unary(request, target, '/hello.CardinfoFraudDetectionService/DetectCardinfoFraud',
+            utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.CardinfoFraudDetectionRequest.SerializeToString,
+            utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.CardinfoFraudDetectionResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
 
-class CardinfoFraudDetectionServiceStub(object):
-    """Missing associated documentation comment in .proto file."""
+class EventServiceStub(object):
+    """Run a single event of the checkout, without calling the next service.
+    The orchestrator runs the checkout this way in the DAG mode.
+    """
 
     def __init__(self, channel):
         """Constructor.
@@ -197,42 +199,46 @@ class CardinfoFraudDetectionServiceStub(object):
         Args:
             channel: A grpc.Channel.
         """
-        self.DetectCardinfoFraud = channel.unary_unary(
-                '/hello.CardinfoFraudDetectionService/DetectCardinfoFraud',
-                request_serializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.CardinfoFraudDetectionRequest.SerializeToString,
-                response_deserializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.CardinfoFraudDetectionResponse.FromString,
+        self.RunEvent = channel.unary_unary(
+                '/hello.EventService/RunEvent',
+                request_serializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.EventRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.EventResponse.FromString,
                 )
 
 
-class CardinfoFraudDetectionServiceServicer(object):
-    """Missing associated documentation comment in .proto file."""
+class EventServiceServicer(object):
+    """Run a single event of the checkout, without calling the next service.
+    The orchestrator runs the checkout this way in the DAG mode.
+    """
 
-    def DetectCardinfoFraud(self, request, context):
+    def RunEvent(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
 
-def add_CardinfoFraudDetectionServiceServicer_to_server(servicer, server):
+def add_EventServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
-            'DetectCardinfoFraud': grpc.unary_unary_rpc_method_handler(
-                    servicer.DetectCardinfoFraud,
-                    request_deserializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.CardinfoFraudDetectionRequest.FromString,
-                    response_serializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.CardinfoFraudDetectionResponse.SerializeToString,
+            'RunEvent': grpc.unary_unary_rpc_method_handler(
+                    servicer.RunEvent,
+                    request_deserializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.EventRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.EventResponse.SerializeToString,
             ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
-            'hello.CardinfoFraudDetectionService', rpc_method_handlers)
+            'hello.EventService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
 
 
  # This class is part of an EXPERIMENTAL API.
-class CardinfoFraudDetectionService(object):
-    """Missing associated documentation comment in .proto file."""
+class EventService(object):
+    """Run a single event of the checkout, without calling the next service.
+    The orchestrator runs the checkout this way in the DAG mode.
+    """
 
     @staticmethod
-    def DetectCardinfoFraud(request,
+    def RunEvent(request,
             target,
             options=(),
             channel_credentials=None,
@@ -242,8 +248,8 @@ class CardinfoFraudDetectionService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/hello.CardinfoFraudDetectionService/DetectCardinfoFraud',
-            utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.CardinfoFraudDetectionRequest.SerializeToString,
-            utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.CardinfoFraudDetectionResponse.FromString,
+        return grpc.experimental.unary_unary(request, target, '/hello.EventService/RunEvent',
+            utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.EventRequest.SerializeToString,
+            utils_dot_pb_dot_fraud__detection_dot_fraud__detection__pb2.EventResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
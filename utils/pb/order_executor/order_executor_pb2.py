@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n,utils/pb/order_executor/order_executor.proto\x12\x0eorder_executor\"\x16\n\x05Token\x12\r\n\x05token\x18\x01 \x01(\t\" \n\rTokenResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\r\n\x0bVoteRequest\"\x1f\n\x0cVoteResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\x14\n\x12HealthCheckRequest\"$\n\x13HealthCheckResponse\x12\r\n\x05\x61live\x18\x01 \x01(\x08\x32\x86\x02\n\x14OrderExecutorService\x12\x41\n\tPassToken\x12\x15.order_executor.Token\x1a\x1d.order_executor.TokenResponse\x12V\n\x0b\x43heckHealth\x12\".order_executor.HealthCheckRequest\x1a#.order_executor.HealthCheckResponse\x12S\n\x16SendVoteToParticipants\x12\x1b.order_executor.VoteRequest\x1a\x1c.order_executor.VoteResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n,utils/pb/order_executor/order_executor.proto\x12\x0eorder_executor\"\x16\n\x05Token\x12\r\n\x05token\x18\x01 \x01(\t\" \n\rTokenResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\r\n\x0bVoteRequest\"\x1f\n\x0cVoteResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\x14\n\x12HealthCheckRequest\"$\n\x13HealthCheckResponse\x12\r\n\x05\x61live\x18\x01 \x01(\x08\"\'\n\x14QueryDecisionRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\"8\n\x15QueryDecisionResponse\x12\x0f\n\x07\x64\x65\x63ided\x18\x01 \x01(\x08\x12\x0e\n\x06\x63ommit\x18\x02 \x01(\x08\x32\xe4\x02\n\x14OrderExecutorService\x12\x41\n\tPassToken\x12\x15.order_executor.Token\x1a\x1d.order_executor.TokenResponse\x12V\n\x0b\x43heckHealth\x12\".order_executor.HealthCheckRequest\x1a#.order_executor.HealthCheckResponse\x12S\n\x16SendVoteToParticipants\x12\x1b.order_executor.VoteRequest\x1a\x1c.order_executor.VoteResponse\x12\\\n\rQueryDecision\x12$.order_executor.QueryDecisionRequest\x1a%.order_executor.QueryDecisionResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -33,6 +33,10 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_HEALTHCHECKREQUEST']._serialized_end=190
   _globals['_HEALTHCHECKRESPONSE']._serialized_start=192
   _globals['_HEALTHCHECKRESPONSE']._serialized_end=228
-  _globals['_ORDEREXECUTORSERVICE']._serialized_start=231
-  _globals['_ORDEREXECUTORSERVICE']._serialized_end=493
+  _globals['_QUERYDECISIONREQUEST']._serialized_start=230
+  _globals['_QUERYDECISIONREQUEST']._serialized_end=269
+  _globals['_QUERYDECISIONRESPONSE']._serialized_start=271
+  _globals['_QUERYDECISIONRESPONSE']._serialized_end=327
+  _globals['_ORDEREXECUTORSERVICE']._serialized_start=330
+  _globals['_ORDEREXECUTORSERVICE']._serialized_end=686
 # @@protoc_insertion_point(module_scope)
@@ -35,3 +35,17 @@ class HealthCheckResponse(_message.Message):
     ALIVE_FIELD_NUMBER: _ClassVar[int]
     alive: bool
     def __init__(self, alive: bool = ...) -> None: ...
+
+class QueryDecisionRequest(_message.Message):
+    __slots__ = ("orderId",)
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    def __init__(self, orderId: _Optional[str] = ...) -> None: ...
+
+class QueryDecisionResponse(_message.Message):
+    __slots__ = ("decided", "commit")
+    DECIDED_FIELD_NUMBER: _ClassVar[int]
+    COMMIT_FIELD_NUMBER: _ClassVar[int]
+    decided: bool
+    commit: bool
+    def __init__(self, decided: bool = ..., commit: bool = ...) -> None: ...
@@ -29,6 +29,11 @@ class OrderExecutorServiceStub(object):
                 request_serializer=utils_dot_pb_dot_order__executor_dot_order__executor__pb2.VoteRequest.SerializeToString,
                 response_deserializer=utils_dot_pb_dot_order__executor_dot_order__executor__pb2.VoteResponse.FromString,
                 )
+        self.QueryDecision = channel.unary_unary(
+                '/order_executor.OrderExecutorService/QueryDecision',
+                request_serializer=utils_dot_pb_dot_order__executor_dot_order__executor__pb2.QueryDecisionRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_order__executor_dot_order__executor__pb2.QueryDecisionResponse.FromString,
+                )
 
 
 class OrderExecutorServiceServicer(object):
@@ -52,6 +57,12 @@ class OrderExecutorServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def QueryDecision(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_OrderExecutorServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -70,6 +81,11 @@ def add_OrderExecutorServiceServicer_to_server(servicer, server):
                     request_deserializer=utils_dot_pb_dot_order__executor_dot_order__executor__pb2.VoteRequest.FromString,
                     response_serializer=utils_dot_pb_dot_order__executor_dot_order__executor__pb2.VoteResponse.SerializeToString,
             ),
+            'QueryDecision': grpc.unary_unary_rpc_method_handler(
+                    servicer.QueryDecision,
+                    request_deserializer=utils_dot_pb_dot_order__executor_dot_order__executor__pb2.QueryDecisionRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_order__executor_dot_order__executor__pb2.QueryDecisionResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'order_executor.OrderExecutorService', rpc_method_handlers)
@@ -130,3 +146,20 @@ class OrderExecutorService(object):
             utils_dot_pb_dot_order__executor_dot_order__executor__pb2.VoteResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def QueryDecision(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/order_executor.OrderExecutorService/QueryDecision',
+            utils_dot_pb_dot_order__executor_dot_order__executor__pb2.QueryDecisionRequest.SerializeToString,
+            utils_dot_pb_dot_order__executor_dot_order__executor__pb2.QueryDecisionResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n&utils/pb/order_queue/order_queue.proto\x12\x0border_queue\"%\n\x04User\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontact\x18\x02 \x01(\t\"\x9d\x01\n\x04\x42ook\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0e\n\x06\x63opies\x18\x05 \x01(\x05\x12\x17\n\x0f\x63opiesAvailable\x18\x06 \x01(\x05\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x0b\n\x03img\x18\x08 \x01(\t\x12\r\n\x05price\x18\t \x01(\x02\"9\n\x04Item\x12\x1f\n\x04\x62ook\x18\x01 \x01(\x0b\x32\x11.order_queue.Book\x12\x10\n\x08quantity\x18\x02 \x01(\x05\"A\n\nCreditCard\x12\x0e\n\x06number\x18\x01 \x01(\t\x12\x16\n\x0e\x65xpirationDate\x18\x02 \x01(\t\x12\x0b\n\x03\x63vv\x18\x03 \x01(\t\"\xc8\x01\n\x05Order\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x1f\n\x04user\x18\x02 \x01(\x0b\x32\x11.order_queue.User\x12 \n\x05items\x18\x03 \x03(\x0b\x32\x11.order_queue.Item\x12+\n\ncreditCard\x18\x04 \x01(\x0b\x32\x17.order_queue.CreditCard\x12,\n\x07\x61\x64\x64ress\x18\x05 \x01(\x0b\x32\x1b.order_queue.BillingAddress\x12\x10\n\x08priority\x18\x06 \x01(\x02\"[\n\x0e\x42illingAddress\x12\x0e\n\x06street\x18\x01 \x01(\t\x12\x0c\n\x04\x63ity\x18\x02 \x01(\t\x12\r\n\x05state\x18\x03 \x01(\t\x12\x0b\n\x03zip\x18\x04 \x01(\t\x12\x0f\n\x07\x63ountry\x18\x05 \x01(\t\"3\n\x0e\x45nqueueRequest\x12!\n\x05order\x18\x01 \x01(\x0b\x32\x12.order_queue.Order\"\"\n\x0f\x45nqueueResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\x10\n\x0e\x44\x65queueRequest\"E\n\x0f\x44\x65queueResponse\x12!\n\x05order\x18\x01 \x01(\x0b\x32\x12.order_queue.Order\x12\x0f\n\x07success\x18\x02 \x01(\x08\x32\x9f\x01\n\x11OrderQueueService\x12\x44\n\x07\x45nqueue\x12\x1b.order_queue.EnqueueRequest\x1a\x1c.order_queue.EnqueueResponse\x12\x44\n\x07\x44\x65queue\x12\x1b.order_queue.DequeueRequest\x1a\x1c.order_queue.DequeueResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n&utils/pb/order_queue/order_queue.proto\x12\x0border_queue\"%\n\x04User\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontact\x18\x02 \x01(\t\"\x9d\x01\n\x04\x42ook\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0e\n\x06\x63opies\x18\x05 \x01(\x05\x12\x17\n\x0f\x63opiesAvailable\x18\x06 \x01(\x05\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x0b\n\x03img\x18\x08 \x01(\t\x12\r\n\x05price\x18\t \x01(\x02\"9\n\x04Item\x12\x1f\n\x04\x62ook\x18\x01 \x01(\x0b\x32\x11.order_queue.Book\x12\x10\n\x08quantity\x18\x02 \x01(\x05\"A\n\nCreditCard\x12\x0e\n\x06number\x18\x01 \x01(\t\x12\x16\n\x0e\x65xpirationDate\x18\x02 \x01(\t\x12\x0b\n\x03\x63vv\x18\x03 \x01(\t\"\xc8\x01\n\x05Order\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x1f\n\x04user\x18\x02 \x01(\x0b\x32\x11.order_queue.User\x12 \n\x05items\x18\x03 \x03(\x0b\x32\x11.order_queue.Item\x12+\n\ncreditCard\x18\x04 \x01(\x0b\x32\x17.order_queue.CreditCard\x12,\n\x07\x61\x64\x64ress\x18\x05 \x01(\x0b\x32\x1b.order_queue.BillingAddress\x12\x10\n\x08priority\x18\x06 \x01(\x02\"[\n\x0e\x42illingAddress\x12\x0e\n\x06street\x18\x01 \x01(\t\x12\x0c\n\x04\x63ity\x18\x02 \x01(\t\x12\r\n\x05state\x18\x03 \x01(\t\x12\x0b\n\x03zip\x18\x04 \x01(\t\x12\x0f\n\x07\x63ountry\x18\x05 \x01(\t\"3\n\x0e\x45nqueueRequest\x12!\n\x05order\x18\x01 \x01(\x0b\x32\x12.order_queue.Order\"\"\n\x0f\x45nqueueResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"`\n\x0e\x44\x65queueRequest\x12\x0e\n\x06waitMs\x18\x01 \x01(\x05\x12\x1b\n\x13visibilityTimeoutMs\x18\x02 \x01(\x05\x12\x12\n\npartitions\x18\x03 \x03(\x05\x12\r\n\x05steal\x18\x04 \x01(\x08\"^\n\x0f\x44\x65queueResponse\x12!\n\x05order\x18\x01 \x01(\x0b\x32\x12.order_queue.Order\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x17\n\x0f\x64\x65liveryAttempt\x18\x03 \x01(\x05\"\x8a\x01\n\x13\x44\x65queueBatchRequest\x12\x11\n\tmaxOrders\x18\x01 \x01(\x05\x12\x10\n\x08maxBytes\x18\x02 \x01(\x03\x12\x0e\n\x06waitMs\x18\x03 \x01(\x05\x12\x1b\n\x13visibilityTimeoutMs\x18\x04 \x01(\x05\x12\x12\n\npartitions\x18\x05 \x03(\x05\x12\r\n\x05steal\x18\x06 \x01(\x08\"K\n\x14\x44\x65queueBatchResponse\x12\"\n\x06orders\x18\x01 \x03(\x0b\x32\x12.order_queue.Order\x12\x0f\n\x07success\x18\x02 \x01(\x08\"\x1d\n\nAckRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\"\x1e\n\x0b\x41\x63kResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\x1e\n\x0bNackRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\"5\n\x0cNackResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x14\n\x0c\x64\x65\x61\x64Lettered\x18\x02 \x01(\x08\"B\n\x12\x45xtendLeaseRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x1b\n\x13visibilityTimeoutMs\x18\x02 \x01(\x05\"&\n\x13\x45xtendLeaseResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\x14\n\x12\x44\x65\x61\x64LettersRequest\"9\n\x13\x44\x65\x61\x64LettersResponse\x12\"\n\x06orders\x18\x01 \x03(\x0b\x32\x12.order_queue.Order\" \n\rCancelRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\"!\n\x0e\x43\x61ncelResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"8\n\x13ReprioritizeRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x10\n\x08priority\x18\x02 \x01(\x02\"\'\n\x14ReprioritizeResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"6\n\x11QueueStatsRequest\x12\x0c\n\x04topK\x18\x01 \x01(\x05\x12\x13\n\x0b\x62ucketWidth\x18\x02 \x01(\x02\"3\n\x0ePriorityBucket\x12\x12\n\nlowerBound\x18\x01 \x01(\x02\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"n\n\x0bQueuedOrder\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x10\n\x08priority\x18\x02 \x01(\x02\x12\x19\n\x11\x65\x66\x66\x65\x63tivePriority\x18\x03 \x01(\x01\x12\x12\n\nageSeconds\x18\x04 \x01(\x01\x12\r\n\x05items\x18\x05 \x01(\x05\"B\n\x0ePartitionStats\x12\x11\n\tpartition\x18\x01 \x01(\x05\x12\r\n\x05\x64\x65pth\x18\x02 \x01(\x05\x12\x0e\n\x06leased\x18\x03 \x01(\x05\"\xeb\x01\n\x12QueueStatsResponse\x12\r\n\x05\x64\x65pth\x18\x01 \x01(\x05\x12\x18\n\x10oldestAgeSeconds\x18\x02 \x01(\x01\x12.\n\thistogram\x18\x03 \x03(\x0b\x32\x1b.order_queue.PriorityBucket\x12%\n\x03top\x18\x04 \x03(\x0b\x32\x18.order_queue.QueuedOrder\x12\x0e\n\x06leased\x18\x05 \x01(\x05\x12\x14\n\x0c\x64\x65\x61\x64Lettered\x18\x06 \x01(\x05\x12/\n\npartitions\x18\x07 \x03(\x0b\x32\x1b.order_queue.PartitionStats2\xfc\x05\n\x11OrderQueueService\x12\x44\n\x07\x45nqueue\x12\x1b.order_queue.EnqueueRequest\x1a\x1c.order_queue.EnqueueResponse\x12\x44\n\x07\x44\x65queue\x12\x1b.order_queue.DequeueRequest\x1a\x1c.order_queue.DequeueResponse\x12S\n\x0c\x44\x65queueBatch\x12 .order_queue.DequeueBatchRequest\x1a!.order_queue.DequeueBatchResponse\x12\x38\n\x03\x41\x63k\x12\x17.order_queue.AckRequest\x1a\x18.order_queue.AckResponse\x12;\n\x04Nack\x12\x18.order_queue.NackRequest\x1a\x19.order_queue.NackResponse\x12P\n\x0b\x45xtendLease\x12\x1f.order_queue.ExtendLeaseRequest\x1a .order_queue.ExtendLeaseResponse\x12S\n\x0eGetDeadLetters\x12\x1f.order_queue.DeadLettersRequest\x1a .order_queue.DeadLettersResponse\x12\x41\n\x06\x43\x61ncel\x12\x1a.order_queue.CancelRequest\x1a\x1b.order_queue.CancelResponse\x12S\n\x0cReprioritize\x12 .order_queue.ReprioritizeRequest\x1a!.order_queue.ReprioritizeResponse\x12P\n\rGetQueueStats\x12\x1e.order_queue.QueueStatsRequest\x1a\x1f.order_queue.QueueStatsResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -38,9 +38,47 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_ENQUEUERESPONSE']._serialized_start=729
   _globals['_ENQUEUERESPONSE']._serialized_end=763
   _globals['_DEQUEUEREQUEST']._serialized_start=765
-  _globals['_DEQUEUEREQUEST']._serialized_end=781
-  _globals['_DEQUEUERESPONSE']._serialized_start=783
-  _globals['_DEQUEUERESPONSE']._serialized_end=852
-  _globals['_ORDERQUEUESERVICE']._serialized_start=855
-  _globals['_ORDERQUEUESERVICE']._serialized_end=1014
+  _globals['_DEQUEUEREQUEST']._serialized_end=861
+  _globals['_DEQUEUERESPONSE']._serialized_start=863
+  _globals['_DEQUEUERESPONSE']._serialized_end=957
+  _globals['_DEQUEUEBATCHREQUEST']._serialized_start=960
+  _globals['_DEQUEUEBATCHREQUEST']._serialized_end=1098
+  _globals['_DEQUEUEBATCHRESPONSE']._serialized_start=1100
+  _globals['_DEQUEUEBATCHRESPONSE']._serialized_end=1175
+  _globals['_ACKREQUEST']._serialized_start=1177
+  _globals['_ACKREQUEST']._serialized_end=1206
+  _globals['_ACKRESPONSE']._serialized_start=1208
+  _globals['_ACKRESPONSE']._serialized_end=1238
+  _globals['_NACKREQUEST']._serialized_start=1240
+  _globals['_NACKREQUEST']._serialized_end=1270
+  _globals['_NACKRESPONSE']._serialized_start=1272
+  _globals['_NACKRESPONSE']._serialized_end=1325
+  _globals['_EXTENDLEASEREQUEST']._serialized_start=1327
+  _globals['_EXTENDLEASEREQUEST']._serialized_end=1393
+  _globals['_EXTENDLEASERESPONSE']._serialized_start=1395
+  _globals['_EXTENDLEASERESPONSE']._serialized_end=1433
+  _globals['_DEADLETTERSREQUEST']._serialized_start=1435
+  _globals['_DEADLETTERSREQUEST']._serialized_end=1455
+  _globals['_DEADLETTERSRESPONSE']._serialized_start=1457
+  _globals['_DEADLETTERSRESPONSE']._serialized_end=1514
+  _globals['_CANCELREQUEST']._serialized_start=1516
+  _globals['_CANCELREQUEST']._serialized_end=1548
+  _globals['_CANCELRESPONSE']._serialized_start=1550
+  _globals['_CANCELRESPONSE']._serialized_end=1583
+  _globals['_REPRIORITIZEREQUEST']._serialized_start=1585
+  _globals['_REPRIORITIZEREQUEST']._serialized_end=1641
+  _globals['_REPRIORITIZERESPONSE']._serialized_start=1643
+  _globals['_REPRIORITIZERESPONSE']._serialized_end=1682
+  _globals['_QUEUESTATSREQUEST']._serialized_start=1684
+  _globals['_QUEUESTATSREQUEST']._serialized_end=1738
+  _globals['_PRIORITYBUCKET']._serialized_start=1740
+  _globals['_PRIORITYBUCKET']._serialized_end=1791
+  _globals['_QUEUEDORDER']._serialized_start=1793
+  _globals['_QUEUEDORDER']._serialized_end=1903
+  _globals['_PARTITIONSTATS']._serialized_start=1905
+  _globals['_PARTITIONSTATS']._serialized_end=1971
+  _globals['_QUEUESTATSRESPONSE']._serialized_start=1974
+  _globals['_QUEUESTATSRESPONSE']._serialized_end=2209
+  _globals['_ORDERQUEUESERVICE']._serialized_start=2212
+  _globals['_ORDERQUEUESERVICE']._serialized_end=2976
 # @@protoc_insertion_point(module_scope)
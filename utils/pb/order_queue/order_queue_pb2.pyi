@@ -96,13 +96,181 @@ class EnqueueResponse(_message.Message):
     def __init__(self, success: bool = ...) -> None: ...
 
 class DequeueRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("waitMs", "visibilityTimeoutMs", "partitions", "steal")
+    WAITMS_FIELD_NUMBER: _ClassVar[int]
+    VISIBILITYTIMEOUTMS_FIELD_NUMBER: _ClassVar[int]
+    PARTITIONS_FIELD_NUMBER: _ClassVar[int]
+    STEAL_FIELD_NUMBER: _ClassVar[int]
+    waitMs: int
+    visibilityTimeoutMs: int
+    partitions: _containers.RepeatedScalarFieldContainer[int]
+    steal: bool
+    def __init__(self, waitMs: _Optional[int] = ..., visibilityTimeoutMs: _Optional[int] = ..., partitions: _Optional[_Iterable[int]] = ..., steal: bool = ...) -> None: ...
 
 class DequeueResponse(_message.Message):
-    __slots__ = ("order", "success")
+    __slots__ = ("order", "success", "deliveryAttempt")
     ORDER_FIELD_NUMBER: _ClassVar[int]
     SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    DELIVERYATTEMPT_FIELD_NUMBER: _ClassVar[int]
     order: Order
     success: bool
-    def __init__(self, order: _Optional[_Union[Order, _Mapping]] = ..., success: bool = ...) -> None: ...
+    deliveryAttempt: int
+    def __init__(self, order: _Optional[_Union[Order, _Mapping]] = ..., success: bool = ..., deliveryAttempt: _Optional[int] = ...) -> None: ...
+
+class DequeueBatchRequest(_message.Message):
+    __slots__ = ("maxOrders", "maxBytes", "waitMs", "visibilityTimeoutMs", "partitions", "steal")
+    MAXORDERS_FIELD_NUMBER: _ClassVar[int]
+    MAXBYTES_FIELD_NUMBER: _ClassVar[int]
+    WAITMS_FIELD_NUMBER: _ClassVar[int]
+    VISIBILITYTIMEOUTMS_FIELD_NUMBER: _ClassVar[int]
+    PARTITIONS_FIELD_NUMBER: _ClassVar[int]
+    STEAL_FIELD_NUMBER: _ClassVar[int]
+    maxOrders: int
+    maxBytes: int
+    waitMs: int
+    visibilityTimeoutMs: int
+    partitions: _containers.RepeatedScalarFieldContainer[int]
+    steal: bool
+    def __init__(self, maxOrders: _Optional[int] = ..., maxBytes: _Optional[int] = ..., waitMs: _Optional[int] = ..., visibilityTimeoutMs: _Optional[int] = ..., partitions: _Optional[_Iterable[int]] = ..., steal: bool = ...) -> None: ...
+
+class DequeueBatchResponse(_message.Message):
+    __slots__ = ("orders", "success")
+    ORDERS_FIELD_NUMBER: _ClassVar[int]
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    orders: _containers.RepeatedCompositeFieldContainer[Order]
+    success: bool
+    def __init__(self, orders: _Optional[_Iterable[_Union[Order, _Mapping]]] = ..., success: bool = ...) -> None: ...
+
+class AckRequest(_message.Message):
+    __slots__ = ("orderId",)
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    def __init__(self, orderId: _Optional[str] = ...) -> None: ...
+
+class AckResponse(_message.Message):
+    __slots__ = ("success",)
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    def __init__(self, success: bool = ...) -> None: ...
+
+class NackRequest(_message.Message):
+    __slots__ = ("orderId",)
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    def __init__(self, orderId: _Optional[str] = ...) -> None: ...
+
+class NackResponse(_message.Message):
+    __slots__ = ("success", "deadLettered")
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    DEADLETTERED_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    deadLettered: bool
+    def __init__(self, success: bool = ..., deadLettered: bool = ...) -> None: ...
+
+class ExtendLeaseRequest(_message.Message):
+    __slots__ = ("orderId", "visibilityTimeoutMs")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    VISIBILITYTIMEOUTMS_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    visibilityTimeoutMs: int
+    def __init__(self, orderId: _Optional[str] = ..., visibilityTimeoutMs: _Optional[int] = ...) -> None: ...
+
+class ExtendLeaseResponse(_message.Message):
+    __slots__ = ("success",)
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    def __init__(self, success: bool = ...) -> None: ...
+
+class DeadLettersRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class DeadLettersResponse(_message.Message):
+    __slots__ = ("orders",)
+    ORDERS_FIELD_NUMBER: _ClassVar[int]
+    orders: _containers.RepeatedCompositeFieldContainer[Order]
+    def __init__(self, orders: _Optional[_Iterable[_Union[Order, _Mapping]]] = ...) -> None: ...
+
+class CancelRequest(_message.Message):
+    __slots__ = ("orderId",)
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    def __init__(self, orderId: _Optional[str] = ...) -> None: ...
+
+class CancelResponse(_message.Message):
+    __slots__ = ("success",)
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    def __init__(self, success: bool = ...) -> None: ...
+
+class ReprioritizeRequest(_message.Message):
+    __slots__ = ("orderId", "priority")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    priority: float
+    def __init__(self, orderId: _Optional[str] = ..., priority: _Optional[float] = ...) -> None: ...
+
+class ReprioritizeResponse(_message.Message):
+    __slots__ = ("success",)
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    success: bool
+    def __init__(self, success: bool = ...) -> None: ...
+
+class QueueStatsRequest(_message.Message):
+    __slots__ = ("topK", "bucketWidth")
+    TOPK_FIELD_NUMBER: _ClassVar[int]
+    BUCKETWIDTH_FIELD_NUMBER: _ClassVar[int]
+    topK: int
+    bucketWidth: float
+    def __init__(self, topK: _Optional[int] = ..., bucketWidth: _Optional[float] = ...) -> None: ...
+
+class PriorityBucket(_message.Message):
+    __slots__ = ("lowerBound", "count")
+    LOWERBOUND_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    lowerBound: float
+    count: int
+    def __init__(self, lowerBound: _Optional[float] = ..., count: _Optional[int] = ...) -> None: ...
+
+class QueuedOrder(_message.Message):
+    __slots__ = ("orderId", "priority", "effectivePriority", "ageSeconds", "items")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    PRIORITY_FIELD_NUMBER: _ClassVar[int]
+    EFFECTIVEPRIORITY_FIELD_NUMBER: _ClassVar[int]
+    AGESECONDS_FIELD_NUMBER: _ClassVar[int]
+    ITEMS_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    priority: float
+    effectivePriority: float
+    ageSeconds: float
+    items: int
+    def __init__(self, orderId: _Optional[str] = ..., priority: _Optional[float] = ..., effectivePriority: _Optional[float] = ..., ageSeconds: _Optional[float] = ..., items: _Optional[int] = ...) -> None: ...
+
+class PartitionStats(_message.Message):
+    __slots__ = ("partition", "depth", "leased")
+    PARTITION_FIELD_NUMBER: _ClassVar[int]
+    DEPTH_FIELD_NUMBER: _ClassVar[int]
+    LEASED_FIELD_NUMBER: _ClassVar[int]
+    partition: int
+    depth: int
+    leased: int
+    def __init__(self, partition: _Optional[int] = ..., depth: _Optional[int] = ..., leased: _Optional[int] = ...) -> None: ...
+
+class QueueStatsResponse(_message.Message):
+    __slots__ = ("depth", "oldestAgeSeconds", "histogram", "top", "leased", "deadLettered", "partitions")
+    DEPTH_FIELD_NUMBER: _ClassVar[int]
+    OLDESTAGESECONDS_FIELD_NUMBER: _ClassVar[int]
+    HISTOGRAM_FIELD_NUMBER: _ClassVar[int]
+    TOP_FIELD_NUMBER: _ClassVar[int]
+    LEASED_FIELD_NUMBER: _ClassVar[int]
+    DEADLETTERED_FIELD_NUMBER: _ClassVar[int]
+    PARTITIONS_FIELD_NUMBER: _ClassVar[int]
+    depth: int
+    oldestAgeSeconds: float
+    histogram: _containers.RepeatedCompositeFieldContainer[PriorityBucket]
+    top: _containers.RepeatedCompositeFieldContainer[QueuedOrder]
+    leased: int
+    deadLettered: int
+    partitions: _containers.RepeatedCompositeFieldContainer[PartitionStats]
+    def __init__(self, depth: _Optional[int] = ..., oldestAgeSeconds: _Optional[float] = ..., histogram: _Optional[_Iterable[_Union[PriorityBucket, _Mapping]]] = ..., top: _Optional[_Iterable[_Union[QueuedOrder, _Mapping]]] = ..., leased: _Optional[int] = ..., deadLettered: _Optional[int] = ..., partitions: _Optional[_Iterable[_Union[PartitionStats, _Mapping]]] = ...) -> None: ...
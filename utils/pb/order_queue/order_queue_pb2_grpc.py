@@ -24,6 +24,46 @@ class OrderQueueServiceStub(object):
                 request_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DequeueRequest.SerializeToString,
                 response_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DequeueResponse.FromString,
                 )
+        self.DequeueBatch = channel.unary_unary(
+                '/order_queue.OrderQueueService/DequeueBatch',
+                request_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DequeueBatchRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DequeueBatchResponse.FromString,
+                )
+        self.Ack = channel.unary_unary(
+                '/order_queue.OrderQueueService/Ack',
+                request_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.AckRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.AckResponse.FromString,
+                )
+        self.Nack = channel.unary_unary(
+                '/order_queue.OrderQueueService/Nack',
+                request_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.NackRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.NackResponse.FromString,
+                )
+        self.ExtendLease = channel.unary_unary(
+                '/order_queue.OrderQueueService/ExtendLease',
+                request_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.ExtendLeaseRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.ExtendLeaseResponse.FromString,
+                )
+        self.GetDeadLetters = channel.unary_unary(
+                '/order_queue.OrderQueueService/GetDeadLetters',
+                request_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DeadLettersRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DeadLettersResponse.FromString,
+                )
+        self.Cancel = channel.unary_unary(
+                '/order_queue.OrderQueueService/Cancel',
+                request_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.CancelRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.CancelResponse.FromString,
+                )
+        self.Reprioritize = channel.unary_unary(
+                '/order_queue.OrderQueueService/Reprioritize',
+                request_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.ReprioritizeRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.ReprioritizeResponse.FromString,
+                )
+        self.GetQueueStats = channel.unary_unary(
+                '/order_queue.OrderQueueService/GetQueueStats',
+                request_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.QueueStatsRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.QueueStatsResponse.FromString,
+                )
 
 
 class OrderQueueServiceServicer(object):
@@ -41,6 +81,54 @@ class OrderQueueServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def DequeueBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Ack(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Nack(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ExtendLease(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetDeadLetters(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Cancel(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Reprioritize(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetQueueStats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_OrderQueueServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -54,6 +142,46 @@ def add_OrderQueueServiceServicer_to_server(servicer, server):
                     request_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DequeueRequest.FromString,
                     response_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DequeueResponse.SerializeToString,
             ),
+            'DequeueBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.DequeueBatch,
+                    request_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DequeueBatchRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DequeueBatchResponse.SerializeToString,
+            ),
+            'Ack': grpc.unary_unary_rpc_method_handler(
+                    servicer.Ack,
+                    request_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.AckRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.AckResponse.SerializeToString,
+            ),
+            'Nack': grpc.unary_unary_rpc_method_handler(
+                    servicer.Nack,
+                    request_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.NackRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.NackResponse.SerializeToString,
+            ),
+            'ExtendLease': grpc.unary_unary_rpc_method_handler(
+                    servicer.ExtendLease,
+                    request_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.ExtendLeaseRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.ExtendLeaseResponse.SerializeToString,
+            ),
+            'GetDeadLetters': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetDeadLetters,
+                    request_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DeadLettersRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DeadLettersResponse.SerializeToString,
+            ),
+            'Cancel': grpc.unary_unary_rpc_method_handler(
+                    servicer.Cancel,
+                    request_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.CancelRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.CancelResponse.SerializeToString,
+            ),
+            'Reprioritize': grpc.unary_unary_rpc_method_handler(
+                    servicer.Reprioritize,
+                    request_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.ReprioritizeRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.ReprioritizeResponse.SerializeToString,
+            ),
+            'GetQueueStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetQueueStats,
+                    request_deserializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.QueueStatsRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_order__queue_dot_order__queue__pb2.QueueStatsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'order_queue.OrderQueueService', rpc_method_handlers)
@@ -97,3 +225,139 @@ class OrderQueueService(object):
             utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DequeueResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def DequeueBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/order_queue.OrderQueueService/DequeueBatch',
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DequeueBatchRequest.SerializeToString,
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DequeueBatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Ack(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/order_queue.OrderQueueService/Ack',
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.AckRequest.SerializeToString,
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.AckResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Nack(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/order_queue.OrderQueueService/Nack',
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.NackRequest.SerializeToString,
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.NackResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ExtendLease(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/order_queue.OrderQueueService/ExtendLease',
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.ExtendLeaseRequest.SerializeToString,
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.ExtendLeaseResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetDeadLetters(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/order_queue.OrderQueueService/GetDeadLetters',
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DeadLettersRequest.SerializeToString,
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.DeadLettersResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Cancel(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/order_queue.OrderQueueService/Cancel',
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.CancelRequest.SerializeToString,
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.CancelResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Reprioritize(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/order_queue.OrderQueueService/Reprioritize',
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.ReprioritizeRequest.SerializeToString,
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.ReprioritizeResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetQueueStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/order_queue.OrderQueueService/GetQueueStats',
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.QueueStatsRequest.SerializeToString,
+            utils_dot_pb_dot_order__queue_dot_order__queue__pb2.QueueStatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
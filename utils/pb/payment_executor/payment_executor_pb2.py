@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n0utils/pb/payment_executor/payment_executor.proto\x12\x10payment_executor\"/\n\x17PaymentExecutionRequest\x12\x14\n\x0c\x63ommitStatus\x18\x01 \x01(\x08\"+\n\x18PaymentExecutionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\x13\n\x11VoteCommitRequest\"%\n\x12VoteCommitResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x32\xe5\x01\n\x16PaymentExecutorService\x12g\n\x0e\x45xecutePayment\x12).payment_executor.PaymentExecutionRequest\x1a*.payment_executor.PaymentExecutionResponse\x12\x62\n\x15SendVoteToCoordinator\x12#.payment_executor.VoteCommitRequest\x1a$.payment_executor.VoteCommitResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n0utils/pb/payment_executor/payment_executor.proto\x12\x10payment_executor\"@\n\x17PaymentExecutionRequest\x12\x14\n\x0c\x63ommitStatus\x18\x01 \x01(\x08\x12\x0f\n\x07orderId\x18\x02 \x01(\t\"+\n\x18PaymentExecutionResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"9\n\x11VoteCommitRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x13\n\x0b\x63oordinator\x18\x02 \x01(\t\"%\n\x12VoteCommitResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"9\n\x10\x42\x61tchVoteRequest\x12\x10\n\x08orderIds\x18\x01 \x03(\t\x12\x13\n\x0b\x63oordinator\x18\x02 \x01(\t\",\n\tOrderVote\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x0e\n\x06\x63ommit\x18\x02 \x01(\x08\"?\n\x11\x42\x61tchVoteResponse\x12*\n\x05votes\x18\x01 \x03(\x0b\x32\x1b.payment_executor.OrderVote\"0\n\rOrderDecision\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x0e\n\x06\x63ommit\x18\x02 \x01(\x08\"K\n\x15\x42\x61tchExecutionRequest\x12\x32\n\tdecisions\x18\x01 \x03(\x0b\x32\x1f.payment_executor.OrderDecision\"/\n\x0bOrderResult\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\"H\n\x16\x42\x61tchExecutionResponse\x12.\n\x07results\x18\x01 \x03(\x0b\x32\x1d.payment_executor.OrderResult2\xb6\x03\n\x16PaymentExecutorService\x12g\n\x0e\x45xecutePayment\x12).payment_executor.PaymentExecutionRequest\x1a*.payment_executor.PaymentExecutionResponse\x12\x62\n\x15SendVoteToCoordinator\x12#.payment_executor.VoteCommitRequest\x1a$.payment_executor.VoteCommitResponse\x12\x65\n\x1aSendBatchVoteToCoordinator\x12\".payment_executor.BatchVoteRequest\x1a#.payment_executor.BatchVoteResponse\x12h\n\x13\x45xecutePaymentBatch\x12\'.payment_executor.BatchExecutionRequest\x1a(.payment_executor.BatchExecutionResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -22,13 +22,27 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'utils.pb.payment_executor.p
 if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
   _globals['_PAYMENTEXECUTIONREQUEST']._serialized_start=70
-  _globals['_PAYMENTEXECUTIONREQUEST']._serialized_end=117
-  _globals['_PAYMENTEXECUTIONRESPONSE']._serialized_start=119
-  _globals['_PAYMENTEXECUTIONRESPONSE']._serialized_end=162
-  _globals['_VOTECOMMITREQUEST']._serialized_start=164
-  _globals['_VOTECOMMITREQUEST']._serialized_end=183
-  _globals['_VOTECOMMITRESPONSE']._serialized_start=185
-  _globals['_VOTECOMMITRESPONSE']._serialized_end=222
-  _globals['_PAYMENTEXECUTORSERVICE']._serialized_start=225
-  _globals['_PAYMENTEXECUTORSERVICE']._serialized_end=454
+  _globals['_PAYMENTEXECUTIONREQUEST']._serialized_end=134
+  _globals['_PAYMENTEXECUTIONRESPONSE']._serialized_start=136
+  _globals['_PAYMENTEXECUTIONRESPONSE']._serialized_end=179
+  _globals['_VOTECOMMITREQUEST']._serialized_start=181
+  _globals['_VOTECOMMITREQUEST']._serialized_end=238
+  _globals['_VOTECOMMITRESPONSE']._serialized_start=240
+  _globals['_VOTECOMMITRESPONSE']._serialized_end=277
+  _globals['_BATCHVOTEREQUEST']._serialized_start=279
+  _globals['_BATCHVOTEREQUEST']._serialized_end=336
+  _globals['_ORDERVOTE']._serialized_start=338
+  _globals['_ORDERVOTE']._serialized_end=382
+  _globals['_BATCHVOTERESPONSE']._serialized_start=384
+  _globals['_BATCHVOTERESPONSE']._serialized_end=447
+  _globals['_ORDERDECISION']._serialized_start=449
+  _globals['_ORDERDECISION']._serialized_end=497
+  _globals['_BATCHEXECUTIONREQUEST']._serialized_start=499
+  _globals['_BATCHEXECUTIONREQUEST']._serialized_end=574
+  _globals['_ORDERRESULT']._serialized_start=576
+  _globals['_ORDERRESULT']._serialized_end=623
+  _globals['_BATCHEXECUTIONRESPONSE']._serialized_start=625
+  _globals['_BATCHEXECUTIONRESPONSE']._serialized_end=697
+  _globals['_PAYMENTEXECUTORSERVICE']._serialized_start=700
+  _globals['_PAYMENTEXECUTORSERVICE']._serialized_end=1138
 # @@protoc_insertion_point(module_scope)
@@ -1,14 +1,17 @@
+from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Optional as _Optional
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class PaymentExecutionRequest(_message.Message):
-    __slots__ = ("commitStatus",)
+    __slots__ = ("commitStatus", "orderId")
     COMMITSTATUS_FIELD_NUMBER: _ClassVar[int]
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
     commitStatus: bool
-    def __init__(self, commitStatus: bool = ...) -> None: ...
+    orderId: str
+    def __init__(self, commitStatus: bool = ..., orderId: _Optional[str] = ...) -> None: ...
 
 class PaymentExecutionResponse(_message.Message):
     __slots__ = ("success",)
@@ -17,11 +20,65 @@ class PaymentExecutionResponse(_message.Message):
     def __init__(self, success: bool = ...) -> None: ...
 
 class VoteCommitRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("orderId", "coordinator")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    COORDINATOR_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    coordinator: str
+    def __init__(self, orderId: _Optional[str] = ..., coordinator: _Optional[str] = ...) -> None: ...
 
 class VoteCommitResponse(_message.Message):
     __slots__ = ("success",)
     SUCCESS_FIELD_NUMBER: _ClassVar[int]
     success: bool
     def __init__(self, success: bool = ...) -> None: ...
+
+class BatchVoteRequest(_message.Message):
+    __slots__ = ("orderIds", "coordinator")
+    ORDERIDS_FIELD_NUMBER: _ClassVar[int]
+    COORDINATOR_FIELD_NUMBER: _ClassVar[int]
+    orderIds: _containers.RepeatedScalarFieldContainer[str]
+    coordinator: str
+    def __init__(self, orderIds: _Optional[_Iterable[str]] = ..., coordinator: _Optional[str] = ...) -> None: ...
+
+class OrderVote(_message.Message):
+    __slots__ = ("orderId", "commit")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    COMMIT_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    commit: bool
+    def __init__(self, orderId: _Optional[str] = ..., commit: bool = ...) -> None: ...
+
+class BatchVoteResponse(_message.Message):
+    __slots__ = ("votes",)
+    VOTES_FIELD_NUMBER: _ClassVar[int]
+    votes: _containers.RepeatedCompositeFieldContainer[OrderVote]
+    def __init__(self, votes: _Optional[_Iterable[_Union[OrderVote, _Mapping]]] = ...) -> None: ...
+
+class OrderDecision(_message.Message):
+    __slots__ = ("orderId", "commit")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    COMMIT_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    commit: bool
+    def __init__(self, orderId: _Optional[str] = ..., commit: bool = ...) -> None: ...
+
+class BatchExecutionRequest(_message.Message):
+    __slots__ = ("decisions",)
+    DECISIONS_FIELD_NUMBER: _ClassVar[int]
+    decisions: _containers.RepeatedCompositeFieldContainer[OrderDecision]
+    def __init__(self, decisions: _Optional[_Iterable[_Union[OrderDecision, _Mapping]]] = ...) -> None: ...
+
+class OrderResult(_message.Message):
+    __slots__ = ("orderId", "success")
+    ORDERID_FIELD_NUMBER: _ClassVar[int]
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    orderId: str
+    success: bool
+    def __init__(self, orderId: _Optional[str] = ..., success: bool = ...) -> None: ...
+
+class BatchExecutionResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[OrderResult]
+    def __init__(self, results: _Optional[_Iterable[_Union[OrderResult, _Mapping]]] = ...) -> None: ...
@@ -24,6 +24,16 @@ class PaymentExecutorServiceStub(object):
                 request_serializer=utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.VoteCommitRequest.SerializeToString,
                 response_deserializer=utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.VoteCommitResponse.FromString,
                 )
+        self.SendBatchVoteToCoordinator = channel.unary_unary(
+                '/payment_executor.PaymentExecutorService/SendBatchVoteToCoordinator',
+                request_serializer=utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.BatchVoteRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.BatchVoteResponse.FromString,
+                )
+        self.ExecutePaymentBatch = channel.unary_unary(
+                '/payment_executor.PaymentExecutorService/ExecutePaymentBatch',
+                request_serializer=utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.BatchExecutionRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.BatchExecutionResponse.FromString,
+                )
 
 
 class PaymentExecutorServiceServicer(object):
@@ -41,6 +51,18 @@ class PaymentExecutorServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SendBatchVoteToCoordinator(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ExecutePaymentBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_PaymentExecutorServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -54,6 +76,16 @@ def add_PaymentExecutorServiceServicer_to_server(servicer, server):
                     request_deserializer=utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.VoteCommitRequest.FromString,
                     response_serializer=utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.VoteCommitResponse.SerializeToString,
             ),
+            'SendBatchVoteToCoordinator': grpc.unary_unary_rpc_method_handler(
+                    servicer.SendBatchVoteToCoordinator,
+                    request_deserializer=utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.BatchVoteRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.BatchVoteResponse.SerializeToString,
+            ),
+            'ExecutePaymentBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.ExecutePaymentBatch,
+                    request_deserializer=utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.BatchExecutionRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.BatchExecutionResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'payment_executor.PaymentExecutorService', rpc_method_handlers)
@@ -97,3 +129,37 @@ class PaymentExecutorService(object):
             utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.VoteCommitResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def SendBatchVoteToCoordinator(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/payment_executor.PaymentExecutorService/SendBatchVoteToCoordinator',
+            utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.BatchVoteRequest.SerializeToString,
+            utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.BatchVoteResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ExecutePaymentBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/payment_executor.PaymentExecutorService/ExecutePaymentBatch',
+            utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.BatchExecutionRequest.SerializeToString,
+            utils_dot_pb_dot_payment__executor_dot_payment__executor__pb2.BatchExecutionResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
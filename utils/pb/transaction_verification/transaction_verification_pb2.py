@@ -14,39 +14,39 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n@utils/pb/transaction_verification/transaction_verification.proto\x12\x18transaction_verification\"(\n\x15OrderIdStorageRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\"\x87\x02\n\"ItemAndUserdataVerificationRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12,\n\x04user\x18\x02 \x01(\x0b\x32\x1e.transaction_verification.User\x12,\n\x04item\x18\x03 \x01(\x0b\x32\x1e.transaction_verification.Item\x12\x38\n\ncreditCard\x18\x04 \x01(\x0b\x32$.transaction_verification.CreditCard\x12:\n\x0bvectorClock\x18\x05 \x01(\x0b\x32%.transaction_verification.VectorClock\"\x80\x02\n\x1b\x43\x61rdinfoVerificationRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12,\n\x04user\x18\x02 \x01(\x0b\x32\x1e.transaction_verification.User\x12,\n\x04item\x18\x03 \x01(\x0b\x32\x1e.transaction_verification.Item\x12\x38\n\ncreditCard\x18\x04 \x01(\x0b\x32$.transaction_verification.CreditCard\x12:\n\x0bvectorClock\x18\x05 \x01(\x0b\x32%.transaction_verification.VectorClock\"%\n\x04User\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontact\x18\x02 \x01(\t\"&\n\x04Item\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\"A\n\nCreditCard\x12\x0e\n\x06number\x18\x01 \x01(\t\x12\x16\n\x0e\x65xpirationDate\x18\x02 \x01(\t\x12\x0b\n\x03\x63vv\x18\x03 \x01(\t\"1\n\x0bVectorClock\x12\x0f\n\x07vcArray\x18\x01 \x03(\x05\x12\x11\n\ttimestamp\x18\x02 \x01(\x01\"\x9d\x01\n\x04\x42ook\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0e\n\x06\x63opies\x18\x05 \x01(\x05\x12\x17\n\x0f\x63opiesAvailable\x18\x06 \x01(\x05\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x0b\n\x03img\x18\x08 \x01(\t\x12\r\n\x05price\x18\t \x01(\x02\")\n\x16OrderIdStorageResponse\x12\x0f\n\x07isValid\x18\x01 \x01(\x08\"{\n#ItemAndUserdataVerificationResponse\x12\x0f\n\x07isValid\x18\x01 \x01(\x08\x12\x14\n\x0c\x65rrorMessage\x18\x02 \x01(\t\x12-\n\x05\x62ooks\x18\x03 \x03(\x0b\x32\x1e.transaction_verification.Book\"t\n\x1c\x43\x61rdinfoVerificationResponse\x12\x0f\n\x07isValid\x18\x01 \x01(\x08\x12\x14\n\x0c\x65rrorMessage\x18\x02 \x01(\t\x12-\n\x05\x62ooks\x18\x03 \x03(\x0b\x32\x1e.transaction_verification.Book2\x8c\x01\n\x15OrderIdStorageService\x12s\n\x0eStorageOrderId\x12/.transaction_verification.OrderIdStorageRequest\x1a\x30.transaction_verification.OrderIdStorageResponse2\xbb\x01\n\"ItemAndUserdataVerificationService\x12\x94\x01\n\x15VerifyItemAndUserdata\x12<.transaction_verification.ItemAndUserdataVerificationRequest\x1a=.transaction_verification.ItemAndUserdataVerificationResponse2\x9e\x01\n\x1b\x43\x61rdinfoVerificationService\x12\x7f\n\x0eVerifyCardinfo\x12\x35.transaction_verification.CardinfoVerificationRequest\x1a\x36.transaction_verification.CardinfoVerificationResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n@utils/pb/transaction_verification/transaction_verification.proto\x12\x18transaction_verification\"\x87\x02\n\"ItemAndUserdataVerificationRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12,\n\x04user\x18\x02 \x01(\x0b\x32\x1e.transaction_verification.User\x12,\n\x04item\x18\x03 \x01(\x0b\x32\x1e.transaction_verification.Item\x12\x38\n\ncreditCard\x18\x04 \x01(\x0b\x32$.transaction_verification.CreditCard\x12:\n\x0bvectorClock\x18\x05 \x01(\x0b\x32%.transaction_verification.VectorClock\"\x80\x02\n\x1b\x43\x61rdinfoVerificationRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12,\n\x04user\x18\x02 \x01(\x0b\x32\x1e.transaction_verification.User\x12,\n\x04item\x18\x03 \x01(\x0b\x32\x1e.transaction_verification.Item\x12\x38\n\ncreditCard\x18\x04 \x01(\x0b\x32$.transaction_verification.CreditCard\x12:\n\x0bvectorClock\x18\x05 \x01(\x0b\x32%.transaction_verification.VectorClock\"\x80\x02\n\x0c\x45ventRequest\x12\x0f\n\x07orderId\x18\x01 \x01(\t\x12\r\n\x05\x65vent\x18\x02 \x01(\t\x12,\n\x04user\x18\x03 \x01(\x0b\x32\x1e.transaction_verification.User\x12,\n\x04item\x18\x04 \x01(\x0b\x32\x1e.transaction_verification.Item\x12\x38\n\ncreditCard\x18\x05 \x01(\x0b\x32$.transaction_verification.CreditCard\x12:\n\x0bvectorClock\x18\x06 \x01(\x0b\x32%.transaction_verification.VectorClock\"%\n\x04User\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontact\x18\x02 \x01(\t\"&\n\x04Item\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\"A\n\nCreditCard\x12\x0e\n\x06number\x18\x01 \x01(\t\x12\x16\n\x0e\x65xpirationDate\x18\x02 \x01(\t\x12\x0b\n\x03\x63vv\x18\x03 \x01(\t\"1\n\x0bVectorClock\x12\x0f\n\x07vcArray\x18\x01 \x03(\x05\x12\x11\n\ttimestamp\x18\x02 \x01(\x01\"\x9d\x01\n\x04\x42ook\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0e\n\x06\x63opies\x18\x05 \x01(\x05\x12\x17\n\x0f\x63opiesAvailable\x18\x06 \x01(\x05\x12\x10\n\x08\x63\x61tegory\x18\x07 \x01(\t\x12\x0b\n\x03img\x18\x08 \x01(\t\x12\r\n\x05price\x18\t \x01(\x02\"{\n#ItemAndUserdataVerificationResponse\x12\x0f\n\x07isValid\x18\x01 \x01(\x08\x12\x14\n\x0c\x65rrorMessage\x18\x02 \x01(\t\x12-\n\x05\x62ooks\x18\x03 \x03(\x0b\x32\x1e.transaction_verification.Book\"t\n\x1c\x43\x61rdinfoVerificationResponse\x12\x0f\n\x07isValid\x18\x01 \x01(\x08\x12\x14\n\x0c\x65rrorMessage\x18\x02 \x01(\t\x12-\n\x05\x62ooks\x18\x03 \x03(\x0b\x32\x1e.transaction_verification.Book\"r\n\rEventResponse\x12\x0f\n\x07isValid\x18\x01 \x01(\x08\x12\x14\n\x0c\x65rrorMessage\x18\x02 \x01(\t\x12:\n\x0bvectorClock\x18\x03 \x01(\x0b\x32%.transaction_verification.VectorClock2\xbb\x01\n\"ItemAndUserdataVerificationService\x12\x94\x01\n\x15VerifyItemAndUserdata\x12<.transaction_verification.ItemAndUserdataVerificationRequest\x1a=.transaction_verification.ItemAndUserdataVerificationResponse2\x9e\x01\n\x1b\x43\x61rdinfoVerificationService\x12\x7f\n\x0eVerifyCardinfo\x12\x35.transaction_verification.CardinfoVerificationRequest\x1a\x36.transaction_verification.CardinfoVerificationResponse2k\n\x0c\x45ventService\x12[\n\x08RunEvent\x12&.transaction_verification.EventRequest\x1a\'.transaction_verification.EventResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'utils.pb.transaction_verification.transaction_verification_pb2', _globals)
 if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
-  _globals['_ORDERIDSTORAGEREQUEST']._serialized_start=94
-  _globals['_ORDERIDSTORAGEREQUEST']._serialized_end=134
-  _globals['_ITEMANDUSERDATAVERIFICATIONREQUEST']._serialized_start=137
-  _globals['_ITEMANDUSERDATAVERIFICATIONREQUEST']._serialized_end=400
-  _globals['_CARDINFOVERIFICATIONREQUEST']._serialized_start=403
-  _globals['_CARDINFOVERIFICATIONREQUEST']._serialized_end=659
-  _globals['_USER']._serialized_start=661
-  _globals['_USER']._serialized_end=698
-  _globals['_ITEM']._serialized_start=700
-  _globals['_ITEM']._serialized_end=738
-  _globals['_CREDITCARD']._serialized_start=740
-  _globals['_CREDITCARD']._serialized_end=805
-  _globals['_VECTORCLOCK']._serialized_start=807
-  _globals['_VECTORCLOCK']._serialized_end=856
-  _globals['_BOOK']._serialized_start=859
-  _globals['_BOOK']._serialized_end=1016
-  _globals['_ORDERIDSTORAGERESPONSE']._serialized_start=1018
-  _globals['_ORDERIDSTORAGERESPONSE']._serialized_end=1059
-  _globals['_ITEMANDUSERDATAVERIFICATIONRESPONSE']._serialized_start=1061
-  _globals['_ITEMANDUSERDATAVERIFICATIONRESPONSE']._serialized_end=1184
-  _globals['_CARDINFOVERIFICATIONRESPONSE']._serialized_start=1186
-  _globals['_CARDINFOVERIFICATIONRESPONSE']._serialized_end=1302
-  _globals['_ORDERIDSTORAGESERVICE']._serialized_start=1305
-  _globals['_ORDERIDSTORAGESERVICE']._serialized_end=1445
-  _globals['_ITEMANDUSERDATAVERIFICATIONSERVICE']._serialized_start=1448
-  _globals['_ITEMANDUSERDATAVERIFICATIONSERVICE']._serialized_end=1635
-  _globals['_CARDINFOVERIFICATIONSERVICE']._serialized_start=1638
-  _globals['_CARDINFOVERIFICATIONSERVICE']._serialized_end=1796
+  _globals['_ITEMANDUSERDATAVERIFICATIONREQUEST']._serialized_start=95
+  _globals['_ITEMANDUSERDATAVERIFICATIONREQUEST']._serialized_end=358
+  _globals['_CARDINFOVERIFICATIONREQUEST']._serialized_start=361
+  _globals['_CARDINFOVERIFICATIONREQUEST']._serialized_end=617
+  _globals['_EVENTREQUEST']._serialized_start=620
+  _globals['_EVENTREQUEST']._serialized_end=876
+  _globals['_USER']._serialized_start=878
+  _globals['_USER']._serialized_end=915
+  _globals['_ITEM']._serialized_start=917
+  _globals['_ITEM']._serialized_end=955
+  _globals['_CREDITCARD']._serialized_start=957
+  _globals['_CREDITCARD']._serialized_end=1022
+  _globals['_VECTORCLOCK']._serialized_start=1024
+  _globals['_VECTORCLOCK']._serialized_end=1073
+  _globals['_BOOK']._serialized_start=1076
+  _globals['_BOOK']._serialized_end=1233
+  _globals['_ITEMANDUSERDATAVERIFICATIONRESPONSE']._serialized_start=1235
+  _globals['_ITEMANDUSERDATAVERIFICATIONRESPONSE']._serialized_end=1358
+  _globals['_CARDINFOVERIFICATIONRESPONSE']._serialized_start=1360
+  _globals['_CARDINFOVERIFICATIONRESPONSE']._serialized_end=1476
+  _globals['_EVENTRESPONSE']._serialized_start=1478
+  _globals['_EVENTRESPONSE']._serialized_end=1592
+  _globals['_ITEMANDUSERDATAVERIFICATIONSERVICE']._serialized_start=1595
+  _globals['_ITEMANDUSERDATAVERIFICATIONSERVICE']._serialized_end=1782
+  _globals['_CARDINFOVERIFICATIONSERVICE']._serialized_start=1785
+  _globals['_CARDINFOVERIFICATIONSERVICE']._serialized_end=1943
+  _globals['_EVENTSERVICE']._serialized_start=1945
+  _globals['_EVENTSERVICE']._serialized_end=2052
 # @@protoc_insertion_point(module_scope)
@@ -5,7 +5,7 @@ import grpc
 from utils.pb.transaction_verification import transaction_verification_pb2 as utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2
 
 
-class OrderIdStorageServiceStub(object):
+class ItemAndUserdataVerificationServiceStub(object):
     """Missing associated documentation comment in .proto file."""
 
     def __init__(self, channel):
@@ -14,42 +14,42 @@ class OrderIdStorageServiceStub(object):
         Args:
             channel: A grpc.Channel.
         """
-        self.StorageOrderId = channel.unary_unary(
-                '/transaction_verification.OrderIdStorageService/StorageOrderId',
-                request_serializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.OrderIdStorageRequest.SerializeToString,
-                response_deserializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.OrderIdStorageResponse.FromString,
+        self.VerifyItemAndUserdata = channel.unary_unary(
+                '/transaction_verification.ItemAndUserdataVerificationService/VerifyItemAndUserdata',
+                request_serializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.ItemAndUserdataVerificationRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.ItemAndUserdataVerificationResponse.FromString,
                 )
 
 
-class OrderIdStorageServiceServicer(object):
+class ItemAndUserdataVerificationServiceServicer(object):
     """Missing associated documentation comment in .proto file."""
 
-    def StorageOrderId(self, request, context):
+    def VerifyItemAndUserdata(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
 
-def add_OrderIdStorageServiceServicer_to_server(servicer, server):
+def add_ItemAndUserdataVerificationServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
-            'StorageOrderId': grpc.unary_unary_rpc_method_handler(
-                    servicer.StorageOrderId,
-                    request_deserializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.OrderIdStorageRequest.FromString,
-                    response_serializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.OrderIdStorageResponse.SerializeToString,
+            'VerifyItemAndUserdata': grpc.unary_unary_rpc_method_handler(
+                    servicer.VerifyItemAndUserdata,
+                    request_deserializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.ItemAndUserdataVerificationRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.ItemAndUserdataVerificationResponse.SerializeToString,
             ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
-            'transaction_verification.OrderIdStorageService', rpc_method_handlers)
+            'transaction_verification.ItemAndUserdataVerificationService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
 
 
  # This class is part of an EXPERIMENTAL API.
-class OrderIdStorageService(object):
+class ItemAndUserdataVerificationService(object):
     """Missing associated documentation comment in .proto file."""
 
     @staticmethod
-    def StorageOrderId(request,
+    def VerifyItemAndUserdata(request,
             target,
             options=(),
             channel_credentials=None,
@@ -59,14 +59,14 @@ class OrderIdStorageService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/transaction_verification.OrderIdStorageService/StorageOrderId',
-            utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.OrderIdStorageRequest.SerializeToString,
-            utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.OrderIdStorageResponse.FromString,
+        return grpc.experimental.unary_unary(request, target, '/transaction_verification.ItemAndUserdataVerificationService/VerifyItemAndUserdata',
+            utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.ItemAndUserdataVerificationRequest.SerializeToString,
+            utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.ItemAndUserdataVerificationResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
 
-class ItemAndUserdataVerificationServiceStub(object):
+class CardinfoVerificationServiceStub(object):
     """Missing associated documentation comment in .proto file."""
 
     def __init__(self, channel):
@@ -75,42 +75,42 @@ class ItemAndUserdataVerificationServiceStub(object):
         Args:
             channel: A grpc.Channel.
         """
-        self.VerifyItemAndUserdata = channel.unary_unary(
-                '/transaction_verification.ItemAndUserdataVerificationService/VerifyItemAndUserdata',
-                request_serializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.ItemAndUserdataVerificationRequest.SerializeToString,
-                response_deserializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.ItemAndUserdataVerificationResponse.FromString,
+        self.VerifyCardinfo = channel.unary_unary(
+                '/transaction_verification.CardinfoVerificationService/VerifyCardinfo',
+                request_serializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.CardinfoVerificationRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.CardinfoVerificationResponse.FromString,
                 )
 
 
-class ItemAndUserdataVerificationServiceServicer(object):
+class CardinfoVerificationServiceServicer(object):
     """Missing associated documentation comment in .proto file."""
 
-    def VerifyItemAndUserdata(self, request, context):
+    def VerifyCardinfo(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
 
-def add_ItemAndUserdataVerificationServiceServicer_to_server(servicer, server):
+def add_CardinfoVerificationServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
-            'VerifyItemAndUserdata': grpc.unary_unary_rpc_method_handler(
-                    servicer.VerifyItemAndUserdata,
-                    request_deserializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.ItemAndUserdataVerificationRequest.FromString,
-                    response_serializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.ItemAndUserdataVerificationResponse.SerializeToString,
+            'VerifyCardinfo': grpc.unary_unary_rpc_method_handler(
+                    servicer.VerifyCardinfo,
+                    request_deserializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.CardinfoVerificationRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.CardinfoVerificationResponse.SerializeToString,
             ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
-            'transaction_verification.ItemAndUserdataVerificationService', rpc_method_handlers)
+            'transaction_verification.CardinfoVerificationService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
 
 
  # This class is part of an EXPERIMENTAL API.
-class ItemAndUserdataVerificationService(object):
+class CardinfoVerificationService(object):
     """Missing associated documentation comment in .proto file."""
 
     @staticmethod
-    def VerifyItemAndUserdata(request,
+    def VerifyCardinfo(request,
             target,
             options=(),
             channel_credentials=None,
@@ -120,15 +120,17 @@ class ItemAndUserdataVerificationService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/transaction_verification.ItemAndUserdataVerificationService/VerifyItemAndUserdata',
-            utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.ItemAndUserdataVerificationRequest.SerializeToString,
-            utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.ItemAndUserdataVerificationResponse.FromString,
+        return grpc.experimental.unary_unary(request, target, '/transaction_verification.CardinfoVerificationService/VerifyCardinfo',
+            utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.CardinfoVerificationRequest.SerializeToString,
+            utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.CardinfoVerificationResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
 
-class CardinfoVerificationServiceStub(object):
-    """Missing associated documentation comment in .proto file."""
+class EventServiceStub(object):
+    """Run a single event of the checkout, without calling the next service.
+    The orchestrator runs the checkout this way in the DAG mode.
+    """
 
     def __init__(self, channel):
         """Constructor.
@@ -136,42 +138,46 @@ class CardinfoVerificationServiceStub(object):
         Args:
             channel: A grpc.Channel.
         """
-        self.VerifyCardinfo = channel.unary_unary(
-                '/transaction_verification.CardinfoVerificationService/VerifyCardinfo',
-                request_serializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.CardinfoVerificationRequest.SerializeToString,
-                response_deserializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.CardinfoVerificationResponse.FromString,
+        self.RunEvent = channel.unary_unary(
+                '/transaction_verification.EventService/RunEvent',
+                request_serializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.EventRequest.SerializeToString,
+                response_deserializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.EventResponse.FromString,
                 )
 
 
-class CardinfoVerificationServiceServicer(object):
-    """Missing associated documentation comment in .proto file."""
+class EventServiceServicer(object):
+    """Run a single event of the checkout, without calling the next service.
+    The orchestrator runs the checkout this way in the DAG mode.
+    """
 
-    def VerifyCardinfo(self, request, context):
+    def RunEvent(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
 
-def add_CardinfoVerificationServiceServicer_to_server(servicer, server):
+def add_EventServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
-            'VerifyCardinfo': grpc.unary_unary_rpc_method_handler(
-                    servicer.VerifyCardinfo,
-                    request_deserializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.CardinfoVerificationRequest.FromString,
-                    response_serializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.CardinfoVerificationResponse.SerializeToString,
+            'RunEvent': grpc.unary_unary_rpc_method_handler(
+                    servicer.RunEvent,
+                    request_deserializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.EventRequest.FromString,
+                    response_serializer=utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.EventResponse.SerializeToString,
             ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
-            'transaction_verification.CardinfoVerificationService', rpc_method_handlers)
+            'transaction_verification.EventService', rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
 
 
  # This class is part of an EXPERIMENTAL API.
-class CardinfoVerificationService(object):
-    """Missing associated documentation comment in .proto file."""
+class EventService(object):
+    """Run a single event of the checkout, without calling the next service.
+    The orchestrator runs the checkout this way in the DAG mode.
+    """
 
     @staticmethod
-    def VerifyCardinfo(request,
+    def RunEvent(request,
             target,
             options=(),
             channel_credentials=None,
@@ -181,8 +187,8 @@ class CardinfoVerificationService(object):
             wait_for_ready=None,
             timeout=None,
             metadata=None):
-        return grpc.experimental.unary_unary(request, target, '/transaction_verification.CardinfoVerificationService/VerifyCardinfo',
-            utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.CardinfoVerificationRequest.SerializeToString,
-            utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.CardinfoVerificationResponse.FromString,
+        return grpc.experimental.unary_unary(request, target, '/transaction_verification.EventService/RunEvent',
+            utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.EventRequest.SerializeToString,
+            utils_dot_pb_dot_transaction__verification_dot_transaction__verification__pb2.EventResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -0,0 +1,204 @@
+import time
+import asyncio
+from array import array
+from concurrent import futures
+
+from shared.vector_clock import VectorClock
+
+# Server indexes of the vector clock.
+FRONTEND = 0
+ORCHESTRATOR = 1
+TRANSACTION_VERIFICATION = 2
+FRAUD_DETECTION = 3
+BOOK_SUGGESTION = 4
+NUM_SERVERS = 5
+
+
+class CausalGraph:
+    """
+    Dependency graph of the events of a flow. Each event runs on one server of the vector clock
+    and lists the events that must happen before it. Events without a path between them may run
+    in any order, or concurrently.
+
+    An event is ready when
+    - the incoming vector clock has counted, for every server, at least the events of that server
+      the event transitively depends on, and
+    - the events it depends on that run on the same server are already completed locally.
+    """
+
+    def __init__(self, events, num_servers=NUM_SERVERS):
+        # events: {name: (server index, [names of the events that must happen before it])}
+        self.events = events
+        self.num_servers = num_servers
+        self._dependencies = {}
+        self._required_clocks = {}
+        for name in events:
+            self._required_clocks[name] = self._required_clock(name)
+
+    def server_index(self, name):
+        return self.events[name][0]
+
+    def direct_dependencies(self, name):
+        return self.events[name][1]
+
+    def server_events(self, server_index):
+        return frozenset(name for name, (index, _) in self.events.items() if index == server_index)
+
+    def dependencies(self, name, _visiting=()):
+        # All the events that must happen before `name`, directly or transitively.
+        if name in self._dependencies:
+            return self._dependencies[name]
+        if name in _visiting:
+            raise ValueError(f"The event graph has a cycle through '{name}'.")
+        dependencies = set()
+        for dependency in self.direct_dependencies(name):
+            if dependency not in self.events:
+                raise KeyError(f"Event '{name}' depends on the unknown event '{dependency}'.")
+            dependencies.add(dependency)
+            dependencies |= self.dependencies(dependency, _visiting + (name,))
+        self._dependencies[name] = frozenset(dependencies)
+        return self._dependencies[name]
+
+    def _required_clock(self, name):
+        required = array('i', [0]) * self.num_servers
+        for dependency in self.dependencies(name):
+            required[self.server_index(dependency)] += 1
+        return required
+
+    def required_clock(self, name):
+        return self._required_clocks[name]
+
+    def is_ready(self, name, vector_clock, completed_events=()):
+        required = self._required_clocks[name]
+        for index, value in enumerate(required):
+            if (vector_clock[index] if index < len(vector_clock) else 0) < value:
+                return False
+        server_index = self.server_index(name)
+        return all(dependency in completed_events for dependency in self.dependencies(name)
+                   if self.server_index(dependency) == server_index)
+
+    def run(self, run_event, vector_clock, executor, completed_events=()):
+        """
+        Run every event of the graph on `executor` as soon as the events it depends on are completed,
+        so independent events run in parallel. `completed_events` already happened at `vector_clock`.
+        `run_event(name, vector_clock)` returns (the vector clock after the event, its result),
+        or raises EventRejected, which stops the run.
+        """
+        graph_run = GraphRun(self, vector_clock, completed_events)
+        pending = {}
+        while True:
+            for name in graph_run.ready_events():
+                pending[executor.submit(run_event, name, graph_run.start(name))] = name
+            if not pending:
+                return graph_run
+            done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    graph_run.complete(name, *future.result())
+                except EventRejected as rejected:
+                    graph_run.reject(name, str(rejected))
+                    for other in pending:
+                        other.cancel()
+                    return graph_run
+
+    async def run_async(self, run_event, vector_clock, completed_events=()):
+        # The same as run(), with a coroutine `run_event` per event.
+        graph_run = GraphRun(self, vector_clock, completed_events)
+        pending = {}
+        while True:
+            for name in graph_run.ready_events():
+                pending[asyncio.ensure_future(run_event(name, graph_run.start(name)))] = name
+            if not pending:
+                return graph_run
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = pending.pop(task)
+                try:
+                    graph_run.complete(name, *task.result())
+                except EventRejected as rejected:
+                    graph_run.reject(name, str(rejected))
+                    for other in pending:
+                        other.cancel()
+                    return graph_run
+
+
+class EventRejected(Exception):
+    pass
+
+
+class GraphRun:
+    """
+    The progress of one run of a CausalGraph: the vector clock and the result of each completed event,
+    when each event started and finished, and the event that was rejected, if any.
+    """
+
+    def __init__(self, graph, vector_clock, completed_events=(), clock=time.perf_counter):
+        self.graph = graph
+        self.clock = clock
+        self.start_time = clock()
+        self.vector_clocks = {name: vector_clock for name in completed_events}
+        self.results = {}
+        self.started = {name: self.start_time for name in completed_events}
+        self.finished = dict(self.started)
+        self.rejected_event = None
+        self.error_message = None
+
+    @property
+    def is_valid(self):
+        return self.rejected_event is None
+
+    def ready_events(self):
+        return [name for name in self.graph.events if name not in self.started
+                and all(dependency in self.finished for dependency in self.graph.direct_dependencies(name))]
+
+    def start(self, name):
+        # The vector clock an event starts from is the merge of the clocks of the events it depends on.
+        self.started[name] = self.clock()
+        vector_clock = VectorClock(timestamp=0.0)
+        for dependency in self.graph.direct_dependencies(name):
+            vector_clock.merge(self.vector_clocks[dependency])
+        return vector_clock
+
+    def complete(self, name, vector_clock, result=None):
+        self.finished[name] = self.clock()
+        self.vector_clocks[name] = vector_clock
+        self.results[name] = result
+
+    def reject(self, name, error_message):
+        self.finished[name] = self.clock()
+        self.rejected_event = name
+        self.error_message = error_message
+
+    def critical_path(self):
+        """
+        Returns (events, latency in seconds) of the chain of events that finished last:
+        from the last finished event, follow the dependency that finished last back to the start.
+        """
+        if not self.finished:
+            return [], 0.0
+        name = max(self.finished, key=self.finished.get)
+        latency = self.finished[name] - self.start_time
+        path = [name]
+        while self.graph.direct_dependencies(name):
+            name = max(self.graph.direct_dependencies(name), key=lambda dependency: self.finished.get(dependency, 0.0))
+            path.append(name)
+        return path[::-1], latency
+
+
+# The events of a checkout. Declare a new verification step, or change the order of the steps, only here.
+CHECKOUT_GRAPH = CausalGraph({
+    "checkout": (ORCHESTRATOR, []),
+    # a: order items are not empty
+    "a": (TRANSACTION_VERIFICATION, ["checkout"]),
+    # b: user data is filled
+    "b": (TRANSACTION_VERIFICATION, ["checkout"]),
+    # c: card info has a correct format
+    "c": (TRANSACTION_VERIFICATION, ["checkout"]),
+    # d: user data is not fraudulent
+    "d": (FRAUD_DETECTION, ["b"]),
+    # e: card info is not fraudulent
+    "e": (FRAUD_DETECTION, ["c"]),
+    # f: suggest books once the order is verified
+    "f": (BOOK_SUGGESTION, ["a", "d", "e"]),
+})
@@ -0,0 +1,148 @@
+import os
+import threading
+
+import grpc
+
+# Keepalive and reconnect settings shared by every outbound channel.
+# They can be tuned per container through environment variables.
+KEEPALIVE_TIME_MS = int(os.getenv('GRPC_KEEPALIVE_TIME_MS', '30000'))
+KEEPALIVE_TIMEOUT_MS = int(os.getenv('GRPC_KEEPALIVE_TIMEOUT_MS', '10000'))
+MAX_RECONNECT_BACKOFF_MS = int(os.getenv('GRPC_MAX_RECONNECT_BACKOFF_MS', '5000'))
+# Connections opened to each target, used in turn by the calls. A service running GRPC_SERVER_PROCESSES
+# processes on one port serves each connection in one process, so its clients need as many connections.
+CHANNELS_PER_TARGET = max(1, int(os.getenv('GRPC_CHANNELS_PER_TARGET', '1')))
+
+DEFAULT_CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', KEEPALIVE_TIME_MS),
+    ('grpc.keepalive_timeout_ms', KEEPALIVE_TIMEOUT_MS),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.initial_reconnect_backoff_ms', 100),
+    ('grpc.max_reconnect_backoff_ms', MAX_RECONNECT_BACKOFF_MS),
+]
+
+
+class ChannelPool:
+    """
+    Keeps `channels_per_target` long-lived channels per target and one stub per (target, stub class, channel).
+    Each lookup returns the next channel of the target in turn, or a stub on it.
+    Channels connect lazily on the first RPC and gRPC reconnects them in the background
+    after a failure, so callers can keep the same stub for the lifetime of the process.
+    """
+
+    def __init__(self, options=None, channels_per_target=CHANNELS_PER_TARGET):
+        self.options = DEFAULT_CHANNEL_OPTIONS if options is None else options
+        self.channels_per_target = channels_per_target
+        self._lock = threading.Lock()
+        # target: [channel, ...]
+        self._channels = {}
+        # target: number of lookups, which picks the next channel.
+        self._lookups = {}
+        self._stubs = {}
+        self.channels_created = 0
+        self.channels_reused = 0
+        # Calls served by a cached stub, which don't look up the channel.
+        self.stubs_reused = 0
+
+    def get_channel(self, target):
+        with self._lock:
+            return self._get_channel_locked(target)
+
+    def _next_index(self, target):
+        lookups = self._lookups.get(target, 0)
+        self._lookups[target] = lookups + 1
+        return lookups % self.channels_per_target
+
+    def _get_channel_locked(self, target, index=None):
+        channels = self._channels.get(target)
+        if channels is None:
+            channels = [self._create_channel(target, self._channel_options(i)) for i in range(self.channels_per_target)]
+            self._channels[target] = channels
+            self.channels_created += len(channels)
+        else:
+            self.channels_reused += 1
+        return channels[self._next_index(target) if index is None else index]
+
+    def _channel_options(self, index):
+        if self.channels_per_target == 1:
+            return self.options
+        # Channels with the same arguments share one connection. The index and a local subchannel pool
+        # give each channel its own.
+        return self.options + [('grpc.use_local_subchannel_pool', 1), ('shared.channel_index', index)]
+
+    def _create_channel(self, target, options):
+        return grpc.insecure_channel(target, options=options)
+
+    def get_stub(self, target, stub_class):
+        with self._lock:
+            index = self._next_index(target)
+            key = (target, stub_class, index)
+            stub = self._stubs.get(key)
+            if stub is None:
+                stub = stub_class(self._get_channel_locked(target, index))
+                self._stubs[key] = stub
+            else:
+                self.stubs_reused += 1
+            return stub
+
+    def _pop_channels(self, target):
+        with self._lock:
+            for key in [key for key in self._stubs if key[0] == target]:
+                del self._stubs[key]
+            return self._channels.pop(target, [])
+
+    def _pop_all_channels(self):
+        with self._lock:
+            channels = [channel for target_channels in self._channels.values() for channel in target_channels]
+            self._channels.clear()
+            self._stubs.clear()
+            return channels
+
+    def invalidate(self, target):
+        # Drop the channels of a target so that the next call opens fresh ones.
+        for channel in self._pop_channels(target):
+            channel.close()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "targets": len(self._channels),
+                "channelsCreated": self.channels_created,
+                "channelsReused": self.channels_reused,
+                "stubsReused": self.stubs_reused,
+            }
+
+    def close(self):
+        for channel in self._pop_all_channels():
+            channel.close()
+
+
+class AioChannelPool(ChannelPool):
+    """
+    The same pool for grpc.aio clients. The channels belong to the event loop that is
+    running when they are created, so create one pool per loop and close it with `await`.
+    """
+
+    def _create_channel(self, target, options):
+        return grpc.aio.insecure_channel(target, options=options)
+
+    async def invalidate(self, target):
+        for channel in self._pop_channels(target):
+            await channel.close()
+
+    async def close(self):
+        for channel in self._pop_all_channels():
+            await channel.close()
+
+
+# The process-wide pool used by every service.
+default_pool = ChannelPool()
+
+def get_channel(target):
+    return default_pool.get_channel(target)
+
+def get_stub(target, stub_class):
+    return default_pool.get_stub(target, stub_class)
+
+def channel_stats():
+    return default_pool.stats()
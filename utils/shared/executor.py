@@ -0,0 +1,68 @@
+import os
+import threading
+from concurrent import futures
+
+# Number of threads of the process-wide executor, GRPC_SERVER_WORKERS if not set.
+# 0 keeps the default of ThreadPoolExecutor, min(32, number of CPUs + 4).
+MAX_WORKERS = int(os.getenv('SHARED_EXECUTOR_WORKERS', os.getenv('GRPC_SERVER_WORKERS', '0'))) or None
+
+
+class InstrumentedExecutor(futures.ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor that counts the tasks waiting for a worker and the workers running a task.
+    Threads are started on demand and kept for the lifetime of the process, so a task submitted
+    to it doesn't pay for starting and joining a thread.
+    """
+
+    def __init__(self, max_workers=None, thread_name_prefix=''):
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._stats_lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self._stats_lock:
+            self.queued += 1
+        future = super().submit(self._run, fn, *args, **kwargs)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _run(self, fn, *args, **kwargs):
+        with self._stats_lock:
+            self.queued -= 1
+            self.active += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._stats_lock:
+                self.active -= 1
+                self.completed += 1
+
+    def _on_done(self, future):
+        # A task cancelled before a worker took it never runs _run.
+        if future.cancelled():
+            with self._stats_lock:
+                self.queued -= 1
+
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                "workers": self._max_workers,
+                "queueDepth": self.queued,
+                "activeWorkers": self.active,
+                "utilization": self.active / self._max_workers,
+                "completed": self.completed,
+            }
+
+
+# The process-wide executor of a service, e.g. `grpc.server(default_executor)`.
+# Its queue depth is the number of RPCs waiting for a thread.
+default_executor = InstrumentedExecutor(MAX_WORKERS, thread_name_prefix='shared')
+
+def executor_stats():
+    return default_executor.stats()
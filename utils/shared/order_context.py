@@ -0,0 +1,35 @@
+import time
+
+from shared.causal_order import CHECKOUT_GRAPH
+
+# The orchestrator stamps the order id of a checkout on the gRPC call metadata,
+# and every service forwards it on its downstream calls of the same order.
+# A service accepts a request only if the order id of the message matches the stamped one,
+# so there is no need to register the order id on each service before the checkout starts.
+# The vector clock stays in the VectorClock field of each message: every event advances it,
+# so it belongs to the request of the event, while the order id is the same for the whole checkout.
+ORDER_ID_METADATA_KEY = 'x-order-id'
+
+
+def order_metadata(order_id):
+    return ((ORDER_ID_METADATA_KEY, order_id),)
+
+def order_id_from_context(context):
+    for key, value in context.invocation_metadata():
+        if key == ORDER_ID_METADATA_KEY:
+            return value
+    return None
+
+def get_order_state(order_states, order_id, context, new_order_state):
+    # The state of the order in `order_states` (an OrderStateTable), or None if the order id stamped on the call
+    # metadata doesn't match the one of the message.
+    # The state is created with new_order_state() on the first request of the order that reaches the service.
+    if order_id_from_context(context) != order_id:
+        return None
+    return order_states.get_or_create(order_id, new_order_state)
+
+def check_vc_before(event, vector_clock, order_state):
+    # Whether the event of the checkout may run at the vector clock, given the events completed in the order state.
+    causal_check = CHECKOUT_GRAPH.is_ready(event, vector_clock, order_state["completedEvents"])
+    timestamp_check = bool(vector_clock.timestamp < time.time())
+    return causal_check and timestamp_check
@@ -0,0 +1,100 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Bounds of the per-order state kept by each service.
+# They can be tuned per container through environment variables.
+MAX_ORDERS = int(os.getenv('ORDER_STATE_MAX_ORDERS', '10000'))
+TTL_SECONDS = float(os.getenv('ORDER_STATE_TTL_SECONDS', '300'))
+
+
+class OrderStateTable:
+    """
+    Thread-safe table of per-order state keyed by order id.
+    Entries expire when they have not been touched for `ttl_seconds`, and the least
+    recently used entry is evicted when more than `max_orders` orders are in flight.
+    """
+
+    def __init__(self, max_orders=MAX_ORDERS, ttl_seconds=TTL_SECONDS, clock=time.monotonic):
+        self.max_orders = max_orders
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        # order id -> (expires at, state), ordered from the least to the most recently used.
+        self._states = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expire_locked(self, now):
+        # The entries are in LRU order, so the expired ones are all at the front.
+        while self._states:
+            order_id, (expires_at, _) = next(iter(self._states.items()))
+            if expires_at > now:
+                break
+            del self._states[order_id]
+            self.expirations += 1
+
+    def _store_locked(self, order_id, state, now):
+        self._states[order_id] = (now + self.ttl_seconds, state)
+        self._states.move_to_end(order_id)
+        while len(self._states) > self.max_orders:
+            self._states.popitem(last=False)
+            self.evictions += 1
+
+    def put(self, order_id, state=None):
+        state = {} if state is None else state
+        with self._lock:
+            now = self.clock()
+            self._expire_locked(now)
+            self._store_locked(order_id, state, now)
+        return state
+
+    def get(self, order_id):
+        with self._lock:
+            now = self.clock()
+            self._expire_locked(now)
+            entry = self._states.get(order_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            # Touching an order keeps it alive for another TTL.
+            self._store_locked(order_id, entry[1], now)
+            return entry[1]
+
+    def get_or_create(self, order_id, factory=dict):
+        # Services create the state of an order lazily, on the first request that reaches them.
+        with self._lock:
+            now = self.clock()
+            self._expire_locked(now)
+            entry = self._states.get(order_id)
+            if entry is None:
+                self.misses += 1
+                state = factory()
+            else:
+                self.hits += 1
+                state = entry[1]
+            self._store_locked(order_id, state, now)
+            return state
+
+    def pop(self, order_id):
+        with self._lock:
+            entry = self._states.pop(order_id, None)
+        return None if entry is None else entry[1]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._states)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "orders": len(self._states),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -0,0 +1,64 @@
+import os
+import multiprocessing
+from concurrent import futures
+
+import grpc
+
+# Concurrency and message limits of the gRPC server of every service.
+# They can be tuned per container through environment variables. 0 keeps the gRPC default.
+SERVER_WORKERS = int(os.getenv('GRPC_SERVER_WORKERS', '0')) or None
+MAXIMUM_CONCURRENT_RPCS = int(os.getenv('GRPC_MAXIMUM_CONCURRENT_RPCS', '0')) or None
+MAX_RECEIVE_MESSAGE_LENGTH = int(os.getenv('GRPC_MAX_RECEIVE_MESSAGE_LENGTH', '0'))
+MAX_SEND_MESSAGE_LENGTH = int(os.getenv('GRPC_MAX_SEND_MESSAGE_LENGTH', '0'))
+# Number of server processes sharing the port with SO_REUSEPORT.
+# Only services without state shared between requests of different connections should use more than one.
+SERVER_PROCESSES = int(os.getenv('GRPC_SERVER_PROCESSES', '1'))
+# The checkout mode of the orchestrator (relay or dag), which the services running more than one process
+# must be given too. Empty when it isn't set.
+CHECKOUT_MODE = os.getenv('CHECKOUT_MODE', '')
+
+
+def server_options(processes=SERVER_PROCESSES):
+    options = []
+    if MAX_RECEIVE_MESSAGE_LENGTH:
+        options.append(('grpc.max_receive_message_length', MAX_RECEIVE_MESSAGE_LENGTH))
+    if MAX_SEND_MESSAGE_LENGTH:
+        options.append(('grpc.max_send_message_length', MAX_SEND_MESSAGE_LENGTH))
+    if processes > 1:
+        options.append(('grpc.so_reuseport', 1))
+    return options
+
+def create_server(executor=None, default_workers=None):
+    """
+    Create the gRPC server of a service with the settings above.
+    `executor` serves the RPCs, e.g. shared.executor.default_executor. Without it, a ThreadPoolExecutor
+    with GRPC_SERVER_WORKERS threads is used, or `default_workers` if the variable isn't set.
+    """
+    if executor is None:
+        executor = futures.ThreadPoolExecutor(max_workers=SERVER_WORKERS or default_workers)
+    return grpc.server(executor, options=server_options(), maximum_concurrent_rpcs=MAXIMUM_CONCURRENT_RPCS)
+
+def serve_processes(serve, processes=SERVER_PROCESSES, checkout_mode=CHECKOUT_MODE):
+    """
+    Run `serve` in `processes` processes listening on the same port, so a CPU-bound service can use
+    every core instead of one core behind the GIL. The kernel spreads the connections between the
+    processes, so the RPCs of one client channel always reach the same process: the clients spread their
+    calls only if they open several channels to the service (GRPC_CHANNELS_PER_TARGET).
+    No gRPC server, channel or telemetry export thread may exist before the processes are forked.
+
+    Only the relay checkout keeps the state of an order in one process: each service receives the events
+    of an order that depend on each other in one RPC. The dag checkout sends them in separate RPCs, which
+    may reach different processes, so more than one process is refused unless CHECKOUT_MODE is relay.
+    """
+    if processes > 1 and checkout_mode != 'relay':
+        raise ValueError(f"GRPC_SERVER_PROCESSES={processes} needs CHECKOUT_MODE=relay, got {checkout_mode!r}: "
+                         f"the per-order state of the checkout would be split between the processes.")
+    if processes <= 1:
+        serve()
+        return
+    workers = [multiprocessing.Process(target=serve) for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    print(f"Started {processes} server processes.")
+    for worker in workers:
+        worker.join()
@@ -0,0 +1,95 @@
+import time
+from array import array
+
+
+class VectorClock:
+    """
+    Vector clock of the checkout services, stored as a compact array of ints.
+    Frontend: 0, Orchestrator: 1, TransactionVerification: 2, FraudDetection: 3, BookSuggestion: 4
+
+    It converts directly from and to the VectorClock message of any of the services' protos,
+    since they all have the same `vcArray` and `timestamp` fields.
+    """
+
+    __slots__ = ('clock', 'timestamp')
+
+    def __init__(self, values=0, timestamp=None):
+        # `values` is either the number of servers, or the values of the clock.
+        self.clock = array('i', [0]) * values if isinstance(values, int) else array('i', values)
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    @classmethod
+    def from_proto(cls, message):
+        return cls(message.vcArray, message.timestamp)
+
+    def to_proto(self, message_class):
+        return message_class(vcArray=self.clock, timestamp=self.timestamp)
+
+    def copy_to(self, message):
+        # Overwrite a VectorClock message field in place, e.g. `vector_clock.copy_to(request.vectorClock)`.
+        message.vcArray[:] = self.clock
+        message.timestamp = self.timestamp
+
+    def copy(self):
+        return VectorClock(self.clock, self.timestamp)
+
+    def _pad(self, size):
+        if len(self.clock) < size:
+            self.clock.extend(array('i', [0]) * (size - len(self.clock)))
+
+    # Increment the value in the server index, and update the timestamp.
+    # If the index isn't in the clock, append 0 until the index.
+    def increment(self, index):
+        self._pad(index + 1)
+        self.clock[index] += 1
+        self.timestamp = time.time()
+        return self
+
+    # Take the element-wise maximum with another clock, e.g. when a message is received.
+    def merge(self, other):
+        self._pad(len(other.clock))
+        for index, value in enumerate(other.clock):
+            if value > self.clock[index]:
+                self.clock[index] = value
+        self.timestamp = max(self.timestamp, other.timestamp)
+        return self
+
+    def _compare(self, other):
+        # Returns (self <= other element-wise, other <= self element-wise).
+        size = max(len(self.clock), len(other.clock))
+        less_equal = greater_equal = True
+        for index in range(size):
+            a = self.clock[index] if index < len(self.clock) else 0
+            b = other.clock[index] if index < len(other.clock) else 0
+            if a < b:
+                greater_equal = False
+            elif a > b:
+                less_equal = False
+        return less_equal, greater_equal
+
+    def happens_before(self, other):
+        less_equal, greater_equal = self._compare(other)
+        return less_equal and not greater_equal
+
+    def concurrent_with(self, other):
+        less_equal, greater_equal = self._compare(other)
+        return not less_equal and not greater_equal
+
+    def __eq__(self, other):
+        if isinstance(other, VectorClock):
+            return self._compare(other) == (True, True)
+        if isinstance(other, (list, tuple, array)):
+            return self._compare(VectorClock(other)) == (True, True)
+        return NotImplemented
+
+    def __len__(self):
+        return len(self.clock)
+
+    def __getitem__(self, index):
+        return self.clock[index]
+
+    def __iter__(self):
+        return iter(self.clock)
+
+    def __repr__(self):
+        return f"VectorClock({list(self.clock)}, timestamp={self.timestamp})"